@@ -6,7 +6,6 @@ from __future__ import absolute_import, division, print_function
 from copy import deepcopy
 
 import numpy as np
-import matplotlib.pyplot as plt
 import matplotlib.cm as mplcm
 
 from sunpy.cm import color_tables as ct
@@ -179,6 +178,7 @@ def show_colormaps(search=None):
     ----------
 
     """
+    import matplotlib.pyplot as plt
 
     if search is not None:
         maps = sorted({k: v for (k, v) in cmlist.items() if k.lower().count(search.lower())})
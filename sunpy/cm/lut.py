@@ -0,0 +1,331 @@
+"""
+This module provides precomputed lookup tables for fast colormapping of
+solar data.
+"""
+from __future__ import absolute_import, division, print_function
+
+import threading
+from collections import OrderedDict
+from copy import deepcopy
+
+import numpy as np
+import matplotlib.cm as mplcm
+import matplotlib.colors as colors
+
+__all__ = ['ColormapLUT', 'apply_colormap']
+
+# The number of recently used lookup tables kept by apply_colormap, with the
+# colormap of each, which keeps the id of the colormap in the key in use. The
+# lock guards the cache, which is used from the threads of FrameBuffer.
+_CACHE_SIZE = 32
+_lut_cache = OrderedDict()
+_lut_cache_lock = threading.Lock()
+
+
+class ColormapLUT(object):
+    """
+    A precomputed lookup table which applies a normalization and a colormap
+    to data with a single integer indexing operation.
+
+    For 8 and 16 bit integer data the table holds the color of every possible
+    value of the data type, so the data is used as the index directly and the
+    result is identical to applying the norm and the colormap. For all other
+    data the table samples the norm in ``size`` steps, evenly spaced in the
+    scale in which the norm is applied (linear, logarithmic or inverse
+    hyperbolic sine), and the data is converted to an index in chunks.
+
+    Parameters
+    ----------
+    cmap : `matplotlib.colors.Colormap` or `str`
+        The colormap.
+
+    norm : `matplotlib.colors.Normalize`
+        The normalization, which must have its ``vmin`` and ``vmax`` set.
+        `~matplotlib.colors.LogNorm` and `~astropy.visualization.ImageNormalize`
+        with a `~astropy.visualization.LogStretch` or
+        `~astropy.visualization.AsinhStretch` are sampled in their own scale,
+        all other norms are sampled linearly.
+
+    size : `int`, optional
+        The number of samples of the norm for non-integer data. Defaults to
+        65536.
+
+    alpha : `bool`, optional
+        If `True`, the default, produce RGBA values, otherwise RGB values.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> import matplotlib.colors as colors
+    >>> import sunpy.cm
+    >>> lut = sunpy.cm.ColormapLUT('sdoaia171', colors.Normalize(vmin=0, vmax=1000))
+    >>> lut(np.arange(12).reshape(3, 4)).shape
+    (3, 4, 4)
+    """
+
+    def __init__(self, cmap, norm, size=2**16, alpha=True):
+        if norm.vmin is None or norm.vmax is None:
+            raise ValueError("The norm must have vmin and vmax set.")
+        self.cmap = mplcm.get_cmap(cmap)
+        self.norm = norm
+        self.size = int(size)
+        self.channels = 4 if alpha else 3
+        self._integer_tables = {}
+        self._float_table = None
+
+    def __call__(self, data, out=None, chunk_size=2**16):
+        """
+        Apply the lookup table to data.
+
+        Parameters
+        ----------
+        data : `numpy.ndarray`
+            The data to colormap. Masked values are given the color of masked
+            values under the norm.
+
+        out : `numpy.ndarray`, optional
+            A `numpy.uint8` array of shape ``data.shape + (channels,)`` to
+            write the colors to.
+
+        chunk_size : `int`, optional
+            The number of values converted to indices at once, which bounds
+            the size of the temporary arrays for non-integer data.
+
+        Returns
+        -------
+        `numpy.ndarray`
+            The `numpy.uint8` colors of the data.
+        """
+        mask = np.ma.getmask(data)
+        data = np.ma.getdata(data)
+        if out is None:
+            out = np.empty(data.shape + (self.channels,), dtype=np.uint8)
+        elif out.shape != data.shape + (self.channels,) or out.dtype != np.uint8:
+            raise ValueError("out must be a uint8 array of shape {0}".format(
+                data.shape + (self.channels,)))
+
+        if data.dtype.kind in 'ui' and data.dtype.itemsize <= 2:
+            table, masked_color = self._integer_table(np.dtype(data.dtype.str[1:]))
+            # The unsigned view of the data, in its own byte order, indexes the table
+            index = data.view(data.dtype.str.replace('i', 'u'))
+            _take(table, index, out)
+            if mask is not np.ma.nomask:
+                out[mask] = masked_color
+            return out
+
+        if not out.flags.c_contiguous:
+            raise ValueError("out must be C contiguous.")
+        table = self._get_float_table()
+        flat_data = data.reshape(-1)
+        flat_out = out.reshape(-1, self.channels)
+        flat_mask = None if mask is np.ma.nomask else np.broadcast_to(mask, data.shape).reshape(-1)
+        # Single precision is enough to index the samples unless the data is double
+        scratch_dtype = np.float64 if data.dtype == np.float64 else np.float32
+        scratch = np.empty(min(chunk_size, flat_data.size), dtype=scratch_dtype)
+        for start in range(0, flat_data.size, chunk_size):
+            chunk = slice(start, start + chunk_size)
+            index = self._float_index(flat_data[chunk], scratch[:flat_data[chunk].size],
+                                      None if flat_mask is None else flat_mask[chunk])
+            _take(table, index, flat_out[chunk])
+        return out
+
+    def _colors(self, values):
+        """The colors of values under the norm."""
+        return self.cmap(self.norm(values), bytes=True)[..., :self.channels]
+
+    def _integer_table(self, dtype):
+        """
+        The colors of every value of an integer data type, indexed by the
+        unsigned view of the values, and the color of masked values.
+        """
+        if dtype not in self._integer_tables:
+            n_values = 2 ** (8 * dtype.itemsize)
+            values = np.arange(n_values, dtype='u{0}'.format(dtype.itemsize)).view(dtype)
+            masked_color = self._colors(np.ma.masked_array([0.], mask=[True]))[0]
+            self._integer_tables[dtype] = (self._colors(values.astype(float)), masked_color)
+        return self._integer_tables[dtype]
+
+    def _get_float_table(self):
+        """
+        The colors of the samples of the norm, laid out as the color below
+        the range, the ``size`` samples, the color above the range and the
+        colors of masked, NaN and out-of-domain values.
+        """
+        if self._float_table is not None:
+            return self._float_table
+
+        function, inverse, offset, factor = _norm_scale(self.norm)
+        self._function, self._offset, self._factor = function, offset, factor
+        vmin, vmax = float(self.norm.vmin), float(self.norm.vmax)
+        self._start = _forward(np.array([vmin]), function, offset, factor)[0]
+        stop = _forward(np.array([vmax]), function, offset, factor)[0]
+        step = (stop - self._start) / self.size
+        self._scale = 1. / step if step > 0 else 0.
+
+        # The centres of the samples, and two values just outside the range
+        samples = self._start + step * (np.arange(-1, self.size + 1) + 0.5)
+        if step == 0:
+            samples[0], samples[-1] = self._start - 1, self._start + 1
+        values = (samples if inverse is None else inverse(samples)) / factor - offset
+
+        special = np.ma.masked_array([0., np.nan, -offset - abs(offset) - 1],
+                                     mask=[True, False, False])
+        with np.errstate(invalid='ignore', divide='ignore'):
+            self._float_table = np.concatenate([self._colors(values), self._colors(special)])
+        return self._float_table
+
+    def _float_index(self, data, scratch, mask):
+        """Convert data to indices into the float table."""
+        size = self.size
+        with np.errstate(invalid='ignore', divide='ignore', over='ignore'):
+            _forward(data, self._function, self._offset, self._factor, out=scratch)
+            invalid = ~np.isfinite(scratch)
+            scratch -= self._start
+            scratch *= self._scale
+            # The upper limit of the norm belongs to the last sample
+            scratch[scratch == size] = size - 1
+            np.clip(scratch, -1, size, out=scratch)
+            # After the shift all values are positive, so truncation is flooring
+            scratch += 1
+            scratch[invalid] = 0
+            index = scratch.astype(np.intp)
+
+        if invalid.any():
+            index[invalid] = size + 4
+            index[np.isnan(data)] = size + 3
+        if mask is not None:
+            index[mask] = size + 2
+        return index
+
+
+def apply_colormap(data, cmap, norm=None, out=None, alpha=True):
+    """
+    Convert data to `numpy.uint8` colors with a colormap and a norm, using a
+    cached `~sunpy.cm.ColormapLUT`.
+
+    Parameters
+    ----------
+    data : `numpy.ndarray`
+        The data to colormap.
+
+    cmap : `matplotlib.colors.Colormap` or `str`
+        The colormap.
+
+    norm : `matplotlib.colors.Normalize`, optional
+        The normalization. A copy of the norm is autoscaled to the data if its
+        limits are not set. Defaults to a linear normalization between the
+        minimum and maximum of the data.
+
+    out : `numpy.ndarray`, optional
+        A `numpy.uint8` array to write the colors to.
+
+    alpha : `bool`, optional
+        If `True`, the default, produce RGBA values, otherwise RGB values.
+
+    Returns
+    -------
+    `numpy.ndarray`
+        An array of shape ``data.shape + (4,)``, or ``data.shape + (3,)`` if
+        ``alpha`` is `False`.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> import sunpy.cm
+    >>> rgb = sunpy.cm.apply_colormap(np.random.random((64, 64)), 'sdoaia171', alpha=False)
+    >>> rgb.shape
+    (64, 64, 3)
+    """
+    if norm is None:
+        norm = colors.Normalize()
+    if norm.vmin is None or norm.vmax is None:
+        norm = deepcopy(norm)
+        # The following explicit call is for bugged versions of Astropy's ImageNormalize
+        norm.autoscale_None(data)
+
+    cmap = mplcm.get_cmap(cmap)
+    key = _lut_key(cmap, norm, alpha)
+    if key is None:
+        return ColormapLUT(cmap, norm, alpha=alpha)(data, out=out)
+
+    with _lut_cache_lock:
+        lut = _lut_cache.get(key, (None, None))[1]
+        if lut is not None:
+            _lut_cache.move_to_end(key)
+    if lut is None:
+        lut = ColormapLUT(cmap, deepcopy(norm), alpha=alpha)
+        with _lut_cache_lock:
+            _lut_cache[key] = (cmap, lut)
+            if len(_lut_cache) > _CACHE_SIZE:
+                _lut_cache.popitem(last=False)
+    return lut(data, out=out)
+
+
+def _lut_key(cmap, norm, alpha):
+    """
+    A hashable key describing a colormap and a norm, or `None` if the norm
+    can not be described by its scalar attributes.
+
+    The colormap is described by its id and by its colors for bad, under and
+    over values, which can be changed after it is created.
+    """
+    def attributes(obj):
+        items = []
+        for name, value in sorted(vars(obj).items()):
+            if not np.isscalar(value) and value is not None:
+                return None
+            items.append((name, value))
+        return tuple(items)
+
+    norm_key = [type(norm), norm.vmin, norm.vmax, getattr(norm, 'clip', None)]
+    stretch = getattr(norm, 'stretch', None)
+    if stretch is not None:
+        stretch_key = attributes(stretch)
+        if stretch_key is None:
+            return None
+        norm_key += [type(stretch), stretch_key]
+    special_colors = tuple(map(tuple, cmap(np.ma.array([0., -1., 2.], mask=[True, False, False]))))
+    return (id(cmap), special_colors, tuple(norm_key), alpha)
+
+
+def _take(table, index, out):
+    """
+    Look up the colors of an index array into ``out``, taking RGBA colors as
+    single 32 bit values where possible.
+    """
+    if table.shape[-1] == 4 and out.flags.c_contiguous:
+        np.take(table.view(np.uint32)[:, 0], index, out=out.view(np.uint32)[..., 0])
+    else:
+        np.take(table, index, axis=0, out=out)
+
+
+def _norm_scale(norm):
+    """
+    Return ``(function, inverse, offset, factor)`` such that the norm varies
+    smoothly with ``function((data + offset) * factor)``. ``function`` is
+    `None` for norms which are sampled linearly.
+    """
+    vmin, vmax = float(norm.vmin), float(norm.vmax)
+    data_range = vmax - vmin if vmax > vmin else 1.
+    if isinstance(norm, colors.LogNorm):
+        return np.log, np.exp, 0., 1.
+
+    stretch = getattr(norm, 'stretch', None)
+    if stretch is not None:
+        # Imported here as astropy.visualization is only needed for its norms
+        from astropy.visualization import AsinhStretch, LogStretch
+        if isinstance(stretch, LogStretch):
+            return np.log, np.exp, data_range / stretch.exp - vmin, 1.
+        if isinstance(stretch, AsinhStretch):
+            return np.arcsinh, np.sinh, -vmin, 1. / (data_range * stretch.a)
+
+    return None, None, -vmin, 1. / data_range
+
+
+def _forward(data, function, offset, factor, out=None):
+    """Apply ``function((data + offset) * factor)`` in place on ``out``."""
+    out = np.add(data, offset, out=out)
+    out *= factor
+    if function is not None:
+        function(out, out=out)
+    return out
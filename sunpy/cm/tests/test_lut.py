@@ -0,0 +1,124 @@
+import copy
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+import numpy as np
+import matplotlib.pyplot as plt
+import matplotlib.colors as colors
+from astropy.visualization import AsinhStretch, ImageNormalize, LogStretch, SqrtStretch
+
+import sunpy.cm
+from sunpy.cm import ColormapLUT, apply_colormap
+
+
+@pytest.fixture
+def cmap():
+    return plt.get_cmap('sdoaia171')
+
+
+@pytest.fixture
+def data():
+    return np.random.RandomState(0).lognormal(5, 1.5, (64, 64))
+
+
+def assert_colors_close(result, expected, max_fraction=1e-3):
+    """The lookup table may put a few values just across a color boundary."""
+    assert result.shape == expected.shape
+    assert result.dtype == np.uint8
+    mismatched = np.any(result != expected, axis=-1)
+    assert mismatched.mean() <= max_fraction
+
+
+@pytest.mark.parametrize('norm', [colors.Normalize(vmin=0, vmax=2000),
+                                  colors.LogNorm(vmin=1, vmax=1e4),
+                                  ImageNormalize(vmin=0, vmax=3000, stretch=AsinhStretch(0.01)),
+                                  ImageNormalize(vmin=0, vmax=3000, stretch=LogStretch()),
+                                  ImageNormalize(vmin=0, vmax=3000, stretch=SqrtStretch())])
+def test_float_data(cmap, data, norm):
+    assert_colors_close(ColormapLUT(cmap, norm)(data), cmap(norm(data), bytes=True))
+
+
+def test_float32_chunked(cmap, data):
+    norm = colors.Normalize(vmin=0, vmax=2000)
+    result = ColormapLUT(cmap, norm)(data.astype(np.float32), chunk_size=100)
+    assert_colors_close(result, cmap(norm(data), bytes=True))
+
+
+def test_special_values(cmap):
+    norm = colors.Normalize(vmin=0, vmax=1)
+    data = np.ma.masked_array([-1., 0., 0.5, 1., 2., np.nan, 0.5],
+                              mask=[False] * 6 + [True])
+    np.testing.assert_array_equal(ColormapLUT(cmap, norm)(data), cmap(norm(data), bytes=True))
+
+
+def test_log_norm_nonpositive(cmap):
+    norm = colors.LogNorm(vmin=1, vmax=100)
+    data = np.array([-1., 0., 0.5, 10.])
+    np.testing.assert_array_equal(ColormapLUT(cmap, norm)(data), cmap(norm(data), bytes=True))
+
+
+@pytest.mark.parametrize('dtype', ['>i2', '<i2', 'u2', 'u1', 'i1'])
+def test_integer_data_exact(cmap, dtype):
+    norm = ImageNormalize(vmin=0, vmax=100, stretch=AsinhStretch(0.01))
+    data = np.random.RandomState(0).randint(-10, 120, (32, 32)).astype(dtype)
+    np.testing.assert_array_equal(ColormapLUT(cmap, norm)(data), cmap(norm(data), bytes=True))
+
+
+def test_integer_masked(cmap):
+    norm = colors.Normalize(vmin=0, vmax=100)
+    data = np.ma.masked_array(np.arange(4, dtype=np.int16), mask=[False, True, False, False])
+    np.testing.assert_array_equal(ColormapLUT(cmap, norm)(data), cmap(norm(data), bytes=True))
+
+
+def test_out_and_alpha(cmap, data):
+    norm = colors.Normalize(vmin=0, vmax=2000)
+    out = np.zeros(data.shape + (3,), dtype=np.uint8)
+    result = ColormapLUT(cmap, norm, alpha=False)(data, out=out)
+    assert result is out
+    assert_colors_close(out, cmap(norm(data), bytes=True)[..., :3])
+    with pytest.raises(ValueError):
+        ColormapLUT(cmap, norm)(data, out=out)
+
+
+def test_norm_limits_required(cmap):
+    with pytest.raises(ValueError):
+        ColormapLUT(cmap, colors.Normalize())
+
+
+def test_apply_colormap_autoscale(cmap, data):
+    norm = colors.Normalize()
+    result = apply_colormap(data, 'sdoaia171', norm)
+    # The norm passed in is not modified
+    assert norm.vmin is None
+    expected = cmap(colors.Normalize(vmin=data.min(), vmax=data.max())(data), bytes=True)
+    assert_colors_close(result, expected)
+
+
+def test_apply_colormap_cache(cmap, data):
+    norm = colors.Normalize(vmin=0, vmax=2000)
+    apply_colormap(data, cmap, norm)
+    n_cached = len(sunpy.cm.lut._lut_cache)
+    apply_colormap(data, cmap, colors.Normalize(vmin=0, vmax=2000))
+    assert len(sunpy.cm.lut._lut_cache) == n_cached
+    apply_colormap(data, cmap, colors.Normalize(vmin=0, vmax=1000))
+    assert len(sunpy.cm.lut._lut_cache) == min(n_cached + 1, sunpy.cm.lut._CACHE_SIZE)
+
+
+def test_apply_colormap_cache_special_colors(cmap, data):
+    cmap = copy.copy(cmap)
+    norm = colors.Normalize(vmin=0, vmax=2000)
+    masked = np.ma.masked_greater(data, 1000)
+    apply_colormap(masked, cmap, norm)
+    # Changing the colors of the colormap does not reuse the old table
+    cmap.set_bad('red')
+    result = apply_colormap(masked, cmap, norm)
+    assert np.all(result[masked.mask] == [255, 0, 0, 255])
+
+
+def test_apply_colormap_threads(cmap, data):
+    norms = [colors.Normalize(vmin=0, vmax=vmax) for vmax in range(1000, 1100)]
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(executor.map(lambda norm: apply_colormap(data, cmap, norm), norms))
+    assert len(results) == len(norms)
+    assert len(sunpy.cm.lut._lut_cache) == sunpy.cm.lut._CACHE_SIZE
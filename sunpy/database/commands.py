@@ -1,13 +1,26 @@
 import os
 from abc import ABC, abstractmethod
 
-from sqlalchemy.orm import make_transient
+from sqlalchemy import func, inspect, or_
+from sqlalchemy.orm import make_transient, selectinload
 from sqlalchemy.exc import InvalidRequestError
 
+from sunpy.database.tables import DatabaseEntry, FitsHeaderEntry, FitsKeyComment,\
+    FitsHeaderDump, association_table
+
 __all__ = [
     'EmptyCommandStackError', 'NoSuchEntryError', 'NonRemovableTagError',
-    'DatabaseOperation', 'AddEntry', 'RemoveEntry', 'EditEntry',
-    'CommandManager']
+    'DatabaseOperation', 'AddEntry', 'RemoveEntry', 'AddEntries',
+    'RemoveEntries', 'EditEntry', 'CommandManager']
+
+# The most parameters bound in one statement, below SQLite's limit of 999
+_MAX_BOUND_PARAMETERS = 900
+
+# The relationships of a database entry to the rows of its FITS header
+_HEADER_RELATIONSHIPS = [
+    ('fits_header_entries', FitsHeaderEntry),
+    ('fits_key_comments', FitsKeyComment),
+    ('fits_header_dump', FitsHeaderDump)]
 
 
 class EmptyCommandStackError(Exception):
@@ -158,6 +171,154 @@ class RemoveEntry(DatabaseOperation):
             self.__class__.__name__, self.session, self.entry)
 
 
+class AddEntries(DatabaseOperation):
+    """Add many new database entries to the session at once. Entries without
+    an ID are given consecutive IDs after the largest ID in the database, as
+    are the rows of their FITS headers, so that the session inserts the rows
+    of each table in a single statement. The ``undo`` method deletes the rows
+    of the entries again with one statement per table, selecting them by
+    ranges of IDs.
+
+    """
+    def __init__(self, session, database_entries):
+        self.session = session
+        self.database_entries = list(database_entries)
+
+    def __call__(self):
+        new_entries = [entry for entry in self.database_entries
+                       if inspect(entry).key is None]
+        if not self.session.get_bind().dialect.supports_sequences:
+            # IDs of databases with sequences are left to the sequences
+            _assign_ids(self.session, DatabaseEntry, new_entries)
+            for name, table in _HEADER_RELATIONSHIPS:
+                _assign_ids(self.session, table, [
+                    row for entry in new_entries for row in _loaded_rows(entry, name)])
+        for database_entry in self.database_entries:
+            try:
+                self.session.add(database_entry)
+            except InvalidRequestError:
+                # the entry was removed from the database -> use
+                # make_transient to send it back to the transient state
+                make_transient(database_entry)
+                self.session.add(database_entry)
+
+    def undo(self):
+        self.session.flush()
+        _delete_entries(self.session, [entry.id for entry in self.database_entries])
+        for database_entry in self.database_entries:
+            _make_transient(database_entry)
+
+    def __repr__(self):
+        return '<{0}(session {1!r}, {2} entries)>'.format(
+            self.__class__.__name__, self.session, len(self.database_entries))
+
+
+class RemoveEntries(DatabaseOperation):
+    """Remove many database entries from the database at once, deleting their
+    rows, and the rows of their FITS headers and tags, with one statement per
+    table, selecting them by ranges of IDs. If one of the entries is not
+    stored in the database, :exc:`sunpy.database.NoSuchEntryError` is raised
+    and no entry is removed. The ``undo`` method puts the removed entries back
+    into the session object.
+
+    """
+    def __init__(self, session, database_entries):
+        self.session = session
+        self.database_entries = list(database_entries)
+        self.removed_entries = []
+
+    def __call__(self):
+        for database_entry in self.database_entries:
+            if database_entry.id is None:
+                raise NoSuchEntryError(database_entry)
+        ids = [entry.id for entry in self.database_entries]
+        # Load the rows which belong to the entries, so that undo can put them back
+        options = [selectinload(getattr(DatabaseEntry, name))
+                   for name in ['fits_header_entries', 'fits_key_comments',
+                                'fits_header_dump', 'tags']]
+        stored = {}
+        for criterion in _id_criteria(DatabaseEntry.id, ids):
+            query = self.session.query(DatabaseEntry).filter(criterion).options(*options)
+            stored.update((entry.id, entry) for entry in query)
+        for database_entry in self.database_entries:
+            if database_entry.id not in stored:
+                raise NoSuchEntryError(database_entry)
+
+        _delete_entries(self.session, ids)
+        self.removed_entries = list(stored.values())
+        for database_entry in self.removed_entries:
+            _make_transient(database_entry)
+
+    def undo(self):
+        self.session.add_all(self.removed_entries)
+
+    def __repr__(self):
+        return '<{0}(session {1!r}, {2} entries)>'.format(
+            self.__class__.__name__, self.session, len(self.database_entries))
+
+
+def _loaded_rows(database_entry, name):
+    """The rows of a relationship of a database entry which have been loaded."""
+    if name in inspect(database_entry).unloaded:
+        return []
+    rows = getattr(database_entry, name)
+    if rows is None:
+        return []
+    return rows if isinstance(rows, list) else [rows]
+
+
+def _assign_ids(session, table, rows):
+    """Give the rows without an ID consecutive IDs after the largest ID of
+    the table."""
+    rows = list({id(row): row for row in rows if row.id is None}.values())
+    if rows:
+        (largest,), = session.query(func.max(table.id))
+        for row_id, row in enumerate(rows, (largest or 0) + 1):
+            row.id = row_id
+
+
+def _id_ranges(ids):
+    """Group IDs into ``[first, last]`` ranges of consecutive IDs."""
+    ranges = []
+    for row_id in sorted(set(ids)):
+        if ranges and row_id == ranges[-1][1] + 1:
+            ranges[-1][1] = row_id
+        else:
+            ranges.append([row_id, row_id])
+    return ranges
+
+
+def _id_criteria(column, ids):
+    """Criteria selecting the rows whose ``column`` is one of ``ids``, as few
+    as the number of parameters one statement may bind allows."""
+    ranges = _id_ranges(ids)
+    step = _MAX_BOUND_PARAMETERS // 2
+    for start in range(0, len(ranges), step):
+        yield or_(*[column == first if first == last else column.between(first, last)
+                    for first, last in ranges[start:start + step]])
+
+
+def _delete_entries(session, ids):
+    """Delete the rows of the database entries with the given IDs, and the
+    rows of their FITS headers and tags."""
+    for _, table in _HEADER_RELATIONSHIPS:
+        for criterion in _id_criteria(table.dbentry_id, ids):
+            session.query(table).filter(criterion).delete(synchronize_session=False)
+    for criterion in _id_criteria(association_table.c.entry_id, ids):
+        session.execute(association_table.delete().where(criterion))
+    for criterion in _id_criteria(DatabaseEntry.id, ids):
+        session.query(DatabaseEntry).filter(criterion).delete(synchronize_session=False)
+
+
+def _make_transient(database_entry):
+    """Send a database entry whose rows have been deleted, and the loaded rows
+    of its FITS header, back to the transient state."""
+    for name, _ in _HEADER_RELATIONSHIPS:
+        for row in _loaded_rows(database_entry, name):
+            make_transient(row)
+    make_transient(database_entry)
+
+
 class EditEntry(DatabaseOperation):
     """Change the properties of the database entry. The given keyword arguments
     are used to set the attributes of the entry. The keys represent the
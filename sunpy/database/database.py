@@ -11,7 +11,7 @@ from datetime import datetime
 from contextlib import contextmanager
 import os.path
 
-from sqlalchemy import create_engine, exists
+from sqlalchemy import create_engine, exists, event, func
 from sqlalchemy.orm import sessionmaker, scoped_session
 
 from astropy import units
@@ -26,7 +26,10 @@ from sunpy.net.hek2vso import H2VClient
 from sunpy.net.attr import and_
 from sunpy.net.vso import VSOClient
 from sunpy.extern.six.moves import range
+from sunpy.io import fits
 from sunpy.util import deprecated
+from sunpy.util.concurrency import parallel_map, worker_pool
+from sunpy.util.progressbar import TTYProgressBar
 
 __authors__ = ['Simon Liedtke', 'Rajul Srivastava']
 __emails__ = [
@@ -34,6 +37,10 @@ __emails__ = [
     'rajul09@gmail.com'
 ]
 
+# The number of paths looked up in one query, below SQLite's limit of 999
+# bound parameters
+_PATHS_PER_QUERY = 500
+
 
 class EntryNotFoundError(Exception):
     """This exception is raised if a database entry cannot be found by its
@@ -176,6 +183,14 @@ def split_database(source_database, destination_database, *query_string):
     return source_database, destination_database
 
 
+def _read_headers(path):
+    """The FITS headers of a file, or None if it is not a FITS file. This is
+    called in the worker processes of :meth:`Database.add_from_dir`."""
+    if tables._is_fits_file(path):
+        return fits.get_header(path)
+    return None
+
+
 @contextmanager
 def disable_undo(database):
     """A context manager to disable saving the used commands in the undo
@@ -303,6 +318,15 @@ class Database(object):
         self._engine = create_engine(url)
         self._session_cls = sessionmaker(bind=self._engine)
         self.session = scoped_session(self._session_cls)
+        # The number of entries, which is counted again once entries may have
+        # been added or removed, or committed by other connections
+        self._count = None
+
+        def forget_count(*args):
+            self._count = None
+        for identifier in ['after_flush', 'after_bulk_delete', 'after_soft_rollback',
+                           'after_commit', 'after_begin']:
+            event.listen(self._session_cls, identifier, forget_count)
         self._command_manager = commands.CommandManager()
         self.default_waveunit = default_waveunit
         if self.default_waveunit is not None:
@@ -747,6 +771,9 @@ class Database(object):
         """Add a row of database entries "at once". If this method is used,
         only one entry is saved in the undo history.
 
+        The entries are inserted with one statement per table, see
+        :class:`sunpy.database.commands.AddEntries`.
+
         Parameters
         ----------
         database_entries : iterable of sunpy.database.tables.DatabaseEntry
@@ -756,24 +783,45 @@ class Database(object):
             See Database.add
 
         """
-        cmds = CompositeOperation()
+        database_entries = list(database_entries)
+        if not database_entries:
+            return
+        if not ignore_already_added:
+            self._check_not_added(database_entries)
+        add_entries_cmd = commands.AddEntries(self.session, database_entries)
+        if self._enable_history:
+            self._command_manager.do(add_entries_cmd)
+        else:
+            add_entries_cmd()
         for database_entry in database_entries:
-            # use list(self) instead of simply self because __contains__ checks
-            # for existence in the database and not only all attributes except
-            # ID.
-            if database_entry in list(self) and not ignore_already_added:
-                raise EntryAlreadyAddedError(database_entry)
-            cmd = commands.AddEntry(self.session, database_entry)
-            if self._enable_history:
-                cmds.add(cmd)
-            else:
-                cmd()
             if database_entry.id is None:
                 self._cache.append(database_entry)
             else:
                 self._cache[database_entry.id] = database_entry
-        if cmds:
-            self._command_manager.do(cmds)
+
+    def _check_not_added(self, database_entries):
+        """Raise :exc:`sunpy.database.EntryAlreadyAddedError` for the first of
+        the given entries which is equal to an entry saved in the database.
+        Only the saved entries with the path of one of the given entries are
+        read, and each entry is only compared with those of the same path,
+        file ID, instrument and start of observation, as equal entries share
+        all of these.
+
+        """
+        def key(entry):
+            return (entry.path, entry.fileid, entry.instrument, entry.observation_time_start)
+
+        paths = {database_entry.path for database_entry in database_entries}
+        saved_entries = {}
+        candidates = self._entries_with_paths(paths - {None})
+        if None in paths:
+            candidates.extend(self.session.query(tables.DatabaseEntry).filter(
+                tables.DatabaseEntry.path.is_(None)))
+        for saved_entry in candidates:
+            saved_entries.setdefault(key(saved_entry), []).append(saved_entry)
+        for database_entry in database_entries:
+            if database_entry in saved_entries.get(key(database_entry), []):
+                raise EntryAlreadyAddedError(database_entry)
 
     def add(self, database_entry, ignore_already_added=False):
         """Add the given database entry to the database table.
@@ -888,7 +936,9 @@ class Database(object):
                       ignore_already_added)
 
     def add_from_dir(self, path, recursive=False, pattern='*',
-                     ignore_already_added=False, time_string_parse_format=None):
+                     ignore_already_added=False, time_string_parse_format=None,
+                     header_entries=True, update=False, parallel=None,
+                     batch_size=None, progress=False):
         """Search the given directory for FITS files and use their FITS headers
         to add new entries to the database. Note that one entry in the database
         is assigned to a list of FITS headers, so not the number of FITS headers
@@ -898,6 +948,11 @@ class Database(object):
         avoid reading entire directories if one knows that all FITS files have
         the same filename extension.
 
+        The size and time of last modification of each file are recorded in
+        the database as an :class:`~sunpy.database.tables.IndexedFile`, so
+        that the directory can be synchronised with ``update=True``, which
+        reads only the files which are new or have changed since.
+
         Parameters
         ----------
         path : string
@@ -923,24 +978,100 @@ class Database(object):
             `~datetime.datetime.strftime` if `sunpy.time.parse_time` is unable to
             automatically read the `date-obs` metadata.
 
-        """
-        cmds = CompositeOperation()
-        entries = tables.entries_from_dir(
-            path, recursive, pattern, self.default_waveunit,
-            time_string_parse_format=time_string_parse_format)
-        for database_entry, filepath in entries:
-            if database_entry in list(self) and not ignore_already_added:
-                raise EntryAlreadyAddedError(database_entry)
-            cmd = commands.AddEntry(self.session, database_entry)
-            if self._enable_history:
-                cmds.add(cmd)
-            else:
-                cmd()
-            self._cache.append(database_entry)
-        if cmds:
-            self._command_manager.do(cmds)
+        header_entries : bool, optional
+            If False, store each FITS header as a single
+            :class:`~sunpy.database.tables.FitsHeaderDump` rather than as one
+            :class:`~sunpy.database.tables.FitsHeaderEntry` per card. See
+            :func:`sunpy.database.tables.entries_from_file`.
+
+        update : bool, optional
+            If True, skip the files which have the size and time of last
+            modification recorded when they were last read and still have
+            all of the entries made from them, and replace the entries of the
+            files which are read again. The default is `False`, i.e. all files
+            are read and their entries added.
+
+        parallel : `int`, `bool` or `concurrent.futures.Executor`, optional
+            The number of worker processes, `True` for as many worker
+            processes as there are CPUs, or an executor to read the FITS
+            headers in. By default the headers are read in the calling thread.
+
+        batch_size : int, optional
+            If given, the entries are added to the database, and committed,
+            for this many files at a time, each batch being saved in the undo
+            history on its own. The batches committed before an interruption
+            are skipped when the directory is added again with
+            ``update=True``. By default the entries of all files are added at
+            once and not committed.
+
+        progress : bool, optional
+            If True, display a progress bar of the files which have been read.
 
-    def add_from_file(self, file, ignore_already_added=False):
+        """
+        indexed_files = {indexed_file.path: indexed_file
+                         for indexed_file in self.session.query(tables.IndexedFile)}
+        if update:
+            entry_counts = dict(self.session.query(
+                tables.DatabaseEntry.path, func.count(tables.DatabaseEntry.id)
+            ).group_by(tables.DatabaseEntry.path))
+
+        files = []
+        for filepath in tables._paths_in_dir(path, recursive, pattern):
+            stat = os.stat(filepath)
+            indexed_file = indexed_files.get(filepath)
+            if (update and indexed_file is not None and
+                    indexed_file.size == stat.st_size and
+                    indexed_file.mtime == stat.st_mtime and
+                    indexed_file.entries == entry_counts.get(filepath, 0)):
+                continue
+            files.append((filepath, stat.st_size, stat.st_mtime))
+
+        if progress:
+            pbar = TTYProgressBar(len(files))
+            pbar.start()
+        step = batch_size or len(files) or 1
+        with worker_pool(parallel) as pool:
+            for start in range(0, len(files), step):
+                batch = files[start:start + step]
+                filepaths = [filepath for filepath, _, _ in batch]
+                entries = []
+                counts = []
+                for filepath, headers in zip(filepaths,
+                                             parallel_map(_read_headers, filepaths, pool)):
+                    file_entries = [] if headers is None else list(tables._entries_from_headers(
+                        headers, filepath, self.default_waveunit,
+                        time_string_parse_format=time_string_parse_format,
+                        header_entries=header_entries))
+                    entries.extend(file_entries)
+                    counts.append(len(file_entries))
+
+                if update:
+                    self.remove_many(self._entries_with_paths(filepaths))
+                self.add_many(entries, ignore_already_added)
+                for (filepath, size, mtime), count in zip(batch, counts):
+                    indexed_file = indexed_files.get(filepath)
+                    if indexed_file is None:
+                        indexed_file = indexed_files[filepath] = tables.IndexedFile(filepath)
+                        self.session.add(indexed_file)
+                    indexed_file.size, indexed_file.mtime = size, mtime
+                    indexed_file.entries = count
+                if batch_size:
+                    self.commit()
+                if progress:
+                    pbar.poke(len(batch))
+        if progress:
+            pbar.finish()
+
+    def _entries_with_paths(self, paths):
+        """The saved database entries whose path is one of the given paths."""
+        paths = list(paths)
+        entries = []
+        for start in range(0, len(paths), _PATHS_PER_QUERY):
+            entries.extend(self.session.query(tables.DatabaseEntry).filter(
+                tables.DatabaseEntry.path.in_(paths[start:start + _PATHS_PER_QUERY])))
+        return entries
+
+    def add_from_file(self, file, ignore_already_added=False, header_entries=True):
         """Generate as many database entries as there are FITS headers in the
         given file and add them to the database.
 
@@ -954,9 +1085,13 @@ class Database(object):
         ignore_already_added : bool, optional
             See :meth:`sunpy.database.Database.add`.
 
+        header_entries : bool, optional
+            See :meth:`sunpy.database.Database.add_from_dir`.
+
         """
         self.add_many(
-            tables.entries_from_file(file, self.default_waveunit),
+            tables.entries_from_file(file, self.default_waveunit,
+                                     header_entries=header_entries),
             ignore_already_added)
 
     def edit(self, database_entry, **kwargs):
@@ -977,26 +1112,28 @@ class Database(object):
         """Remove a row of database entries "at once". If this method is used,
         only one entry is saved in the undo history.
 
+        The rows of the entries are deleted with one statement per table, see
+        :class:`sunpy.database.commands.RemoveEntries`.
+
         Parameters
         ----------
         database_entries : iterable of sunpy.database.tables.DatabaseEntry
             The database entries that will be removed from the database.
         """
-        cmds = CompositeOperation()
+        database_entries = list(database_entries)
+        if not database_entries:
+            return
+        remove_entries_cmd = commands.RemoveEntries(self.session, database_entries)
+        if self._enable_history:
+            self._command_manager.do(remove_entries_cmd)
+        else:
+            remove_entries_cmd()
         for database_entry in database_entries:
-            cmd = commands.RemoveEntry(self.session, database_entry)
-            if self._enable_history:
-                cmds.add(cmd)
-            else:
-                cmd()
             try:
                 del self._cache[database_entry.id]
             except KeyError:
                 pass
 
-        if cmds:
-            self._command_manager.do(cmds)
-
     def remove(self, database_entry):
         """Remove the given database entry from the database table."""
         remove_entry_cmd = commands.RemoveEntry(self.session, database_entry)
@@ -1026,7 +1163,7 @@ class Database(object):
         # remove all entries from all helper tables
         database_tables = [
             tables.JSONDump, tables.Tag, tables.FitsHeaderEntry,
-            tables.FitsKeyComment]
+            tables.FitsKeyComment, tables.FitsHeaderDump, tables.IndexedFile]
         for table in database_tables:
             for entry in self.session.query(table):
                 cmds.add(commands.RemoveEntry(self.session, entry))
@@ -1074,30 +1211,37 @@ class Database(object):
         _create_display_table(self, columns, sort).show_in_browser(jsviewer)
 
     def __getitem__(self, key):
+        """Get the entry at an index, or a list of the entries in a slice, in
+        the order of iteration. Only the rows of the requested entries are
+        read, using OFFSET and LIMIT.
+
+        """
         if isinstance(key, slice):
-            entries = []
-            start = 0 if key.start is None else key.start
-            stop = len(self) if key.stop is None else key.stop
-            step = 1 if key.step is None else key.step
-            for i in range(start, stop, step):
-                try:
-                    entry = self[i]
-                except IndexError:
-                    break
-                else:
-                    self._cache[entry.id]
-                    entries.append(entry)
-            return entries
-        # support negative indices
-        if key < 0 < abs(key) <= len(self):
-            key %= len(self)
-        for i, entry in enumerate(self):
-            if i == key:
-                # "touch" the entry in the cache to intentionally cause
-                # possible side-effects
-                self._cache[entry.id]
-                return entry
-        raise IndexError
+            indices = range(*key.indices(len(self)))
+            if not indices:
+                return []
+            first = min(indices[0], indices[-1])
+            rows = self._entries_from(first, abs(indices[-1] - indices[0]) + 1)
+            # Fewer rows than counted are returned if entries have been
+            # removed by other connections since
+            entries = [rows[i - first] for i in indices if i - first < len(rows)]
+        else:
+            # support negative indices
+            if key < 0 < abs(key) <= len(self):
+                key %= len(self)
+            entries = self._entries_from(key, 1) if key >= 0 else []
+            if not entries:
+                raise IndexError
+        for entry in entries:
+            # "touch" the entry in the cache to intentionally cause
+            # possible side-effects
+            self._cache[entry.id]
+        return entries if isinstance(key, slice) else entries[0]
+
+    def _entries_from(self, offset, limit):
+        """At most ``limit`` entries, starting at the index ``offset``."""
+        query = self.session.query(tables.DatabaseEntry).order_by(tables.DatabaseEntry.id)
+        return query.offset(offset).limit(limit).all()
 
     def __contains__(self, database_entry):
         """Return True if the given database_entry entry is saved in the
@@ -1110,11 +1254,23 @@ class Database(object):
 
     def __iter__(self):
         """iterate over all database entries that have been saved."""
-        return iter(self.session.query(tables.DatabaseEntry))
+        return iter(self.session.query(tables.DatabaseEntry).order_by(tables.DatabaseEntry.id))
 
     def __len__(self):
-        """Get the number of rows in the table."""
-        return self.session.query(tables.DatabaseEntry).count()
+        """Get the number of rows in the table.
+
+        The number is counted once and then kept until entries are added to
+        or removed from the database through its session, or the session
+        begins a new transaction. Entries added or removed by other
+        connections, e.g. by another `Database` for the same file, are only
+        counted once the session begins a new transaction, e.g. after
+        :meth:`commit`.
+
+        """
+        session = self.session
+        if self._count is None or session.new or session.deleted:
+            self._count = session.query(tables.DatabaseEntry).count()
+        return self._count
 
     def __repr__(self):
         return _create_display_table(self).__repr__()
@@ -6,7 +6,9 @@ from __future__ import absolute_import, print_function
 
 from time import strptime, mktime
 from datetime import datetime
+from functools import lru_cache
 import fnmatch
+import json
 import os
 
 from astropy.units import Unit, nm, equivalencies, quantity
@@ -19,6 +21,7 @@ import numpy as np
 
 from sunpy.time import parse_time, TimeRange
 from sunpy.io import fits, file_tools as sunpy_filetools
+from sunpy.io.header import FileHeader
 from sunpy.util import print_table
 from sunpy.extern.six.moves import map
 from sunpy.extern import six
@@ -31,7 +34,8 @@ TIME_FORMAT = config.get("general", "time_format")
 
 __all__ = [
     'WaveunitNotFoundError', 'WaveunitNotConvertibleError', 'JSONDump',
-    'FitsHeaderEntry', 'FitsKeyComment', 'Tag', 'DatabaseEntry',
+    'FitsHeaderEntry', 'FitsKeyComment', 'FitsHeaderDump', 'Tag', 'IndexedFile',
+    'DatabaseEntry',
     'entries_from_query_result', 'entries_from_file', 'entries_from_dir',
     'display_entries']
 
@@ -99,6 +103,32 @@ class JSONDump(Base):
         return '<{0}(dump {1!r})>'.format(self.__class__.__name__, self.dump)
 
 
+# The FITS keys which set the columns of a database entry. If a header has
+# both keys of a pair, the later one is used.
+# NOTE: the key DATE-END or DATE_END is not part of the official FITS
+# standard, but many FITS files use it in their header
+_HEADER_COLUMNS = {
+    'INSTRUME': 'instrument',
+    'WAVELNTH': 'wavelength',
+    'DATE-OBS': 'observation_time_start',
+    'DATE_OBS': 'observation_time_start',
+    'DATE-END': 'observation_time_end',
+    'DATE_END': 'observation_time_end'}
+
+
+@lru_cache()
+def _wavelength_unit(waveunit):
+    try:
+        return Unit(waveunit)
+    except ValueError:
+        raise WaveunitNotConvertibleError(waveunit)
+
+
+@lru_cache(maxsize=1024)
+def _wavelength_in_nm(unit, wavelength):
+    return unit.to(nm, wavelength, equivalencies.spectral())
+
+
 class FitsHeaderEntry(Base):
     __tablename__ = 'fitsheaderentries'
 
@@ -161,6 +191,48 @@ class FitsKeyComment(Base):
             self.__class__.__name__, self.id, self.key, self.value)
 
 
+class FitsHeaderDump(Base):
+    """The complete FITS header of a database entry, including the comments
+    of its keys, stored as a single JSON string rather than as one row per
+    card.
+
+    """
+    __tablename__ = 'fitsheaderdumps'
+
+    dbentry_id = Column(Integer, ForeignKey('data.id'))
+    id = Column(Integer, primary_key=True)
+    dump = Column(String, nullable=False)
+
+    def __init__(self, dump):
+        self.dump = dump
+
+    @classmethod
+    def from_header(cls, header):
+        """Dump a FITS header. Values which JSON cannot represent are
+        stored as strings.
+
+        """
+        return cls(json.dumps(header, separators=(',', ':'), default=str))
+
+    @property
+    def header(self):
+        """The dumped header as a `~sunpy.io.header.FileHeader`."""
+        return FileHeader(json.loads(self.dump))
+
+    def __eq__(self, other):
+        return isinstance(other, FitsHeaderDump) and self.dump == other.dump
+
+    def __hash__(self):
+        return super(FitsHeaderDump, self).__hash__()
+
+    def __ne__(self, other):
+        return not (self == other)
+
+    def __repr__(self):  # pragma: no cover
+        return '<{0}(id {1}, dump {2!r})>'.format(
+            self.__class__.__name__, self.id, self.dump)
+
+
 class Tag(Base):
     __tablename__ = 'tags'
 
@@ -185,6 +257,44 @@ class Tag(Base):
         return '<{0}(name {1!r})>'.format(self.__class__.__name__, self.name)
 
 
+class IndexedFile(Base):
+    """A file which has been read by
+    :meth:`sunpy.database.Database.add_from_dir`, with its size and time of
+    last modification at that time and the number of database entries made
+    from it, by which the file is skipped until it changes.
+
+    """
+    __tablename__ = 'indexedfiles'
+
+    path = Column(String, primary_key=True)
+    size = Column(Integer)
+    mtime = Column(Float)
+    entries = Column(Integer)
+
+    def __init__(self, path, size=None, mtime=None, entries=None):
+        self.path = path
+        self.size = size
+        self.mtime = mtime
+        self.entries = entries
+
+    def __eq__(self, other):
+        return (
+            self.path == other.path and
+            self.size == other.size and
+            self.mtime == other.mtime and
+            self.entries == other.entries)
+
+    def __hash__(self):
+        return super(IndexedFile, self).__hash__()
+
+    def __ne__(self, other):
+        return not (self == other)
+
+    def __repr__(self):  # pragma: no cover
+        return '<{0}(path {1!r}, size {2}, mtime {3}, entries {4})>'.format(
+            self.__class__.__name__, self.path, self.size, self.mtime, self.entries)
+
+
 class DatabaseEntry(Base):
     """
     DatabaseEntry()
@@ -237,6 +347,9 @@ class DatabaseEntry(Base):
         Entries can be starred to mark them. By default, this value is False.
     fits_header_entries : list
         A list of ``FitsHeaderEntry`` instances.
+    fits_header_dump : ``FitsHeaderDump``
+        The complete FITS header as a single JSON string, for entries whose
+        header is not stored in ``fits_header_entries``.
     tags : list
         A list of ``Tag`` instances. Use `sunpy.database.Database.tag` to
         add a new tag or multiple tags to a specific entry.
@@ -262,6 +375,7 @@ class DatabaseEntry(Base):
     starred = Column(Boolean, default=False)
     fits_header_entries = relationship('FitsHeaderEntry')
     fits_key_comments = relationship('FitsKeyComment')
+    fits_header_dump = relationship('FitsHeaderDump', uselist=False)
     tags = relationship('Tag', secondary=association_table, backref='data')
 
     @classmethod
@@ -414,6 +528,70 @@ class DatabaseEntry(Base):
             instrument=instrument, size=size,
             wavemin=wavemin, wavemax=wavemax)
 
+    @classmethod
+    def _from_fits_header(cls, header, path=None, hdu_index=None,
+                          default_waveunit=None, time_string_parse_format=None,
+                          header_entries=True):
+        """Make a new :class:`DatabaseEntry` instance from a FITS header in a
+        single pass over its cards. See :func:`entries_from_file` for the
+        parameters.
+
+        """
+        waveunit = fits.extract_waveunit(header)
+        if waveunit is None:
+            waveunit = default_waveunit
+        unit = None if waveunit is None else _wavelength_unit(waveunit)
+
+        values = {}
+        fits_header_entries = []
+        fits_key_comments = []
+        for key, value in six.iteritems(header):
+            # Yes, it is possible to have an empty key in a FITS file.
+            # Example: sunpy.data.sample.EIT_195_IMAGE
+            # Don't ask me why this could be a good idea.
+            if key == '':
+                value = str(value)
+            elif key == 'KEYCOMMENTS':
+                if header_entries:
+                    fits_key_comments = [FitsKeyComment(k, v) for k, v in six.iteritems(value)]
+                continue
+            elif key in _HEADER_COLUMNS:
+                values[_HEADER_COLUMNS[key]] = value
+            if header_entries:
+                fits_header_entries.append(FitsHeaderEntry(key, value))
+
+        if 'wavelength' in values:
+            if unit is None:
+                raise WaveunitNotFoundError(path)
+            # use the value of `unit` to convert the wavelength to nm
+            values['wavemin'] = values['wavemax'] = _wavelength_in_nm(
+                unit, values.pop('wavelength'))
+        for column in ('observation_time_start', 'observation_time_end'):
+            if column in values:
+                values[column] = parse_time(
+                    values[column], _time_string_parse_format=time_string_parse_format)
+
+        if header_entries:
+            values['fits_header_entries'] = fits_header_entries
+            values['fits_key_comments'] = fits_key_comments
+        else:
+            values['fits_header_dump'] = FitsHeaderDump.from_header(header)
+        return cls(path=path, hdu_index=hdu_index, **values)
+
+    @property
+    def fits_header(self):
+        """The FITS header of this entry as a `~sunpy.io.header.FileHeader`,
+        read from :attr:`fits_header_dump` or rebuilt from
+        :attr:`fits_header_entries` and :attr:`fits_key_comments`.
+
+        """
+        if self.fits_header_dump is not None:
+            return self.fits_header_dump.header
+        header = FileHeader((entry.key, entry.value) for entry in self.fits_header_entries)
+        header['KEYCOMMENTS'] = {comment.key: comment.value
+                                 for comment in self.fits_key_comments}
+        return header
+
     def __eq__(self, other):
 
         if self.wavemin is None and other.wavemin is None:
@@ -448,6 +626,7 @@ class DatabaseEntry(Base):
             self.download_time == other.download_time and
             bool(self.starred) == bool(other.starred) and
             self.fits_header_entries == other.fits_header_entries and
+            self.fits_header_dump == other.fits_header_dump and
             self.tags == other.tags)
 
     def _compare_attributes(self, other, attribute_list):
@@ -596,10 +775,11 @@ def entries_from_fido_search_result(sr, default_waveunit=None):
 
 
 def entries_from_file(file, default_waveunit=None,
-                      time_string_parse_format=None):
+                      time_string_parse_format=None, header_entries=True):
     """Use the headers of a FITS file to generate an iterator of
     :class:`sunpy.database.tables.DatabaseEntry` instances. Gathered
-    information will be saved in the attribute `fits_header_entries`. If the
+    information will be saved in the attribute `fits_header_entries`, or in
+    `fits_header_dump` if ``header_entries`` is False. If the
     key INSTRUME, WAVELNTH or DATE-OBS / DATE_OBS is available, the attribute
     `instrument`, `wavemin` and `wavemax` or `observation_time_start` is set,
     respectively. If the wavelength unit can be read, the values of `wavemin`
@@ -623,6 +803,14 @@ def entries_from_file(file, default_waveunit=None,
         `~datetime.datetime.strftime` if `sunpy.time.parse_time` is unable to
         automatically read the `date-obs` metadata.
 
+    header_entries : bool, optional
+        If True (the default), each card of a header is stored as a
+        :class:`FitsHeaderEntry` and each key comment as a
+        :class:`FitsKeyComment`, so that entries can be queried by them with
+        `sunpy.database.attrs.FitsHeaderEntry`. If False, the whole header is
+        stored as a single :class:`FitsHeaderDump` instead, which is much
+        faster to create and to save for headers with many cards.
+
     Raises
     ------
     sunpy.database.WaveunitNotFoundError
@@ -653,61 +841,30 @@ def entries_from_file(file, default_waveunit=None,
     111
 
     """
-    headers = fits.get_header(file)
     if isinstance(file, (str, six.text_type)):
         filename = file
     else:
         filename = getattr(file, 'name', None)
-    for header in headers:
-        entry = DatabaseEntry(path=filename)
-        for key, value in six.iteritems(header):
-            # Yes, it is possible to have an empty key in a FITS file.
-            # Example: sunpy.data.sample.EIT_195_IMAGE
-            # Don't ask me why this could be a good idea.
-            if key == '':
-                value = str(value)
-            elif key == 'KEYCOMMENTS':
-                for k, v in six.iteritems(value):
-                    entry.fits_key_comments.append(FitsKeyComment(k, v))
-                continue
-            entry.fits_header_entries.append(FitsHeaderEntry(key, value))
-        waveunit = fits.extract_waveunit(header)
-        entry.hdu_index = headers.index(header)
-        if waveunit is None:
-            waveunit = default_waveunit
-        unit = None
-        if waveunit is not None:
-            try:
-                unit = Unit(waveunit)
-            except ValueError:
-                raise WaveunitNotConvertibleError(waveunit)
-        for header_entry in entry.fits_header_entries:
-            key, value = header_entry.key, header_entry.value
-            if key == 'INSTRUME':
-                entry.instrument = value
-            elif key == 'WAVELNTH':
-                if unit is None:
-                    raise WaveunitNotFoundError(file)
-                # use the value of `unit` to convert the wavelength to nm
-                entry.wavemin = entry.wavemax = unit.to(
-                    nm, value, equivalencies.spectral())
-            # NOTE: the key DATE-END or DATE_END is not part of the official
-            # FITS standard, but many FITS files use it in their header
-            elif key in ('DATE-END', 'DATE_END'):
-                entry.observation_time_end = parse_time(
-                    value,
-                    _time_string_parse_format=time_string_parse_format
-                )
-            elif key in ('DATE-OBS', 'DATE_OBS'):
-                entry.observation_time_start = parse_time(
-                    value,
-                    _time_string_parse_format=time_string_parse_format
-                )
+    for entry in _entries_from_headers(
+            fits.get_header(file), filename, default_waveunit,
+            time_string_parse_format=time_string_parse_format,
+            header_entries=header_entries):
         yield entry
 
 
+def _entries_from_headers(headers, path, default_waveunit=None,
+                          time_string_parse_format=None, header_entries=True):
+    """Generate a database entry for each of the headers of a FITS file."""
+    for hdu_index, header in enumerate(headers):
+        yield DatabaseEntry._from_fits_header(
+            header, path, hdu_index, default_waveunit,
+            time_string_parse_format=time_string_parse_format,
+            header_entries=header_entries)
+
+
 def entries_from_dir(fitsdir, recursive=False, pattern='*',
-                     default_waveunit=None, time_string_parse_format=None):
+                     default_waveunit=None, time_string_parse_format=None,
+                     header_entries=True):
     """Search the given directory for FITS files and use the corresponding FITS
     headers to generate instances of :class:`DatabaseEntry`. FITS files are
     detected by reading the content of each file, the `pattern` argument may be
@@ -740,6 +897,9 @@ def entries_from_dir(fitsdir, recursive=False, pattern='*',
         `~datetime.datetime.strftime` if `sunpy.time.parse_time` is unable to
         automatically read the `date-obs` metadata.
 
+    header_entries : bool, optional
+        See :func:`sunpy.database.tables.entries_from_file`.
+
     Returns
     -------
     generator of (DatabaseEntry, str) pairs
@@ -759,25 +919,38 @@ def entries_from_dir(fitsdir, recursive=False, pattern='*',
     13
 
     """
+    for path in _paths_in_dir(fitsdir, recursive, pattern):
+        if _is_fits_file(path):
+            for entry in entries_from_file(
+                    path, default_waveunit,
+                    time_string_parse_format=time_string_parse_format,
+                    header_entries=header_entries
+            ):
+                yield entry, path
+
+
+def _paths_in_dir(fitsdir, recursive=False, pattern='*'):
+    """Generate the paths of the files in a directory which match a pattern,
+    as described by :func:`entries_from_dir`."""
     for dirpath, dirnames, filenames in os.walk(fitsdir):
         filename_paths = (os.path.join(dirpath, name) for name in filenames)
         for path in fnmatch.filter(filename_paths, pattern):
-            try:
-                filetype = sunpy_filetools._detect_filetype(path)
-            except (
-                    sunpy_filetools.UnrecognizedFileTypeError,
-                    sunpy_filetools.InvalidJPEG2000FileExtension):
-                continue
-            if filetype == 'fits':
-                for entry in entries_from_file(
-                        path, default_waveunit,
-                        time_string_parse_format=time_string_parse_format
-                ):
-                    yield entry, path
+            yield path
         if not recursive:
             break
 
 
+def _is_fits_file(path):
+    """Whether the content of a file is detected as FITS."""
+    try:
+        filetype = sunpy_filetools._detect_filetype(path)
+    except (
+            sunpy_filetools.UnrecognizedFileTypeError,
+            sunpy_filetools.InvalidJPEG2000FileExtension):
+        return False
+    return filetype == 'fits'
+
+
 def _create_display_table(database_entries, columns=None, sort=False):
     """Generate a table to display the database entries.
 
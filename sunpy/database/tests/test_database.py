@@ -20,13 +20,14 @@ from sunpy.database import Database, EntryAlreadyAddedError,\
     EntryAlreadyStarredError, EntryAlreadyUnstarredError, NoSuchTagError,\
     EntryNotFoundError, TagAlreadyAssignedError, disable_undo, split_database
 from sunpy.database.tables import DatabaseEntry, Tag, FitsHeaderEntry,\
-    FitsKeyComment, JSONDump
+    FitsKeyComment, FitsHeaderDump, IndexedFile, JSONDump
 from sunpy.database.commands import EmptyCommandStackError, NoSuchEntryError
 from sunpy.database.caching import LRUCache, LFUCache
 from sunpy.database import attrs
 from sunpy.net import vso, hek
 from sunpy.data.test.waveunit import waveunitdir
 from sunpy.io import fits
+from sunpy.util.progressbar import TTYProgressBar
 from sunpy.extern.six.moves import range
 from sunpy.extern.six.moves import configparser
 from sunpy.net import Fido, attrs as net_attrs
@@ -402,6 +403,22 @@ def test_add_many(database):
     assert len(database) == 5
 
 
+def test_add_many_inserts_at_once(database):
+    statements = []
+
+    @sqlalchemy.event.listens_for(database._engine, 'before_cursor_execute')
+    def count(conn, cursor, statement, parameters, context, executemany):
+        if statement.startswith('INSERT'):
+            statements.append(statement.split('(')[0].split()[-1])
+
+    database.add_many(DatabaseEntry(fits_header_entries=[FitsHeaderEntry('KEY', i)])
+                      for i in range(50))
+    database.commit()
+    assert sorted(statements) == ['data', 'fitsheaderentries']
+    assert [entry.id for entry in database] == list(range(1, 51))
+    assert database.session.query(FitsHeaderEntry).count() == 50
+
+
 def test_add_many_with_existing_entry(database):
     evil_entry = DatabaseEntry()
     database.add(evil_entry)
@@ -636,6 +653,71 @@ def test_add_fom_path_ignore_duplicates(database):
     assert len(database) == 8
 
 
+@pytest.fixture
+def fitsdir(tmpdir):
+    for filename in glob.glob(os.path.join(waveunitdir, '*.f*ts')):
+        shutil.copy(filename, str(tmpdir))
+    return str(tmpdir)
+
+
+def test_add_from_dir_update(database, fitsdir, mocker):
+    database.add_from_dir(fitsdir, update=True)
+    assert len(database) == 4
+    assert database.session.query(IndexedFile).count() == 4
+    read = mocker.spy(sunpy.database.database, '_read_headers')
+    database.add_from_dir(fitsdir, update=True)
+    assert read.call_count == 0
+    assert len(database) == 4
+
+    changed = os.path.join(fitsdir, 'mq130812.084253.fits')
+    os.utime(changed, (0, 0))
+    database.add_from_dir(fitsdir, update=True)
+    assert read.call_args_list == [mocker.call(changed)]
+    assert len(database) == 4
+    assert sorted(entry.path for entry in database) == sorted(
+        os.path.join(fitsdir, filename) for filename in os.listdir(fitsdir))
+
+    # Files are read again if their entries have been removed
+    database.undo(3)
+    database.add_from_dir(fitsdir, update=True)
+    assert read.call_count == 5
+    assert len(database) == 4
+
+
+def test_add_from_dir_resume(database, fitsdir, mocker):
+    read_headers = sunpy.database.database._read_headers
+    paths = []
+
+    def interrupted(path):
+        if len(paths) == 2:
+            raise KeyboardInterrupt
+        paths.append(path)
+        return read_headers(path)
+
+    mocker.patch('sunpy.database.database._read_headers', side_effect=interrupted)
+    with pytest.raises(KeyboardInterrupt):
+        database.add_from_dir(fitsdir, batch_size=1)
+    assert len(database) == 2
+    mocker.stopall()
+    read = mocker.spy(sunpy.database.database, '_read_headers')
+    database.add_from_dir(fitsdir, update=True, batch_size=1)
+    assert len(database) == 4
+    assert read.call_count == 2
+    assert paths[0] not in [call[0][0] for call in read.call_args_list]
+
+
+def test_add_from_dir_parallel(database, fitsdir, mocker):
+    poke = mocker.spy(TTYProgressBar, 'poke')
+    database.add_from_dir(fitsdir, parallel=2, batch_size=3, progress=True)
+    assert not database.session.new
+    expected = Database('sqlite:///:memory:')
+    expected.add_from_dir(fitsdir)
+    expected.commit()
+    assert sorted(database, key=lambda entry: entry.path) == sorted(
+        expected, key=lambda entry: entry.path)
+    assert [call[0][1] for call in poke.call_args_list] == [3, 1]
+
+
 def test_add_from_file(database):
     assert len(database) == 0
     database.add_from_file(RHESSI_IMAGE)
@@ -654,6 +736,18 @@ def test_add_from_file_hdu_index(database):
         assert entry.hdu_index == i
 
 
+def test_add_from_file_header_dump(database):
+    database.add_from_file(RHESSI_IMAGE, header_entries=False)
+    database.commit()
+    assert len(database) == 4
+    assert database.session.query(FitsHeaderEntry).count() == 0
+    assert database.session.query(FitsHeaderDump).count() == 4
+    for entry, header in zip(database, fits.get_header(RHESSI_IMAGE)):
+        assert entry.fits_header == header
+    database.clear()
+    assert database.session.query(FitsHeaderDump).count() == 0
+
+
 def test_add_from_file_duplicates(database):
     database.add_from_file(RHESSI_IMAGE)
     with pytest.raises(EntryAlreadyAddedError):
@@ -693,6 +787,30 @@ def test_remove_many_entries(filled_database):
         filled_database.undo()
 
 
+def test_remove_many_undo_redo(database):
+    database.add_from_file(RHESSI_IMAGE)
+    database.tag(database[0], 'foo')
+    database.commit()
+    headers = [entry.fits_header for entry in database]
+    database.remove_many(database[:])
+    assert len(database) == 0
+    assert database.session.query(FitsHeaderEntry).count() == 0
+    assert database.session.query(FitsKeyComment).count() == 0
+    database.undo()
+    entries = list(database)
+    assert [entry.fits_header for entry in entries] == headers
+    assert entries[0].tags == [Tag('foo')]
+    database.redo()
+    assert len(database) == 0
+    assert database.session.query(FitsHeaderEntry).count() == 0
+
+
+def test_remove_many_nonexisting_entry(filled_database):
+    with pytest.raises(NoSuchEntryError):
+        filled_database.remove_many(filled_database[:3] + [DatabaseEntry(id=42)])
+    assert len(filled_database) == 10
+
+
 def test_remove_existing_entry(database):
     entry = DatabaseEntry()
     database.add(entry)
@@ -779,6 +897,53 @@ def test_getitem_negative_indices_slice(filled_database):
         DatabaseEntry(id=5, tags=[bar])]
 
 
+def test_getitem_slices(filled_database):
+    entries = list(filled_database)
+    assert entries == sorted(entries, key=lambda entry: entry.id)
+    for key in [slice(-3, None), slice(None, None, -1), slice(8, 2, -3), slice(5, 5),
+                slice(-100, 3), slice(2, None, 4)]:
+        assert filled_database[key] == entries[key]
+
+
+def test_len_counted_once(filled_database, mocker):
+    assert len(filled_database) == 10
+    count = mocker.spy(sqlalchemy.orm.Query, 'count')
+    assert len(filled_database) == 10
+    assert count.call_count == 0
+
+    filled_database.remove(filled_database[0])
+    assert len(filled_database) == 9
+    filled_database.add(DatabaseEntry())
+    assert len(filled_database) == 10
+    filled_database.undo()
+    assert len(filled_database) == 9
+    filled_database.session.add(DatabaseEntry())
+    assert len(filled_database) == 10
+    filled_database.session.query(DatabaseEntry).filter(DatabaseEntry.id > 5).delete()
+    assert len(filled_database) == 4
+
+
+def test_len_other_connection(tmpdir):
+    url = 'sqlite:///{}'.format(tmpdir.join('db.sqlite'))
+    first = Database(url)
+    first.add(DatabaseEntry())
+    first.commit()
+    assert len(first) == 1
+    second = Database(url)
+    second.add(DatabaseEntry())
+    second.commit()
+    first.commit()
+    assert len(first) == 2
+
+
+def test_getitem_stale_len(filled_database):
+    assert len(filled_database) == 10
+    # Remove entries without the session noticing
+    filled_database.session.execute(DatabaseEntry.__table__.delete().where(
+        DatabaseEntry.__table__.c.id > 3))
+    assert [entry.id for entry in filled_database[::-1]] == [3, 2, 1]
+
+
 def test_contains_exists(database):
     entry = DatabaseEntry()
     database.add(entry)
@@ -312,6 +312,20 @@ def test_entries_from_file_withoutwaveunit():
         next(entries_from_file(EIT_195_IMAGE))
 
 
+def test_entries_from_file_header_dump():
+    entry, = entries_from_file(MQ_IMAGE, header_entries=False)
+    expected, = entries_from_file(MQ_IMAGE)
+    assert entry.fits_header_entries == []
+    assert entry.fits_key_comments == []
+    assert entry.fits_header_dump is not None
+    assert dict(entry.fits_header) == dict(expected.fits_header)
+    assert entry.fits_header['WAVELNTH'] == 6563
+    assert entry.fits_header['KEYCOMMENTS']['BITPIX'] == 'Integer*2 (short integer)'
+    for attr in ['instrument', 'observation_time_start', 'observation_time_end',
+                 'wavemin', 'wavemax', 'path', 'hdu_index']:
+        assert getattr(entry, attr) == getattr(expected, attr)
+
+
 def test_entries_from_file_time_string_parse_format():
 
     with pytest.raises(ValueError):
@@ -1,15 +1,16 @@
 """Image resampling methods"""
 from __future__ import absolute_import, division, print_function
 
+from functools import lru_cache
+
 import numpy as np
-import scipy.interpolate
 import scipy.ndimage
-from sunpy.extern.six.moves import range
+import scipy.sparse
 
-__all__ = ['resample', 'reshape_image_to_4d_superpixel']
+__all__ = ['resample', 'reshape_image_to_4d_superpixel', 'reduce_superpixels']
 
 
-def resample(orig, dimensions, method='linear', center=False, minusone=False):
+def resample(orig, dimensions, method='linear', center=False, minusone=False, out=None):
     """Returns a new `numpy.ndarray` that has been resampled up or down.
 
     Arbitrary resampling of source array to new dimension sizes.
@@ -29,9 +30,10 @@ def resample(orig, dimensions, method='linear', center=False, minusone=False):
     method : {'neighbor' | 'nearest' | 'linear' | 'spline'}
         Method to use for resampling interpolation.
             * neighbor - Closest value from original data
-            * nearest and linear - Uses n x 1-D interpolations calculated by
-              `scipy.interpolate.interp1d`.
-            * spline - Uses ndimage.map_coordinates
+            * nearest and linear - 1-D interpolations along each axis, like
+              those of `scipy.interpolate.interp1d`.
+            * spline - Cubic spline interpolation, like that of
+              `scipy.ndimage.map_coordinates`.
     center : bool
         If True, interpolation points are at the centers of the bins,
         otherwise points are at the front edge of the bin.
@@ -41,12 +43,24 @@ def resample(orig, dimensions, method='linear', center=False, minusone=False):
         is resampled by(i-1)/(x-1) * (j-1)/(y-1)
         This prevents extrapolation one element beyond bounds of input
         array.
+    out : `~numpy.ndarray`, optional
+        The array to write the resampled data to. It must have the new
+        dimensions.
 
     Returns
     -------
     out : `~numpy.ndarray`
         A new `~numpy.ndarray` which has been resampled to the desired
-        dimensions.
+        dimensions. It has the floating point type of ``orig``, or
+        `numpy.float64` if ``orig`` is not floating point.
+
+    Notes
+    -----
+    Every method interpolates each axis in turn, so the resampling is done as
+    a product of the data with a sparse matrix of interpolation weights for
+    each axis. The weights only depend on the lengths of the axis before and
+    after resampling, and are cached, so resampling many arrays of the same
+    shape only computes them once.
 
     References
     ----------
@@ -58,103 +72,94 @@ def resample(orig, dimensions, method='linear', center=False, minusone=False):
         raise UnequalNumDimensions("Number of dimensions must remain the same "
                                    "when calling resample.")
 
+    if method not in ['neighbor', 'nearest', 'linear', 'spline']:
+        raise UnrecognizedInterpolationMethod("Unrecognized interpolation "
+                                              "method requested.")
+
     #@note: will this be okay for integer (e.g. JPEG 2000) data?
     if orig.dtype not in [np.float64, np.float32]:
         orig = orig.astype(np.float64)
 
-    dimensions = np.asarray(dimensions, dtype=np.float64)
-    m1 = np.array(minusone, dtype=np.int64)  # array(0) or array(1)
-    offset = np.float64(center * 0.5)       # float64(0.) or float64(0.5)
+    dimensions = tuple(int(dim) for dim in np.asarray(dimensions, dtype=np.float64))
+    if out is not None and out.shape != dimensions:
+        raise ValueError("The output array must have a shape of {0}, not {1}."
+                         .format(dimensions, out.shape))
+
+    dtype = orig.dtype
+    if method == 'spline':
+        # The splines are interpolated from their coefficients, which are
+        # found for all axes at once
+        orig = scipy.ndimage.spline_filter(orig, order=3, output=np.float64)
+
+    weights = [_resample_weights(length, new_length, method, bool(center), bool(minusone),
+                                 orig.dtype.str)
+               for length, new_length in zip(orig.shape, dimensions)]
+
+    # Interpolate the axes which shrink the most first, so that the later
+    # products are smaller
+    data = orig
+    for axis in sorted(range(orig.ndim), key=lambda axis: dimensions[axis] / orig.shape[axis]):
+        moved = np.moveaxis(data, axis, 0)
+        product = weights[axis] @ moved.reshape(moved.shape[0], -1)
+        data = np.moveaxis(product.reshape((dimensions[axis],) + moved.shape[1:]), 0, axis)
+
+    if out is None:
+        return data.astype(dtype, copy=False)
+    np.copyto(out, data, casting='unsafe')
+    return out
+
+
+@lru_cache(maxsize=64)
+def _resample_weights(length, new_length, method, center, minusone, dtype):
+    """
+    The sparse ``(new_length, length)`` matrix of the weights which resample
+    an axis of length ``length`` to ``new_length``.
+    """
+    offset = 0.5 if center else 0.0
+    m1 = int(minusone)
+    coords = ((length - m1) / (new_length - m1) * (np.arange(new_length) + offset) - offset)
+    rows = np.arange(new_length)
 
-    # Resample data
     if method == 'neighbor':
-        data = _resample_neighbor(orig, dimensions, offset, m1)
-    elif method in ['nearest', 'linear']:
-        data = _resample_nearest_linear(orig, dimensions, method,
-                                        offset, m1)
-    elif method == 'spline':
-        data = _resample_spline(orig, dimensions, offset, m1)
+        # Negative indices wrap around, as they do when indexing the data
+        columns = np.arange(length)[coords.round().astype(int)]
+        row_weights = [(rows, columns, np.ones(new_length))]
     else:
-        raise UnrecognizedInterpolationMethod("Unrecognized interpolation "
-                                              "method requested.")
-
-    return data
-
-
-def _resample_nearest_linear(orig, dimensions, method, offset, m1):
-    """Resample Map using either linear or nearest interpolation."""
-
-    dimlist = []
-
-    # calculate new dims
-    for i in range(orig.ndim):
-        base = np.arange(dimensions[i])
-        dimlist.append((orig.shape[i] - m1) / (dimensions[i] - m1) *
-                       (base + offset) - offset)
-
-    # specify old coordinates
-    old_coords = [np.arange(i, dtype=np.float) for i in orig.shape]
-
-    # first interpolation - for ndims = any
-    mint = scipy.interpolate.interp1d(old_coords[-1], orig, bounds_error=False,
-                                      fill_value=min(old_coords[-1]), kind=method)
-
-    new_data = mint(dimlist[-1])
-
-    trorder = [orig.ndim - 1] + list(range(orig.ndim - 1))
-    for i in range(orig.ndim - 2, -1, -1):
-        new_data = new_data.transpose(trorder)
-
-        mint = scipy.interpolate.interp1d(old_coords[i], new_data,
-                                          bounds_error=False, fill_value=min(old_coords[i]), kind=method)
-        new_data = mint(dimlist[i])
-
-    if orig.ndim > 1:
-        # need one more transpose to return to original dimensions
-        new_data = new_data.transpose(trorder)
-
-    return new_data
-
-
-def _resample_neighbor(orig, dimensions, offset, m1):
-    """Resample Map using closest-value interpolation."""
-
-    dimlist = []
-    dimensions = np.asarray(dimensions, dtype=int)
-
-    for i in range(orig.ndim):
-        base = np.indices(dimensions)[i]
-        dimlist.append((orig.shape[i] - m1) / (dimensions[i] - m1) *
-                       (base + offset) - offset)
-    cd = np.array(dimlist).round().astype(int)
-
-    return orig[list(cd)]
-
-
-def _resample_spline(orig, dimensions, offset, m1):
-    """Resample Map using spline-based interpolation."""
-
-    oslices = [slice(0, j) for j in orig.shape]
-    # FIXME: not used?!
-    old_coords = np.ogrid[oslices]  # pylint: disable=W0612
-    nslices = [slice(0, j) for j in list(dimensions)]
-    newcoords = np.mgrid[nslices]
-
-    newcoords_dims = list(range(np.rank(newcoords)))
-
-    # make first index last
-    newcoords_dims.append(newcoords_dims.pop(0))
-    newcoords_tr = newcoords.transpose(newcoords_dims)  # pylint: disable=W0612
-
-    # makes a view that affects newcoords
-    newcoords_tr += offset
-
-    deltas = (np.asarray(orig.shape) - m1) / (dimensions - m1)
-    newcoords_tr *= deltas
-
-    newcoords_tr -= offset
-
-    return scipy.ndimage.map_coordinates(orig, newcoords)
+        # Points outside the data are zero
+        inside = (coords >= 0) & (coords <= length - 1)
+        rows, coords = rows[inside], coords[inside]
+        if method == 'nearest':
+            midpoints = np.arange(length - 1) + 0.5
+            row_weights = [(rows, np.searchsorted(midpoints, coords), np.ones(len(rows)))]
+        elif method == 'linear':
+            lower = np.clip(np.floor(coords), 0, max(length - 2, 0)).astype(int)
+            fraction = coords - lower
+            row_weights = [(rows, lower, 1 - fraction),
+                           (rows, np.minimum(lower + 1, length - 1), fraction)]
+        else:
+            # Cubic B-spline weights of the four nearest coefficients, which
+            # are mirrored at the edges of the data
+            lower = np.floor(coords).astype(int)
+            fraction = coords - lower
+            spline = [(1 - fraction)**3 / 6,
+                      (4 - 6 * fraction**2 + 3 * fraction**3) / 6,
+                      (1 + 3 * fraction + 3 * fraction**2 - 3 * fraction**3) / 6,
+                      fraction**3 / 6]
+            row_weights = []
+            for shift, weight in zip(range(-1, 3), spline):
+                if length > 1:
+                    columns = (lower + shift) % (2 * (length - 1))
+                    columns = (length - 1) - np.abs((length - 1) - columns)
+                else:
+                    columns = np.zeros_like(lower)
+                row_weights.append((rows, columns, weight))
+
+    rows, columns, values = (np.concatenate(parts) for parts in zip(*row_weights))
+    weights = scipy.sparse.csr_matrix((values, (rows, columns)), shape=(new_length, length),
+                                      dtype=dtype)
+    # Leave out zero weights, so that they do not spread non-finite values
+    weights.eliminate_zeros()
+    return weights
 
 
 def reshape_image_to_4d_superpixel(img, dimensions, offset):
@@ -221,14 +226,137 @@ def reshape_image_to_4d_superpixel(img, dimensions, offset):
     # make sure the input dimensions are integers
     dimensions = [int(dim) for dim in dimensions]
 
-    # New dimensions of the final image
-    na = int(np.floor((img.shape[0] - offset[0]) / dimensions[0]))
-    nb = int(np.floor((img.shape[1] - offset[1]) / dimensions[1]))
-
     # Reshape up to a higher dimensional array which is useful for higher
     # level operations
-    return (img[int(offset[0]):int(offset[0] + na * dimensions[0]),
-                int(offset[1]):int(offset[1] + nb * dimensions[1])]).reshape(na, dimensions[0], nb, dimensions[1])
+    view = _superpixel_view(img, dimensions, offset)
+    return view.reshape(view.shape[0] // dimensions[0], dimensions[0],
+                        view.shape[1] // dimensions[1], dimensions[1])
+
+
+def _superpixel_view(img, dimensions, offset):
+    """
+    The view of the last two axes of an array which is covered by whole
+    superpixels.
+    """
+    # New dimensions of the final image
+    na = int(np.floor((img.shape[-2] - offset[0]) / dimensions[0]))
+    nb = int(np.floor((img.shape[-1] - offset[1]) / dimensions[1]))
+    return img[..., int(offset[0]):int(offset[0] + na * dimensions[0]),
+               int(offset[1]):int(offset[1] + nb * dimensions[1])]
+
+
+# The functions whose superpixels are found directly, rather than by applying
+# the function along each axis of the superpixels in turn
+_SUPERPIXEL_REDUCTIONS = {np.sum: 'sum', np.mean: 'mean', np.min: 'min', np.max: 'max'}
+
+# The largest number of pixels in a superpixel for which the superpixels are
+# found by combining strided views of the data, one pixel of each superpixel
+# at a time
+_MAX_STRIDED_SUPERPIXEL = 64
+
+
+def reduce_superpixels(data, dimensions, offset=(0, 0), func=np.sum, mask=None):
+    """
+    Applies a function to the superpixels of an image, or of a stack of
+    images, without copying the data.
+
+    Parameters
+    ----------
+    data : `numpy.ndarray`
+        An image of the form (y, x), or a stack of images of the form
+        (..., y, x).
+    dimensions : array-like
+        A two element array-like object containing integers that describe the
+        superpixel summation in the (y, x) directions.
+    offset : array-like
+        A two element array-like object containing integers that describe
+        where in the input image the superpixels begin in the (y, x)
+        directions.
+    func : function
+        The function applied to the pixels of each superpixel. It must take
+        a numpy array as its first argument, and support the axis keyword
+        with the meaning of a numpy axis keyword. `~numpy.sum`, `~numpy.mean`,
+        `~numpy.min` and `~numpy.max` are applied to all of the pixels of a
+        superpixel at once, other functions are applied along the x and then
+        the y direction of the superpixels.
+    mask : `numpy.ndarray`, optional
+        A boolean array of the shape of ``data`` which is `True` where the
+        data are invalid. Masked pixels are left out of the superpixels.
+
+    Returns
+    -------
+    new_data : `numpy.ndarray`
+        The superpixels.
+    new_mask : `numpy.ndarray`
+        `True` where all of the pixels of a superpixel are masked, or `None`
+        if ``mask`` is `None`. The data of these superpixels are zero for the
+        functions applied to all pixels at once.
+    """
+    dimensions = [int(dim) for dim in dimensions]
+    view = _superpixel_view(data, dimensions, offset)
+    if mask is not None:
+        mask = _superpixel_view(np.asarray(mask, dtype=bool), dimensions, offset)
+    shape = view.shape[:-2] + (view.shape[-2] // dimensions[0], dimensions[0],
+                               view.shape[-1] // dimensions[1], dimensions[1])
+
+    kind = _SUPERPIXEL_REDUCTIONS.get(func)
+    if kind is None or view.dtype.kind not in 'biuf':
+        if mask is not None:
+            view = np.ma.array(view, mask=mask)
+        new_array = func(func(view.reshape(shape), axis=-1), axis=-2)
+        if mask is None:
+            return new_array, None
+        return np.ma.getdata(new_array), np.ma.getmask(new_array)
+
+    if mask is None and dimensions[0] * dimensions[1] > _MAX_STRIDED_SUPERPIXEL:
+        return getattr(np, kind)(view.reshape(shape), axis=(-3, -1)), None
+    return _strided_superpixels(view, dimensions, kind, mask)
+
+
+def _strided_superpixels(view, dimensions, kind, mask=None):
+    """
+    Sum, average or find the minimum or maximum of the superpixels of an array
+    by combining the strided views of it which hold one pixel of each
+    superpixel. Only arrays the size of the superpixels are allocated.
+    """
+    slices = [(Ellipsis, slice(i, None, dimensions[0]), slice(j, None, dimensions[1]))
+              for i in range(dimensions[0]) for j in range(dimensions[1])]
+    if kind in ('sum', 'mean'):
+        ufunc = np.add
+        # The data type numpy would reduce the data with
+        dtype = getattr(np, kind)(np.zeros(1, dtype=view.dtype)).dtype
+        identity = 0
+    else:
+        ufunc = np.minimum if kind == 'min' else np.maximum
+        dtype = view.dtype
+        if dtype.kind == 'f':
+            identity = np.inf if kind == 'min' else -np.inf
+        elif dtype.kind == 'b':
+            identity = kind == 'min'
+        else:
+            info = np.iinfo(dtype)
+            identity = info.max if kind == 'min' else info.min
+
+    if mask is None:
+        new_data = view[slices[0]].astype(dtype)
+        for index in slices[1:]:
+            ufunc(new_data, view[index], out=new_data)
+        if kind == 'mean':
+            new_data /= len(slices)
+        return new_data, None
+
+    new_data = np.full(view[slices[0]].shape, identity, dtype=dtype)
+    count = np.zeros(new_data.shape, dtype=np.intp)
+    valid = np.empty(new_data.shape, dtype=bool)
+    for index in slices:
+        np.logical_not(mask[index], out=valid)
+        ufunc(new_data, view[index], out=new_data, where=valid)
+        count += valid
+    new_mask = count == 0
+    if kind == 'mean':
+        np.divide(new_data, count, out=new_data, where=~new_mask)
+    new_data[new_mask] = 0
+    return new_data, new_mask
 
 
 class UnrecognizedInterpolationMethod(ValueError):
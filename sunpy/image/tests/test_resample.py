@@ -2,10 +2,13 @@ from __future__ import absolute_import, division, print_function
 # Author: Tomas Meszaros <exo@tty.sk>
 
 import astropy.units as u
-from sunpy.image.rescale import reshape_image_to_4d_superpixel
+from sunpy.image.rescale import (reshape_image_to_4d_superpixel, resample, _resample_weights,
+                                  reduce_superpixels)
 import pytest
 import os
 import numpy as np
+import scipy.interpolate
+import scipy.ndimage
 import sunpy.data.test
 import sunpy.map
 
@@ -44,6 +47,55 @@ def test_resample_linear():
 def test_resample_spline():
     resample_method('spline')
 
+def congrid_coords(shape, dimensions, center, minusone):
+    """The coordinates of the new pixels along each axis, as used by congrid."""
+    offset = 0.5 if center else 0.0
+    return [(n - minusone) / (d - minusone) * (np.arange(d) + offset) - offset
+            for n, d in zip(shape, dimensions)]
+
+
+@pytest.mark.parametrize('dimensions', [(8, 10), (40, 50), (5, 47)])
+@pytest.mark.parametrize('center', [False, True])
+@pytest.mark.parametrize('minusone', [False, True])
+def test_resample_interpolation(dimensions, center, minusone):
+    data = np.random.RandomState(0).rand(17, 23)
+    ycoords, xcoords = congrid_coords(data.shape, dimensions, center, minusone)
+
+    for method in ['nearest', 'linear']:
+        expected = data
+        for axis, coords in [(1, xcoords), (0, ycoords)]:
+            expected = scipy.interpolate.interp1d(np.arange(data.shape[axis]), expected,
+                                                  kind=method, axis=axis, bounds_error=False,
+                                                  fill_value=0)(coords)
+        np.testing.assert_allclose(resample(data, dimensions, method, center, minusone),
+                                   expected, atol=1e-12)
+
+    expected = scipy.ndimage.map_coordinates(data, np.meshgrid(ycoords, xcoords, indexing='ij'))
+    np.testing.assert_allclose(resample(data, dimensions, 'spline', center, minusone),
+                               expected, atol=1e-12)
+
+
+def test_resample_out():
+    data = np.random.RandomState(0).rand(17, 23).astype(np.float32)
+    resampled = resample(data, (8, 10))
+    assert resampled.dtype == np.float32
+
+    out = np.empty((8, 10))
+    assert resample(data, (8, 10), out=out) is out
+    np.testing.assert_allclose(out, resampled, rtol=1e-6)
+
+    with pytest.raises(ValueError):
+        resample(data, (8, 10), out=np.empty((10, 8)))
+
+
+def test_resample_weights_cached():
+    data = np.zeros((17, 23))
+    resample(data, (8, 10))
+    hits = _resample_weights.cache_info().hits
+    resample(data + 1, (8, 10))
+    assert _resample_weights.cache_info().hits == hits + 2
+
+
 def test_reshape(aia171_test_map, shape):
 
     def _n(a, b, c):
@@ -81,3 +133,43 @@ def test_reshape(aia171_test_map, shape):
     im = reshape_image_to_4d_superpixel(aia171_test_map.data, d, o)
     assert im.shape == (_n(shape[0], o[0], d[0]), d[0],
                         _n(shape[1], o[1], d[1]), d[1])
+
+
+@pytest.mark.parametrize('dtype', [np.float32, np.float64, np.int16, np.uint8])
+@pytest.mark.parametrize('dimensions, offset', [((2, 3), (0, 0)), ((3, 2), (1, 2)),
+                                                ((10, 9), (0, 1))])
+def test_reduce_superpixels(dtype, dimensions, offset):
+    data = np.random.RandomState(0).randint(0, 100, (2, 31, 29)).astype(dtype)
+    mask = np.random.RandomState(1).rand(2, 31, 29) > 0.7
+    mask[..., :dimensions[0] + offset[0], :dimensions[1] + offset[1]] = True
+    reshaped = np.array([reshape_image_to_4d_superpixel(frame, dimensions, offset)
+                         for frame in data])
+    masked = np.ma.array(data, mask=mask)
+    masked_reshaped = np.ma.array([reshape_image_to_4d_superpixel(frame, dimensions, offset)
+                                   for frame in masked])
+
+    for func in [np.sum, np.mean, np.min, np.max]:
+        new_data, new_mask = reduce_superpixels(data, dimensions, offset, func)
+        expected = func(reshaped, axis=(2, 4))
+        assert new_mask is None
+        assert new_data.dtype == expected.dtype
+        np.testing.assert_allclose(new_data, expected, rtol=1e-6)
+
+        new_data, new_mask = reduce_superpixels(data, dimensions, offset, func, mask=mask)
+        expected = func(masked_reshaped, axis=(2, 4))
+        np.testing.assert_array_equal(new_mask, np.ma.getmaskarray(expected))
+        assert new_mask[:, 0, 0].all()
+        np.testing.assert_allclose(new_data[~new_mask], expected.compressed(), rtol=1e-6)
+        assert (new_data[new_mask] == 0).all()
+
+    # Other functions are applied along each axis of the superpixels
+    new_data, new_mask = reduce_superpixels(data[0], dimensions, offset, np.median)
+    np.testing.assert_allclose(new_data, np.median(np.median(reshaped[0], axis=3), axis=1))
+
+
+def test_reduce_superpixels_view():
+    data = np.arange(36.).reshape(6, 6)
+    new_data, _ = reduce_superpixels(data, (2, 2), func=np.median)
+    # No copy of the data is made
+    assert np.shares_memory(reshape_image_to_4d_superpixel(data, (2, 2), (0, 0)), data)
+    np.testing.assert_allclose(new_data, [[3.5, 5.5, 7.5], [15.5, 17.5, 19.5], [27.5, 29.5, 31.5]])
@@ -1,6 +1,6 @@
 from __future__ import absolute_import, division, print_function
 
-from sunpy.image.transform import affine_transform
+from sunpy.image.transform import affine_transform, warp_affine
 import numpy as np
 from skimage import transform as tf
 import skimage.data as images
@@ -221,3 +221,37 @@ def test_int(identity):
     in_arr = np.array([[100]], dtype=int)
     out_arr = affine_transform(in_arr, rmatrix=identity)
     assert np.issubdtype(out_arr.dtype, np.float)
+
+
+@pytest.mark.parametrize("use_scipy", [False, True])
+def test_warp_affine_out(identity, use_scipy):
+    # A shift of the image into a larger output array of a chosen type
+    image = original[:100, :80].astype(np.float32)
+    out = np.empty((110, 90), dtype=np.float32)
+    result = warp_affine(image, identity, (-5, -5), order=1, missing=-1,
+                         use_scipy=use_scipy, out=out)
+    assert result is out
+    np.testing.assert_allclose(out[5:105, 5:85], image)
+    assert np.all(out[:4] == -1)
+    assert np.all(out[:, -4:] == -1)
+
+    # The default output type is that of floating point images
+    assert warp_affine(image, identity, (0, 0), use_scipy=use_scipy).dtype == np.float32
+    assert warp_affine(image.astype(int), identity, (0, 0),
+                       use_scipy=use_scipy).dtype == np.float64
+
+    with pytest.raises(ValueError):
+        warp_affine(image, identity, (0, 0), output_shape=(3, 3), out=out)
+
+
+@pytest.mark.parametrize("use_scipy", [False, True])
+def test_warp_affine_margin(identity, use_scipy):
+    # With a margin, the edges of the image are interpolated into the missing
+    # value, as if the image had been padded with it
+    image = original[:50, :50]
+    padded = np.pad(image, 20, mode='constant', constant_values=-10)
+    expected = warp_affine(padded, identity, (19.5, 19.5), output_shape=(52, 52), order=3,
+                           missing=-10, use_scipy=use_scipy)
+    result = warp_affine(image, identity, (-0.5, -0.5), output_shape=(52, 52), order=3,
+                         missing=-10, use_scipy=use_scipy, margin=20)
+    np.testing.assert_allclose(result, expected, atol=1e-8)
@@ -6,17 +6,27 @@ from __future__ import absolute_import
 
 import warnings
 
+from functools import lru_cache
+
 import numpy as np
 import scipy.ndimage.interpolation
-try:
-    import skimage.transform
-    scikit_image_not_found = False
-except ImportError:  # pragma: no cover
-    warnings.warn("scikit-image could not be imported. Image rotation will use scipy",
-                  ImportWarning)
-    scikit_image_not_found = True  # pragma: no cover
 
-__all__ = ['affine_transform']
+__all__ = ['affine_transform', 'warp_affine']
+
+
+@lru_cache()
+def _skimage_transform():
+    """
+    `skimage.transform`, which is slow to import and so only imported when
+    it is first needed, or `None` if scikit-image is not installed.
+    """
+    try:
+        import skimage.transform
+    except ImportError:  # pragma: no cover
+        warnings.warn("scikit-image could not be imported. Image rotation will use scipy",
+                      ImportWarning)
+        return None  # pragma: no cover
+    return skimage.transform
 
 
 def affine_transform(image, rmatrix, order=3, scale=1.0, image_center=None,
@@ -102,33 +112,173 @@ def affine_transform(image, rmatrix, order=3, scale=1.0, image_center=None,
     displacement = np.dot(rmatrix, rot_center)
     shift = image_center - displacement
 
-    if use_scipy or scikit_image_not_found:
-        if np.any(np.isnan(image)):
-            warnings.warn("Setting NaNs to 0 for SciPy rotation", RuntimeWarning)
-        # Transform the image using the scipy affine transform
-        rotated_image = scipy.ndimage.interpolation.affine_transform(
-                np.nan_to_num(image).T, rmatrix, offset=shift, order=order,
-                mode='constant', cval=missing).T
+    # The matrix and shift act on (x, y), i.e. (column, row), coordinates
+    matrix = np.asarray(rmatrix)[::-1, ::-1]
+    offset = np.asarray(shift).ravel()[::-1]
+
+    use_scipy = use_scipy or _skimage_transform() is None
+    if use_scipy:
+        dtype = image.dtype
     else:
-        # Make the rotation matrix 3x3 to include translation of the image
-        skmatrix = np.zeros((3, 3))
-        skmatrix[:2, :2] = rmatrix
-        skmatrix[2, 2] = 1.0
-        skmatrix[:2, 2] = shift
-        tform = skimage.transform.AffineTransform(skmatrix)
-
-        # Transform the image using the skimage function
         if not np.issubdtype(image.dtype, np.float64):
             warnings.warn("Input data has been cast to float64", RuntimeWarning)
-            adjusted_image = image.astype(np.float64)
+        dtype = np.float64
+
+    return warp_affine(image, matrix, offset, order=order, missing=missing,
+                       use_scipy=use_scipy, dtype=dtype)
+
+
+def warp_affine(image, matrix, offset, output_shape=None, order=3, missing=0.0,
+                use_scipy=False, out=None, dtype=None, margin=0):
+    """
+    Resample an image onto a grid related to it by an affine transformation,
+    writing the result straight into an output array.
+
+    The value of each pixel of the output is interpolated from the input
+    image at the pixel coordinates ``matrix @ output_pixel + offset``, with
+    both coordinates in array index order, i.e. ``(row, column)``.
+
+    Parameters
+    ----------
+    image : `numpy.ndarray`
+        2D image to be resampled.
+    matrix : 2x2 `numpy.ndarray`
+        The linear part of the transformation from output to input pixels.
+    offset : `numpy.ndarray`
+        The input pixel coordinates of the first output pixel.
+    output_shape : `tuple`, optional
+        The shape of the output. Defaults to the shape of ``out``, or of the
+        input image.
+    order : int 0-5
+        Interpolation order, see `~sunpy.image.transform.affine_transform`.
+    missing : float
+        The value of the output pixels which fall outside of the image.
+    use_scipy : bool
+        Force use of :func:`scipy.ndimage.interpolation.affine_transform`.
+        Default: False, unless scikit-image can't be imported
+    out : `numpy.ndarray`, optional
+        The array to write the output to.
+    dtype : `numpy.dtype`, optional
+        The data type of the output if ``out`` is not given. Defaults to the
+        data type of floating point images and to `numpy.float64` otherwise.
+    margin : `int` or `tuple`, optional
+        The number of pixels of ``missing`` to surround the image with, for
+        each axis, so that the edges of the image are interpolated into the
+        missing value rather than cut off.
+
+    Returns
+    -------
+    out : `numpy.ndarray`
+        The resampled image.
+
+    Notes
+    -----
+    With scipy, the image is interpolated straight into the output. It is
+    only copied first, to a `numpy.float64` array which is then spline
+    filtered in place, if it needs a margin or contains NaNs, which are set
+    to zero.
+
+    With scikit-image, the image is interpolated in double precision, or in
+    single precision for single precision images and output with orders 0, 1
+    and 3, and NaNs are set to zero for orders of 4 and above. For orders 0,
+    1 and 3 the interpolated image is then copied into the output. The other
+    orders are interpolated straight into the output, as
+    :func:`skimage.transform.warp` would with scipy, and clipped to the range
+    of the image.
+    """
+    if out is None:
+        if output_shape is None:
+            output_shape = image.shape
+        if dtype is None:
+            dtype = image.dtype.type if image.dtype.kind == 'f' else np.float64
+        out = np.empty(output_shape, dtype=dtype)
+    elif output_shape is not None and tuple(output_shape) != out.shape:
+        raise ValueError("The output array must have a shape of {0}, not {1}."
+                         .format(tuple(output_shape), out.shape))
+
+    margin = np.broadcast_to(np.asarray(margin, dtype=int), (2,))
+    offset = np.asarray(offset, dtype=float).ravel() + margin
+    has_nans = image.dtype.kind in 'fc' and np.isnan(image).any()
+
+    skimage_transform = None if use_scipy else _skimage_transform()
+    if skimage_transform is None:
+        if has_nans:
+            warnings.warn("Setting NaNs to 0 for SciPy rotation", RuntimeWarning)
+        if has_nans or margin.any():
+            image = _with_margin(image, margin, missing)
+            np.nan_to_num(image, copy=False)
+            _spline_warp(image, matrix, offset, out, order, missing, filter_in_place=True)
         else:
-            adjusted_image = image.copy()
-        if np.any(np.isnan(adjusted_image)) and order >= 4:
-            warnings.warn("Setting NaNs to 0 for higher-order scikit-image rotation",
-                          RuntimeWarning)
-            adjusted_image = np.nan_to_num(adjusted_image)
+            _spline_warp(image, matrix, offset, out, order, missing)
+        return out
+
+    # scikit-image interpolates single precision images in single precision
+    # with orders 0, 1 and 3, and everything else in double precision.
+    if image.dtype == np.float32 and out.dtype == np.float32 and order in (0, 1, 3):
+        dtype = np.float32
+    else:
+        dtype = np.float64
+    if margin.any():
+        image = _with_margin(image, margin, missing, dtype=dtype)
+        owned = True
+    else:
+        owned = image.dtype != dtype
+        image = image.astype(dtype, copy=False)
+    if has_nans and order >= 4:
+        warnings.warn("Setting NaNs to 0 for higher-order scikit-image rotation",
+                      RuntimeWarning)
+        image = np.nan_to_num(image, copy=not owned)
+        owned = True
+
+    if order not in (0, 1, 3):
+        # scikit-image interpolates these orders with scipy at every output
+        # pixel, which is what scipy does for an affine transform without
+        # the array of coordinates of every pixel, and then clips the output
+        # to the range of the image.
+        low, high = image.min(), image.max()
+        _spline_warp(image, matrix, offset, out, order, missing, filter_in_place=owned)
+        missing_pixels = out == out.dtype.type(missing) if not low <= missing <= high else None
+        np.clip(out, low, high, out=out)
+        if missing_pixels is not None:
+            out[missing_pixels] = missing
+        return out
 
-        rotated_image = skimage.transform.warp(adjusted_image, tform, order=order,
-                                               mode='constant', cval=missing)
+    # Make the matrix 3x3 to include the translation of the image. The
+    # scikit-image transform acts on (x, y) coordinates.
+    skmatrix = np.zeros((3, 3))
+    skmatrix[:2, :2] = np.asarray(matrix)[::-1, ::-1]
+    skmatrix[:2, 2] = offset[::-1]
+    skmatrix[2, 2] = 1.0
+    tform = skimage_transform.AffineTransform(skmatrix)
 
-    return rotated_image
+    # Transform the image using the skimage function
+    out[...] = skimage_transform.warp(image, tform, output_shape=out.shape, order=order,
+                                      mode='constant', cval=missing)
+    return out
+
+
+def _spline_warp(image, matrix, offset, out, order, missing, filter_in_place=False):
+    """
+    Interpolate an image into an output array with
+    `scipy.ndimage.affine_transform`, spline filtering the image in place if
+    it is a `numpy.float64` array which can be modified.
+    """
+    prefilter = order > 1
+    if prefilter and filter_in_place and image.dtype == np.float64:
+        scipy.ndimage.spline_filter(image, order, output=image)
+        prefilter = False
+    scipy.ndimage.interpolation.affine_transform(image, matrix, offset=offset,
+                                                 output_shape=out.shape, output=out,
+                                                 order=order, mode='constant', cval=missing,
+                                                 prefilter=prefilter)
+
+
+def _with_margin(image, margin, missing, dtype=np.float64):
+    """
+    A copy of an image surrounded by ``margin`` pixels of ``missing`` along
+    each axis.
+    """
+    shape = tuple(np.array(image.shape) + 2 * margin)
+    extended = np.full(shape, missing, dtype=dtype)
+    extended[margin[0]:shape[0] - margin[0], margin[1]:shape[1] - margin[1]] = image
+    return extended
@@ -2,21 +2,29 @@
 """
 Provides processing routines for data captured with the AIA instrument on SDO.
 """
+import os
+import tempfile
+from concurrent.futures import Executor, ThreadPoolExecutor
+
 import numpy as np
 import astropy.units as u
 
+import sunpy.map
 from sunpy.map.sources.sdo import AIAMap, HMIMap
+from sunpy.image.transform import warp_affine
+from sunpy.util.concurrency import parallel_map, _workers
 
-__all__ = ['aiaprep']
+__all__ = ['aiaprep', 'aiaprep_batch']
 
 
-def aiaprep(aiamap):
+def aiaprep(aiamap, out=None, dtype=None):
     """
     Processes a level 1 `~sunpy.map.sources.sdo.AIAMap` into a level 1.5
     `~sunpy.map.sources.sdo.AIAMap`. Rotates, scales and
     translates the image so that solar North is aligned with the y axis, each
     pixel is 0.6 arcsec across, and the center of the sun is at the center of
-    the image. The actual transformation is done by Map's
+    the image. The rotation, scaling and translation are done in a single
+    interpolation onto the level 1.5 image, with the geometry of Map's
     :meth:`~sunpy.map.mapbase.GenericMap.rotate` method.
 
     This function is similar in functionality to aia_prep() in SSWIDL, but
@@ -28,16 +36,28 @@ def aiaprep(aiamap):
     ----------
     aiamap : `~sunpy.map.sources.sdo.AIAMap` instance
         A `sunpy.map.Map` from AIA
+    out : `numpy.ndarray`, optional
+        The array to write the level 1.5 data to, which becomes the data of
+        the new map. It must have the shape of the level 1.5 data, which is
+        the shape of the level 1 data.
+    dtype : `numpy.dtype`, optional
+        The data type of the level 1.5 data if ``out`` is not given. Defaults
+        to the data type of floating point data, in native byte order, and to
+        `numpy.float64` for integer data.
 
     Returns
     -------
     newmap : A level 1.5 copy of `~sunpy.map.sources.sdo.AIAMap`
 
+    See Also
+    --------
+    aiaprep_batch : Processes many maps or files at once.
+
     Notes
     -----
-    This routine makes use of Map's :meth:`~sunpy.map.mapbase.GenericMap.rotate`
-    method, which modifies the header information to the standard PCi_j WCS
-    formalism.
+    This routine transforms the header information like Map's
+    :meth:`~sunpy.map.mapbase.GenericMap.rotate` method, i.e. to the standard
+    PCi_j WCS formalism.
     The FITS header resulting in saving a file after this procedure will
     therefore differ from the original file.
     """
@@ -45,6 +65,37 @@ def aiaprep(aiamap):
     if not isinstance(aiamap, (AIAMap, HMIMap)):
         raise ValueError("Input must be an AIAMap")
 
+    matrix, offset, margin, new_shape, new_meta = _prep_transform(aiamap)
+
+    if out is None:
+        if dtype is None:
+            dtype = aiamap.data.dtype.type if aiamap.data.dtype.kind == 'f' else np.float64
+        out = np.empty(new_shape, dtype=dtype)
+    elif out.shape != new_shape:
+        raise ValueError("The output array must have a shape of {0}, not {1}."
+                         .format(new_shape, out.shape))
+
+    new_data = warp_affine(aiamap.data, matrix, offset, order=4, missing=aiamap.min(),
+                           out=out, margin=margin)
+
+    return aiamap._new_instance(new_data, new_meta, aiamap.plot_settings)
+
+
+def _prep_transform(aiamap):
+    """
+    The transform from the pixels of the level 1.5 data to those of the level
+    1 data, i.e. a rotation to solar North, a rescaling to 0.6 arcsec per
+    pixel and a crop centred on the Sun, and the level 1.5 metadata.
+
+    Returns
+    -------
+    matrix, offset, margin
+        The transform as taken by `~sunpy.image.transform.warp_affine`.
+    new_shape : `tuple`
+        The shape of the level 1.5 data.
+    new_meta : `~sunpy.util.MetaDict`
+        The level 1.5 metadata.
+    """
     # Target scale is 0.6 arcsec/pixel, but this needs to be adjusted if the map
     # has already been rescaled.
     if (aiamap.scale[0] / 0.6).round() != 1.0 * u.arcsec and aiamap.data.shape != (4096, 4096):
@@ -53,16 +104,128 @@ def aiaprep(aiamap):
         scale = 0.6 * u.arcsec  # pragma: no cover # can't test this because it needs a full res image
     scale_factor = aiamap.scale[0] / scale
 
-    tempmap = aiamap.rotate(recenter=True, scale=scale_factor.value, missing=aiamap.min())
+    rotated_shape, matrix, offset, margin, new_meta = aiamap._rotation(
+        aiamap.rotation_matrix, scale_factor.value, recenter=True, order=4)
 
-    # extract center from padded aiamap.rotate output
+    # The crop of the rotated image, which is centred on the Sun.
     # crpix1 and crpix2 will be equal (recenter=True), as aiaprep does not work with submaps
-    center = np.floor(tempmap.meta['crpix1'])
-    range_side = (center + np.array([-1, 1]) * aiamap.data.shape[0] / 2) * u.pix
-    newmap = tempmap.submap(u.Quantity([range_side[0], range_side[0]]),
-                            u.Quantity([range_side[1], range_side[1]]))
+    center = np.floor(new_meta['crpix1'])
+    range_side = center + np.array([-1, 1]) * aiamap.data.shape[0] / 2
+    y_start, y_stop = np.clip(range_side, 0, rotated_shape[0])
+    x_start, x_stop = np.clip(range_side, 0, rotated_shape[1])
+    new_shape = (int(y_stop) - int(y_start), int(x_stop) - int(x_start))
+
+    # Interpolate the crop directly rather than the whole rotated image
+    offset = offset + matrix @ np.array([int(y_start), int(x_start)])
+
+    new_meta['crpix1'] = new_meta['crpix1'] - x_start
+    new_meta['crpix2'] = new_meta['crpix2'] - y_start
+    new_meta['naxis1'] = new_shape[1]
+    new_meta['naxis2'] = new_shape[0]
+    new_meta['r_sun'] = new_meta['rsun_obs'] / new_meta['cdelt1']
+    new_meta['lvl_num'] = 1.5
+
+    return matrix, offset, margin, new_shape, new_meta
+
+
+def aiaprep_batch(maps, parallel=None, dtype=None):
+    """
+    Processes many level 1 AIA or HMI maps, or the files they are stored in,
+    into level 1.5 maps with `~sunpy.instr.aia.aiaprep`.
+
+    The level 1.5 data of all of the maps are written into one preallocated
+    array, which the maps share. With worker processes the array is memory
+    mapped from a temporary file, so the workers write their data straight
+    into it rather than sending it back.
 
-    newmap.meta['r_sun'] = newmap.meta['rsun_obs'] / newmap.meta['cdelt1']
-    newmap.meta['lvl_num'] = 1.5
+    Parameters
+    ----------
+    maps : iterable
+        The `~sunpy.map.sources.sdo.AIAMap` or `~sunpy.map.sources.sdo.HMIMap`
+        instances, or the files to read them from. They must all have data of
+        the same shape.
+    parallel : `int`, `bool` or `concurrent.futures.Executor`, optional
+        The number of worker processes, `True` for as many worker processes as
+        there are CPUs, or an executor to process the maps in. By default the
+        maps are processed in the calling thread. Maps, unlike files, have to
+        be copied to worker processes.
+    dtype : `numpy.dtype`, optional
+        The data type of the level 1.5 data. Defaults to the data type given
+        by `~sunpy.instr.aia.aiaprep` for the first map.
+
+    Returns
+    -------
+    `list`
+        The level 1.5 maps. Their data are views of an array of shape
+        ``(len(maps), ny, nx)``.
 
-    return newmap
+    Examples
+    --------
+    >>> from sunpy.instr.aia import aiaprep_batch
+    >>> prepped = aiaprep_batch(['aia_lev1_171a.fits', 'aia_lev1_193a.fits'],
+    ...                         parallel=2)  # doctest: +SKIP
+    """
+    maps = list(maps)
+    if not maps:
+        return []
+
+    first = _as_map(maps[0])
+    if not isinstance(first, (AIAMap, HMIMap)):
+        raise ValueError("Input must be an AIAMap")
+    shape = _prep_transform(first)[3]
+    if dtype is None:
+        dtype = first.data.dtype.type if first.data.dtype.kind == 'f' else np.float64
+    shape = (len(maps),) + shape
+
+    if isinstance(parallel, Executor):
+        in_process = isinstance(parallel, ThreadPoolExecutor)
+    else:
+        in_process = _workers(parallel) == 1
+    filename = None
+    try:
+        if in_process:
+            stack = np.empty(shape, dtype=dtype)
+            target = stack
+        else:
+            with tempfile.NamedTemporaryFile(prefix='aiaprep', suffix='.dat',
+                                             delete=False) as f:
+                filename = f.name
+            stack = np.memmap(filename, dtype=dtype, mode='w+', shape=shape)
+            target = (filename, stack.dtype.str, shape)
+
+        prepped = [aiaprep(first, out=stack[0])]
+        results = parallel_map(_prep_into, [(item, target, index) for index, item
+                                            in enumerate(maps[1:], 1)], parallel)
+    finally:
+        if filename is not None:
+            # The array stays mapped once its file has been removed
+            try:
+                os.remove(filename)
+            except OSError:
+                pass
+
+    for index, (cls, meta, plot_settings) in enumerate(results, 1):
+        prepped.append(cls._new_instance(stack[index], meta, plot_settings))
+    return prepped
+
+
+def _as_map(item):
+    return item if isinstance(item, (AIAMap, HMIMap)) else sunpy.map.Map(item)
+
+
+def _prep_into(task):
+    """
+    Process a map or file of `aiaprep_batch` into its slice of the shared
+    array, given as the array or, in worker processes, the file it is mapped
+    from. Returns the class, metadata and plot settings of the level 1.5 map.
+    """
+    item, target, index = task
+    if isinstance(target, np.ndarray):
+        stack = target
+    else:
+        filename, dtype, shape = target
+        stack = np.memmap(filename, dtype=dtype, mode='r+', shape=shape)
+    newmap = aiaprep(_as_map(item), out=stack[index])
+    if isinstance(stack, np.memmap):
+        stack.flush()
+    return type(newmap), newmap.meta, newmap.plot_settings
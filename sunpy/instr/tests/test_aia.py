@@ -1,5 +1,6 @@
 from __future__ import absolute_import
 
+import os
 import tempfile
 
 import pytest
@@ -7,7 +8,7 @@ import numpy as np
 
 import sunpy.map
 import sunpy.data.test as test
-from sunpy.instr.aia import aiaprep
+from sunpy.instr.aia import aiaprep, aiaprep_batch
 
 # Define the original and prepped images first so they're available to all
 # functions
@@ -61,3 +62,47 @@ def test_filesave(prep_map):
         prep_map.rotation_matrix, np.identity(2), rtol=1e-5, atol=1e-8)
     # Check level number
     assert load_map.meta['lvl_num'] == 1.5
+
+
+def test_aiaprep_out(original, prep_map):
+    out = np.empty(original.data.shape, dtype=np.float32)
+    out_map = aiaprep(original, out=out)
+    assert out_map.data is out
+    np.testing.assert_allclose(out_map.data, prep_map.data, rtol=1e-5)
+    assert out_map.meta == prep_map.meta
+
+    with pytest.raises(ValueError):
+        aiaprep(original, out=np.empty((3, 3)))
+
+
+@pytest.mark.parametrize('parallel', [None, 2, True])
+def test_aiaprep_batch(original, prep_map, parallel, monkeypatch):
+    # Pretend to have several CPUs, so that True starts worker processes
+    monkeypatch.setattr(os, 'cpu_count', lambda: 2)
+    prepped = aiaprep_batch([original] * 3, parallel=parallel)
+    assert len(prepped) == 3
+    for newmap in prepped:
+        assert isinstance(newmap, type(prep_map))
+        np.testing.assert_allclose(newmap.data, prep_map.data)
+        assert newmap.meta == prep_map.meta
+    assert prepped[0].data.base is prepped[1].data.base is prepped[2].data.base
+
+
+def test_aiaprep_batch_plot_settings(original):
+    original = original._new_instance(original.data, original.meta,
+                                      dict(original.plot_settings, title='Prepped'))
+    prepped = aiaprep_batch([original] * 2, parallel=2)
+    assert [newmap.plot_settings['title'] for newmap in prepped] == ['Prepped'] * 2
+
+
+def test_aiaprep_batch_files(prep_map):
+    filename = test.get_test_filepath("aia_171_level1.fits")
+    if prep_map.detector != 'AIA':
+        filename = test.get_test_filepath("resampled_hmi.fits")
+    prepped = aiaprep_batch([filename] * 3, parallel=2, dtype=np.float32)
+    assert [newmap.data.dtype for newmap in prepped] == [np.float32] * 3
+    for newmap in prepped:
+        np.testing.assert_allclose(newmap.data, prep_map.data, rtol=1e-5)
+        assert newmap.meta == prep_map.meta
+
+    assert aiaprep_batch([]) == []
@@ -36,12 +36,12 @@ import traceback
 import itertools
 import collections
 
+import numpy as np
 from astropy.io import fits
 
 from sunpy.io.header import FileHeader
-from sunpy.extern.six.moves import zip
 
-__all__ = ['read', 'get_header', 'write', 'extract_waveunit']
+__all__ = ['read', 'LazyData', 'get_header', 'write', 'header_to_fits', 'extract_waveunit']
 
 __author__ = "Keith Hughitt, Stuart Mumford, Simon Liedtke"
 __email__ = "keith.hughitt@nasa.gov"
@@ -49,7 +49,7 @@ __email__ = "keith.hughitt@nasa.gov"
 HDPair = collections.namedtuple('HDPair', ['data', 'header'])
 
 
-def read(filepath, hdus=None, memmap=None, **kwargs):
+def read(filepath, hdus=None, memmap=None, lazy=False, **kwargs):
     """
     Read a fits file
 
@@ -57,8 +57,16 @@ def read(filepath, hdus=None, memmap=None, **kwargs):
     ----------
     filepath : `str`
         The fits file to be read
-    hdu: `int` or iterable
-        The HDU indexes to read from the file
+    hdus : `int` or iterable
+        The HDU indexes to read from the file. Only these HDUs are verified
+        and have their headers and data read.
+    memmap : `bool`, optional
+        Whether to memory map the data, as in `astropy.io.fits.open`.
+    lazy : `bool`, optional
+        If True, the data of each HDU with data is returned as a `LazyData`,
+        which reads and, for compressed HDUs, decompresses the data when it is
+        first accessed. The data of uncompressed images which are not scaled is then
+        memory mapped unless ``memmap`` is False.
 
     Returns
     -------
@@ -71,22 +79,33 @@ def read(filepath, hdus=None, memmap=None, **kwargs):
     data and a FileHeader instance for each one.
     Also all comments in the original file are concatenated into a single
     'comment' key in the returned FileHeader.
+
+    The HDUs are verified one by one, so the checks which
+    `astropy.io.fits.HDUList.verify` makes of the file as a whole, e.g. that
+    the first HDU is a primary HDU, are not made.
     """
     with fits.open(filepath, ignore_blank=True, memmap=memmap) as hdulist:
-        if hdus is not None:
-            if isinstance(hdus, int):
-                hdulist = hdulist[hdus]
-            elif isinstance(hdus, collections.Iterable):
-                hdulist = [hdulist[i] for i in hdus]
-
-        hdulist.verify('silentfix+warn')
+        if hdus is None:
+            hdus = range(len(hdulist))
+        elif isinstance(hdus, int):
+            hdus = [hdus]
 
-        headers = get_header(hdulist)
         pairs = []
-
-        for i, (hdu, header) in enumerate(zip(hdulist, headers)):
+        for i in hdus:
+            # Only the HDUs up to the ones asked for are read from the file
+            hdu = hdulist[i]
+            hdu.verify('silentfix+warn')
+            header = _header_from_hdu(hdu)
             try:
-                pairs.append(HDPair(hdu.data, header))
+                shape = getattr(hdu, 'shape', None)
+                if lazy and shape == ():
+                    # An image HDU without data
+                    data = None
+                elif lazy:
+                    data = LazyData(filepath, i, shape, memmap)
+                else:
+                    data = hdu.data
+                pairs.append(HDPair(data, header))
             except (KeyError, ValueError) as e:
                 message = "Error when reading HDU {}. Skipping.\n".format(i)
                 for line in traceback.format_tb(sys.exc_info()[2]):
@@ -98,6 +117,79 @@ def read(filepath, hdus=None, memmap=None, **kwargs):
     return pairs
 
 
+class LazyData(object):
+    """
+    The data of an HDU of a FITS file, which is read when it is first
+    accessed.
+
+    The file is opened again to read the data, which is then kept. Indexing
+    the data, or converting it with `numpy.asarray`, reads it.
+
+    Parameters
+    ----------
+    filepath : `str`
+        The FITS file.
+    index : `int`
+        The index of the HDU in the file.
+    shape : `tuple`, optional
+        The shape of the data, if known without reading it.
+    memmap : `bool`, optional
+        Whether to memory map the data. By default, the data of uncompressed
+        images which are not scaled is memory mapped.
+    """
+
+    def __init__(self, filepath, index, shape=None, memmap=None):
+        self.filepath = filepath
+        self.index = index
+        self.shape = shape
+        self.memmap = memmap
+        self._data = None
+
+    @property
+    def loaded(self):
+        """Whether the data has been read."""
+        return self._data is not None
+
+    def load(self):
+        """
+        Read the data, if it has not been read yet.
+
+        Returns
+        -------
+        data : `numpy.ndarray`
+        """
+        if self._data is None:
+            memmap = True if self.memmap is None else self.memmap
+            with fits.open(self.filepath, ignore_blank=True, memmap=memmap) as hdulist:
+                # The array keeps the memory map open once the file is closed
+                self._data = hdulist[self.index].data
+            if self._data is not None:
+                self.shape = self._data.shape
+        return self._data
+
+    @property
+    def ndim(self):
+        return None if self.shape is None else len(self.shape)
+
+    @property
+    def dtype(self):
+        return self.load().dtype
+
+    def __array__(self, dtype=None):
+        return np.asarray(self.load(), dtype=dtype)
+
+    def __getitem__(self, item):
+        return self.load()[item]
+
+    def __len__(self):
+        return len(self.load())
+
+    def __repr__(self):
+        return '<{0}(HDU {1} of {2!r}, shape {3}{4})>'.format(
+            self.__class__.__name__, self.index, self.filepath, self.shape,
+            '' if self.loaded else ', not read')
+
+
 def get_header(afile):
     """
     Read a fits file and return just the headers for all HDU's. In each header,
@@ -123,36 +215,38 @@ def get_header(afile):
         close = True
 
     try:
-        headers= []
-        for hdu in hdulist:
-            try:
-                comment = "".join(hdu.header['COMMENT']).strip()
-            except KeyError:
-                comment = ""
-            try:
-                history = "".join(hdu.header['HISTORY']).strip()
-            except KeyError:
-                history = ""
-
-            header = FileHeader(hdu.header)
-            header['COMMENT'] = comment
-            header['HISTORY'] = history
-
-            # Strip out KEYCOMMENTS to a dict, the hard way
-            keydict = {}
-            for card in hdu.header.cards:
-                if card.comment != '':
-                    keydict.update({card.keyword:card.comment})
-            header['KEYCOMMENTS'] = keydict
-            header['WAVEUNIT'] = extract_waveunit(header)
-
-            headers.append(header)
+        headers = [_header_from_hdu(hdu) for hdu in hdulist]
     finally:
         if close:
             hdulist.close()
     return headers
 
 
+def _header_from_hdu(hdu):
+    """The FileHeader of an HDU."""
+    try:
+        comment = "".join(hdu.header['COMMENT']).strip()
+    except KeyError:
+        comment = ""
+    try:
+        history = "".join(hdu.header['HISTORY']).strip()
+    except KeyError:
+        history = ""
+
+    header = FileHeader(hdu.header)
+    header['COMMENT'] = comment
+    header['HISTORY'] = history
+
+    # Strip out KEYCOMMENTS to a dict, the hard way
+    keydict = {}
+    for card in hdu.header.cards:
+        if card.comment != '':
+            keydict.update({card.keyword:card.comment})
+    header['KEYCOMMENTS'] = keydict
+    header['WAVEUNIT'] = extract_waveunit(header)
+    return header
+
+
 def write(fname, data, header, **kwargs):
     """
     Take a data header pair and write a FITS file.
@@ -168,6 +262,33 @@ def write(fname, data, header, **kwargs):
     header : `dict`
         A header dictionary
     """
+    fits_header = header_to_fits(header)
+
+    if isinstance(fname, str):
+        fname = os.path.expanduser(fname)
+
+    fitskwargs = {'output_verify': 'fix'}
+    fitskwargs.update(kwargs)
+    fits.writeto(fname, data, header=fits_header, **fitskwargs)
+
+
+def header_to_fits(header):
+    """
+    Convert a header dict to a `~astropy.io.fits.Header`.
+
+    Comments in the ``KEYCOMMENTS`` key of the header are attached to the
+    cards of the keys they describe.
+
+    Parameters
+    ----------
+    header : `dict`
+        A header dictionary
+
+    Returns
+    -------
+    fits_header : `~astropy.io.fits.Header`
+        The FITS header
+    """
     # Copy header so the one in memory is left alone while changing it for
     # write.
     header = header.copy()
@@ -202,12 +323,7 @@ def write(fname, data, header, **kwargs):
     elif key_comments:
         raise TypeError("KEYCOMMENTS must be a dictionary")
 
-    if isinstance(fname, str):
-        fname = os.path.expanduser(fname)
-
-    fitskwargs = {'output_verify': 'fix'}
-    fitskwargs.update(kwargs)
-    fits.writeto(fname, data, header=fits_header, **fitskwargs)
+    return fits_header
 
 
 def extract_waveunit(header):
@@ -11,3 +11,34 @@ class FileHeader(OrderedDict):
     Open read all file types should format their header into a FileHeader """
     def __init__(self, *args, **kwargs):
         OrderedDict.__init__(self, *args, **kwargs)
+
+
+def _resample_header(header, shape, factor, ny, x_min, y_min):
+    """
+    Update the pixel keywords of a header to describe a reduced resolution
+    image of a region of the full image, as read from JPEG2000 files or
+    built for the levels of map pyramids.
+
+    Each pixel of the reduced image covers ``factor`` by ``factor`` pixels of
+    the full image of ``ny`` rows. The pixels are aligned to the top left
+    corner of the full image, which is where the JPEG2000 reference grid
+    starts, and the region starts at the full resolution pixel
+    ``(x_min, y_min)``.
+    """
+    new_ny, new_nx = shape[:2]
+    # Offsets (in full resolution pixels) of the first decoded pixel with
+    # respect to the first pixel of the full image, in the FITS orientation
+    # where the first row is at the bottom.
+    first_column = -(-x_min // factor) * factor
+    last_row = -(-(ny - y_min) // factor) * factor
+    first_row = ny - last_row
+
+    header['NAXIS1'] = new_nx
+    header['NAXIS2'] = new_ny
+    for axis, offset in ((1, first_column), (2, first_row)):
+        # The scale is given by CDELTi, by the CDi_j matrix or by both
+        for key in ('CDELT{0}'.format(axis), 'CD1_{0}'.format(axis), 'CD2_{0}'.format(axis)):
+            if key in header:
+                header[key] *= factor
+        header['CRPIX{0}'.format(axis)] = ((header['CRPIX{0}'.format(axis)] - offset +
+                                            (factor - 1) / 2.) / factor)
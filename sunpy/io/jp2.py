@@ -2,13 +2,12 @@
 from __future__ import absolute_import, division, print_function
 
 import collections
+import importlib.util
 
 from xml.etree import cElementTree as ET
 
-from glymur import Jp2k
-
 from sunpy.util.xml import xml_to_dict
-from sunpy.io.header import FileHeader
+from sunpy.io.header import FileHeader, _resample_header
 
 __all__ = ['read', 'get_header', 'write']
 
@@ -17,8 +16,19 @@ __email__ = "keith.hughitt@nasa.gov"
 
 HDPair = collections.namedtuple('HDPair', ['data', 'header'])
 
+# glymur is slow to import, so it is only imported when a file is opened, but
+# this module is still unavailable if glymur is not installed.
+if importlib.util.find_spec('glymur') is None:
+    raise ImportError("No module named 'glymur'")
+
+
+def _open(filepath):
+    """Open a file with `glymur.Jp2k`."""
+    from glymur import Jp2k
+    return Jp2k(filepath)
 
-def read(filepath, **kwargs):
+
+def read(filepath, resolution_level=0, region=None, **kwargs):
     """
     Reads a JPEG2000 file
 
@@ -27,16 +37,50 @@ def read(filepath, **kwargs):
     filepath : `str`
         The file to be read
 
+    resolution_level : `int`, optional
+        The number of wavelet resolution levels to discard when decoding.
+        Each level halves the size of both image axes, so a level of ``2``
+        returns an image a quarter of the size of the original in each
+        dimension. Defaults to ``0``, the full resolution image.
+
+    region : `tuple`, optional
+        A ``(x_min, y_min, x_max, y_max)`` tuple of full resolution pixel
+        indices, in the orientation of the returned data, selecting the part
+        of the image to decode. The maximum values are exclusive. Defaults
+        to the whole image.
+
     Returns
     -------
     pairs : `list`
         A list of (data, header) tuples
+
+    Notes
+    -----
+    The file is opened only once and only the code blocks needed for the
+    requested resolution level and region are decoded. The header keywords
+    ``NAXIS``, ``CDELT`` and ``CRPIX`` are updated to describe the decoded
+    array. The returned array is a vertically flipped view of the decoded
+    image, not a copy.
     """
-    header = get_header(filepath)
+    jp2 = _open(filepath)
+    header = _parse_header(jp2)
+
+    ny, nx = jp2.shape[:2]
+    if region is None:
+        region = (0, 0, nx, ny)
+    x_min, y_min, x_max, y_max = _validate_region(region, nx, ny)
+
+    # JPEG2000 images are stored top to bottom, so the requested rows have
+    # to be flipped into the file's orientation before decoding.
+    area = (ny - y_max, x_min, ny - y_min, x_max)
+    if area == (0, 0, ny, nx):
+        area = None
+    data = jp2.read(rlevel=resolution_level, area=area)[::-1]
 
-    data = Jp2k(filepath).read()[::-1]
+    if resolution_level or area is not None:
+        _resample_header(header, data.shape, 2 ** resolution_level, ny, x_min, y_min)
 
-    return [HDPair(data, header[0])]
+    return [HDPair(data, header)]
 
 
 def get_header(filepath):
@@ -53,7 +97,19 @@ def get_header(filepath):
     headers : list
         A list of headers read from the file
     """
-    jp2 = Jp2k(filepath)
+    return [_parse_header(_open(filepath))]
+
+
+def write(fname, data, header):
+    """
+    Place holder for required file writer
+    """
+    raise NotImplementedError("No jp2 writer is implemented")
+
+
+def _parse_header(jp2):
+    """Build a `~sunpy.io.header.FileHeader` from the XML box of an open
+    `~glymur.Jp2k` file"""
     xml_box = [box for box in jp2.box if box.box_id == 'xml ']
     xmlstring = ET.tostring(xml_box[0].xml.find('fits'))
     pydict = xml_to_dict(xmlstring)["fits"]
@@ -72,14 +128,16 @@ def get_header(filepath):
     # Is this file a Helioviewer Project JPEG2000 file?
     pydict['helioviewer'] = xml_box[0].xml.find('helioviewer') is not None
 
-    return [FileHeader(pydict)]
+    return FileHeader(pydict)
 
 
-def write(fname, data, header):
-    """
-    Place holder for required file writer
-    """
-    raise NotImplementedError("No jp2 writer is implemented")
+def _validate_region(region, nx, ny):
+    """Check that a region lies inside a ``nx`` by ``ny`` image"""
+    x_min, y_min, x_max, y_max = (int(value) for value in region)
+    if not (0 <= x_min < x_max <= nx and 0 <= y_min < y_max <= ny):
+        raise ValueError("The region {0} does not lie within the "
+                         "{1}x{2} image.".format(tuple(region), nx, ny))
+    return x_min, y_min, x_max, y_max
 
 
 def _is_float(s):
@@ -1,3 +1,9 @@
+import mmap
+
+import numpy as np
+import pytest
+from astropy.io import fits
+
 import sunpy.io.fits
 from sunpy.io.fits import get_header, extract_waveunit
 
@@ -35,6 +41,43 @@ def read_hdus_gen():
     assert len(pairs) == 2
 
 
+@pytest.mark.parametrize('hdus, indices', [(1, [1]), ([1, 2], [1, 2]), (range(0, 1), [0])])
+def test_read_hdus(hdus, indices, mocker):
+    header_from_hdu = mocker.spy(sunpy.io.fits, '_header_from_hdu')
+    pairs = sunpy.io.fits.read(RHESSI_IMAGE, hdus=hdus)
+    # Only the HDUs asked for are read
+    assert header_from_hdu.call_count == len(indices)
+    headers = get_header(RHESSI_IMAGE)
+    assert [pair.header for pair in pairs] == [headers[i] for i in indices]
+
+
+def test_read_lazy(tmpdir):
+    filepath = str(tmpdir.join('lazy.fits'))
+    data = np.arange(100, dtype=np.float32).reshape(10, 10)
+    fits.HDUList([fits.PrimaryHDU(), fits.CompImageHDU(data),
+                  fits.ImageHDU(data.astype(np.int16))]).writeto(filepath)
+
+    pairs = sunpy.io.fits.read(filepath, lazy=True)
+    assert [pair.header for pair in pairs] == get_header(filepath)
+    assert pairs[0].data is None
+    compressed, uncompressed = pairs[1].data, pairs[2].data
+    assert isinstance(compressed, sunpy.io.fits.LazyData)
+    assert not compressed.loaded
+    assert np.shape(compressed) == (10, 10)
+    assert not compressed.loaded
+    np.testing.assert_allclose(np.asarray(compressed), data)
+    assert compressed.loaded
+    assert compressed[2, 3] == data[2, 3]
+
+    # Uncompressed data is memory mapped
+    array = uncompressed.load()
+    np.testing.assert_array_equal(array, data)
+    while not isinstance(array, mmap.mmap):
+        array = array.base
+    # Data read without lazy loading is the same
+    np.testing.assert_array_equal(sunpy.io.fits.read(filepath, hdus=2)[0].data, data)
+
+
 def test_extract_waveunit_missing_waveunit_key_and_missing_wavelnth_comment():
     waveunit = extract_waveunit(get_header(RHESSI_IMAGE)[0])
     assert waveunit is None
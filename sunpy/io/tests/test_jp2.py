@@ -6,6 +6,8 @@ from __future__ import absolute_import
 #pylint: disable=C0103,R0904,W0201,W0212,W0232,E1103
 import numpy as np
 
+import astropy.units as u
+
 from sunpy.data.test import get_test_filepath
 from sunpy.io.header import FileHeader
 from sunpy.map import GenericMap
@@ -36,3 +38,90 @@ def test_read_file():
     SunPy map"""
     map_ = Map(AIA_193_JP2)
     assert isinstance(map_, GenericMap)
+
+
+@skip_glymur
+def test_read_single_open():
+    """Tests that the data is returned as a flipped view of the decoded image"""
+    from sunpy.io.jp2 import read
+    data, header = read(AIA_193_JP2)[0]
+    assert data.base is not None
+    assert data.shape == (header['NAXIS2'], header['NAXIS1'])
+
+
+@skip_glymur
+def test_read_resolution_level():
+    """Tests reading a reduced resolution image"""
+    from sunpy.io.jp2 import read
+    full_data, full_header = read(AIA_193_JP2)[0]
+    data, header = read(AIA_193_JP2, resolution_level=2)[0]
+    assert data.shape == (1024, 1024)
+    assert header['NAXIS1'] == 1024
+    assert header['NAXIS2'] == 1024
+    assert header['CDELT1'] == 4 * full_header['CDELT1']
+    assert header['CDELT2'] == 4 * full_header['CDELT2']
+    # The reference pixel has to stay at the same physical position
+    assert header['CRPIX1'] == (full_header['CRPIX1'] + 1.5) / 4
+    assert header['CRPIX2'] == (full_header['CRPIX2'] + 1.5) / 4
+
+
+@skip_glymur
+def test_read_region():
+    """Tests reading a region of the full resolution image"""
+    from sunpy.io.jp2 import read
+    full_data, full_header = read(AIA_193_JP2)[0]
+    data, header = read(AIA_193_JP2, region=(100, 200, 612, 456))[0]
+    assert data.shape == (256, 512)
+    np.testing.assert_array_equal(data, full_data[200:456, 100:612])
+    assert header['CDELT1'] == full_header['CDELT1']
+    assert header['CRPIX1'] == full_header['CRPIX1'] - 100
+    assert header['CRPIX2'] == full_header['CRPIX2'] - 200
+
+
+@skip_glymur
+def test_read_region_resolution_level():
+    """Tests reading a region of a reduced resolution image"""
+    from sunpy.io.jp2 import read
+    full_data, full_header = read(AIA_193_JP2, resolution_level=1)[0]
+    data, header = read(AIA_193_JP2, resolution_level=1, region=(100, 200, 612, 456))[0]
+    assert data.shape == (128, 256)
+    np.testing.assert_array_equal(data, full_data[100:228, 50:306])
+    assert header['CRPIX1'] == full_header['CRPIX1'] - 50
+    assert header['CRPIX2'] == full_header['CRPIX2'] - 100
+
+
+@skip_glymur
+def test_read_region_outside_image():
+    """Tests that regions outside the image raise an error"""
+    import pytest
+    from sunpy.io.jp2 import read
+    with pytest.raises(ValueError):
+        read(AIA_193_JP2, region=(0, 0, 5000, 100))
+
+
+@skip_glymur
+def test_read_file_resolution_level():
+    """Tests the creation of a reduced resolution SunPy map"""
+    full_map = Map(AIA_193_JP2)
+    map_ = Map(AIA_193_JP2, resolution_level=3)
+    assert isinstance(map_, GenericMap)
+    assert map_.data.shape == (512, 512)
+    assert map_.scale[0] == 8 * full_map.scale[0]
+    # The centre of the image has to stay at the same physical position
+    centre = map_.pixel_to_world(255.5 * u.pix, 255.5 * u.pix)
+    full_centre = full_map.pixel_to_world(2047.5 * u.pix, 2047.5 * u.pix)
+    np.testing.assert_allclose(centre.Tx.value, full_centre.Tx.value)
+    np.testing.assert_allclose(centre.Ty.value, full_centre.Ty.value)
+
+
+def test_resample_header_cd_matrix():
+    """Tests scaling a header with a CD matrix and no CDELT keywords"""
+    from sunpy.io.header import _resample_header
+    header = FileHeader({'NAXIS1': 8, 'NAXIS2': 8, 'CRPIX1': 4.5, 'CRPIX2': 4.5,
+                         'CD1_1': 0.5, 'CD1_2': 0.1, 'CD2_1': -0.1, 'CD2_2': 0.5})
+    _resample_header(header, (4, 4), 2, 8, 0, 0)
+    assert 'CDELT1' not in header
+    assert 'CDELT2' not in header
+    assert [header['CD1_1'], header['CD1_2'], header['CD2_1'], header['CD2_2']] == \
+        [1.0, 0.2, -0.2, 1.0]
+    assert header['CRPIX1'] == header['CRPIX2'] == 2.5
@@ -1,10 +1,17 @@
 """SunPy Maps"""
 from __future__ import absolute_import
 
+import sys
+import importlib
+
 __author__ = "Keith Hughitt"
 __email__ = "keith.hughitt@nasa.gov"
 
 
+# Registers the sunpy colormaps with matplotlib, so that they can be used by
+# name as soon as sunpy.map is imported
+import sunpy.cm
+
 from sunpy.map.mapbase import GenericMap
 
 from . mapcube import MapCube
@@ -12,4 +19,13 @@ from . mapsequence import MapSequence
 from . compositemap import CompositeMap
 
 from sunpy.map.map_factory import Map
-from sunpy.map import sources
+from sunpy.map.pyramid import MapPyramid, map_pyramid, write_pyramid
+
+# The instrument sources are only imported when they are first needed, e.g. by Map. Module level __getattr__ needs Python 3.7.
+if sys.version_info < (3, 7):
+    from sunpy.map import sources
+else:
+    def __getattr__(name):
+        if name == 'sources':
+            return importlib.import_module('sunpy.map.sources')
+        raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
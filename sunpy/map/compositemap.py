@@ -6,8 +6,6 @@ from __future__ import absolute_import, print_function, division
 
 import numpy as np
 
-import matplotlib.pyplot as plt
-
 import astropy.units as u
 
 from sunpy.map import GenericMap
@@ -401,6 +399,7 @@ class CompositeMap(object):
         ret : `list`
             List of axes image or quad contour sets that have been plotted.
         """
+        import matplotlib.pyplot as plt
 
         # Get current axes
         if not axes:
@@ -482,6 +481,7 @@ class CompositeMap(object):
             Matplotlib Any additional imshow arguments that should be used
             when plotting.
         """
+        import matplotlib.pyplot as plt
 
         # Create a figure and add title and axes
         figure = plt.figure(frameon=not basic_plot)
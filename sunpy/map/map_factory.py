@@ -1,8 +1,11 @@
 from __future__ import absolute_import, division, print_function
 
 import os
+import sys
 import glob
+import functools
 from collections import OrderedDict
+from concurrent.futures import Executor
 import warnings
 
 import numpy as np
@@ -22,12 +25,14 @@ from sunpy.util.net import download_file
 from sunpy.util import expand_list
 from sunpy.util.metadata import MetaDict
 from sunpy.util.config import get_and_create_download_dir
+from sunpy.util.concurrency import parallel_map, _workers
 from sunpy.util.exceptions import SunpyDeprecationWarning
 
 from sunpy.util.datatype_factory_base import BasicRegistrationFactory
 from sunpy.util.datatype_factory_base import NoMatchError
 from sunpy.util.datatype_factory_base import MultipleMatchError
 from sunpy.util.datatype_factory_base import ValidationFunctionError
+from sunpy.util.datatype_factory_base import header_signature
 from sunpy.extern import six
 from sunpy.extern.six.moves.urllib.request import urlopen
 
@@ -41,15 +46,15 @@ except ImportError:
 __authors__ = ["Russell Hewett, Stuart Mumford"]
 __email__ = "stuart@mumford.me.uk"
 
-# Make a mock DatabaseEntry class if sqlalchemy is not installed
-try:
-    from sunpy.database.tables import DatabaseEntry
-except ImportError:
-    class DatabaseEntry(object):
-        pass
-
 __all__ = ['Map', 'MapFactory']
 
+# Keyword arguments understood by the file readers in sunpy.io
+_READER_KWARGS = ('hdus', 'memmap', 'resolution_level', 'region')
+
+# The modules of the map sources of sunpy, which only read the dispatch keys
+_SOURCE_MODULES = frozenset('sunpy.map.sources.' + name for name in (
+    'hinode', 'iris', 'proba2', 'rhessi', 'sdo', 'soho', 'stereo', 'trace', 'yohkoh'))
+
 class MapFactory(BasicRegistrationFactory):
     """
     Map(\*args, \*\*kwargs)
@@ -96,6 +101,11 @@ class MapFactory(BasicRegistrationFactory):
 
     >>> mymap = sunpy.map.Map('file1.fits')   # doctest: +SKIP
 
+    * JPEG2000 files at a reduced resolution or for a region of the image
+
+    >>> mymap = sunpy.map.Map('file1.jp2', resolution_level=2)   # doctest: +SKIP
+    >>> mymap = sunpy.map.Map('file1.jp2', region=(0, 0, 1024, 1024))   # doctest: +SKIP
+
     * All fits files in a directory by giving a directory
 
     >>> mymap = sunpy.map.Map('local_dir/sub_dir')   # doctest: +SKIP
@@ -121,25 +131,16 @@ class MapFactory(BasicRegistrationFactory):
     >>> mymap = sunpy.map.Map((data, header), data2, header2, 'file1.fits', url_str, 'eit_*.fits')  # doctest: +SKIP
     """
 
+    # The header keys which identify the source of a map. The map type which
+    # matched a combination of their values is remembered, so that the
+    # matching for later maps from the same source is a single check.
+    dispatch_keys = ('INSTRUME', 'TELESCOP', 'DETECTOR', 'OBSRVTRY', 'CAMERA')
 
     def _read_file(self, fname, **kwargs):
         """ Read in a file name and return the list of (data, meta) pairs in
-            that file. """
-
-        # File gets read here.  This needs to be generic enough to seamlessly
-        # call a fits file or a jpeg2k file, etc
-        pairs = read_file(fname, **kwargs)
-
-        new_pairs = []
-        for pair in pairs:
-            filedata, filemeta = pair
-            assert isinstance(filemeta, FileHeader)
-            # This tests that the data is more than 1D
-            if len(np.shape(filedata)) > 1:
-                data = filedata
-                meta = MetaDict(filemeta)
-                new_pairs.append((data, meta))
-        return new_pairs
+            that file. Files read in worker processes are read by the module
+            function `_read_file` instead. """
+        return _read_file(fname, **kwargs)
 
     def _validate_meta(self, meta):
         """
@@ -152,7 +153,7 @@ class MapFactory(BasicRegistrationFactory):
         else:
             return False
 
-    def _parse_args(self, *args, **kwargs):
+    def _parse_args(self, *args, parallel=None, **kwargs):
         """
         Parses an args list for data-header pairs.  args can contain any
         mixture of the following entries:
@@ -175,8 +176,12 @@ class MapFactory(BasicRegistrationFactory):
                          'directory1',
                          '*.fits')
 
+        Files are read after all arguments have been parsed, in a pool of
+        workers if ``parallel`` is given, see `sunpy.util.concurrency.parallel_map`.
         """
 
+        # The data-header pairs of each argument in order, or the name of the
+        # file to read them from.
         data_header_pairs = list()
         already_maps = list()
 
@@ -204,22 +209,19 @@ class MapFactory(BasicRegistrationFactory):
             elif (isinstance(arg, six.string_types) and
                   os.path.isfile(os.path.expanduser(arg))):
                 path = os.path.expanduser(arg)
-                pairs = self._read_file(path, **kwargs)
-                data_header_pairs += pairs
+                data_header_pairs.append(path)
 
             # Directory
             elif (isinstance(arg, six.string_types) and
                   os.path.isdir(os.path.expanduser(arg))):
                 path = os.path.expanduser(arg)
                 files = [os.path.join(path, elem) for elem in os.listdir(path)]
-                for afile in files:
-                    data_header_pairs += self._read_file(afile, **kwargs)
+                data_header_pairs += files
 
             # Glob
             elif (isinstance(arg, six.string_types) and '*' in arg):
                 files = glob.glob(os.path.expanduser(arg))
-                for afile in files:
-                    data_header_pairs += self._read_file(afile, **kwargs)
+                data_header_pairs += files
 
             # Already a Map
             elif isinstance(arg, GenericMap):
@@ -230,18 +232,32 @@ class MapFactory(BasicRegistrationFactory):
                   _is_url(arg)):
                 url = arg
                 path = download_file(url, get_and_create_download_dir())
-                pairs = self._read_file(path, **kwargs)
-                data_header_pairs += pairs
+                data_header_pairs.append(path)
 
             # A database Entry
-            elif isinstance(arg, DatabaseEntry):
-                data_header_pairs += self._read_file(arg.path, **kwargs)
+            elif _is_database_entry(arg):
+                data_header_pairs.append(arg.path)
 
             else:
                 raise ValueError("File not found or invalid input")
 
             i += 1
 
+        # Read the files, keeping the pairs in the order of the arguments
+        files = [item for item in data_header_pairs if isinstance(item, six.string_types)]
+        if parallel is None or (not isinstance(parallel, Executor) and _workers(parallel) == 1):
+            file_pairs = iter([self._read_file(fname, **kwargs) for fname in files])
+        else:
+            file_pairs = iter(parallel_map(functools.partial(_read_file, **kwargs), files,
+                                           parallel))
+        pairs = list()
+        for item in data_header_pairs:
+            if isinstance(item, six.string_types):
+                pairs += next(file_pairs)
+            else:
+                pairs.append(item)
+        data_header_pairs = pairs
+
         # TODO:
         # In the end, if there are already maps it should be put in the same
         # order as the input, currently they are not.
@@ -271,10 +287,18 @@ class MapFactory(BasicRegistrationFactory):
         silence_errors : boolean, optional
             If set, ignore data-header pairs which cause an exception.
 
+        parallel : `int`, `bool` or `concurrent.futures.Executor`, optional
+            Read and decompress files in this many worker processes, in as
+            many processes as there are CPUs if `True`, or in an executor.
+            The maps are returned in the same order as when the files are
+            read one after the other. Defaults to reading the files in the
+            calling process.
+
         Notes
         -----
         Extra keyword arguments are passed through to `sunpy.io.read_file` such
-        as `memmap` for FITS files.
+        as ``memmap`` for FITS files or ``resolution_level`` and ``region`` for
+        JPEG2000 files.
         """
 
         # Hack to get around Python 2.x not backporting PEP 3102.
@@ -289,8 +313,14 @@ class MapFactory(BasicRegistrationFactory):
 
         sequence = kwargs.pop('sequence', False)
         silence_errors = kwargs.pop('silence_errors', False)
+        parallel = kwargs.pop('parallel', None)
+
+        data_header_pairs, already_maps = self._parse_args(*args, parallel=parallel, **kwargs)
 
-        data_header_pairs, already_maps = self._parse_args(*args, **kwargs)
+        # Keywords which only affect how files are read are not passed on to
+        # the map classes.
+        for key in _READER_KWARGS:
+            kwargs.pop(key, None)
 
         new_maps = list()
 
@@ -333,31 +363,44 @@ class MapFactory(BasicRegistrationFactory):
         return new_maps
 
     def _check_registered_widgets(self, data, meta, **kwargs):
+        # The sources register themselves when they are imported, which is
+        # deferred until the first map is created.
+        import sunpy.map.sources
 
-        candidate_widget_types = list()
+        WidgetType = self._get_matching_widget_type(data, meta, **kwargs)
 
-        for key in self.registry:
+        return WidgetType(data, meta, **kwargs)
 
-            # Call the registered validation function for each registered class
-            if self.registry[key](data, meta, **kwargs):
-                candidate_widget_types.append(key)
+    def _dispatch_signature(self, data, meta, **kwargs):
+        return header_signature(meta, self.dispatch_keys)
 
-        n_matches = len(candidate_widget_types)
+    def _validates_signature(self, WidgetType):
+        # Other map types, including those defined in the tests of the
+        # sources, are validated for every map.
+        return WidgetType.__module__ in _SOURCE_MODULES
 
-        if n_matches == 0:
-            if self.default_widget_type is None:
-                raise NoMatchError("No types match specified arguments and no default is set.")
-            else:
-                candidate_widget_types = [self.default_widget_type]
-        elif n_matches > 1:
-            raise MultipleMatchError("Too many candidate types identified ({0})."
-                                     "Specify enough keywords to guarantee unique type"
-                                     "identification.".format(n_matches))
 
-        # Only one is found
-        WidgetType = candidate_widget_types[0]
+def _read_file(fname, **kwargs):
+    """
+    The (data, meta) pairs of the images in a file.
 
-        return WidgetType(data, meta, **kwargs)
+    This is a function rather than a method so that files can be read in
+    worker processes.
+    """
+    # File gets read here.  This needs to be generic enough to seamlessly
+    # call a fits file or a jpeg2k file, etc
+    pairs = read_file(fname, **kwargs)
+
+    new_pairs = []
+    for pair in pairs:
+        filedata, filemeta = pair
+        assert isinstance(filemeta, FileHeader)
+        # This tests that the data is more than 1D
+        if len(np.shape(filedata)) > 1:
+            data = filedata
+            meta = MetaDict(filemeta)
+            new_pairs.append((data, meta))
+    return new_pairs
 
 
 def _is_url(arg):
@@ -368,6 +411,13 @@ def _is_url(arg):
     return True
 
 
+def _is_database_entry(arg):
+    # The database is slow to import and a DatabaseEntry can only exist once
+    # it has been imported, so it is not imported here.
+    tables = sys.modules.get('sunpy.database.tables')
+    return tables is not None and isinstance(arg, tables.DatabaseEntry)
+
+
 class InvalidMapInput(ValueError):
     """Exception to raise when input variable is not a Map instance and does
     not point to a valid Map input file."""
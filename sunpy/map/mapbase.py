@@ -8,17 +8,16 @@ from collections import namedtuple
 import textwrap
 
 import numpy as np
-import matplotlib.pyplot as plt
-from matplotlib import patches, cm, colors
+# pyplot, WCSAxes and sunpy.cm are slow to import, so the methods which plot
+# import them when they are called.
+from matplotlib import cm, colors
 
 import astropy.wcs
 import astropy.units as u
-from astropy.visualization.wcsaxes import WCSAxes
 from astropy.coordinates import SkyCoord, UnitSphericalRepresentation
 
 import sunpy.io as io
 import sunpy.coordinates
-import sunpy.cm
 from sunpy.util.decorators import deprecated
 from sunpy import config
 from sunpy.extern import six
@@ -26,8 +25,8 @@ from sunpy.visualization import toggle_pylab, wcsaxes_compat, axis_labels_from_c
 from sunpy.sun import constants
 from sunpy.sun import sun
 from sunpy.time import parse_time, is_time
-from sunpy.image.transform import affine_transform
-from sunpy.image.rescale import reshape_image_to_4d_superpixel
+from sunpy.image.transform import warp_affine
+from sunpy.image.rescale import reduce_superpixels
 from sunpy.image.rescale import resample as sunpy_image_resample
 from sunpy.coordinates import get_sun_B0, get_sun_L0, get_sunearth_distance
 
@@ -37,6 +36,11 @@ TIME_FORMAT = config.get("general", "time_format")
 PixelPair = namedtuple('PixelPair', 'x y')
 SpatialPair = namedtuple('SpatialPair', 'axis1 axis2')
 
+# The number of pixels of the missing value around the data for spline
+# interpolation in rotate, beyond which the padding rotate used to do has a
+# negligible effect on the interpolated values.
+_ROTATE_SPLINE_MARGIN = 16
+
 __all__ = ['GenericMap']
 
 
@@ -309,6 +313,7 @@ class GenericMap(NDData):
         axes. See http://wcsaxes.readthedocs.io for more information.
         """
         # This code is reused from Astropy
+        from astropy.visualization.wcsaxes import WCSAxes
 
         return WCSAxes, {'wcs': self.wcs}
 
@@ -906,10 +911,27 @@ class GenericMap(NDData):
         io.write_file(filepath, self.data, self.meta, filetype=filetype,
                       **kwargs)
 
+    def save_pyramid(self, path, **kwargs):
+        """Saves a multi-resolution pyramid of the map to a FITS file or a
+        directory of tiles.
+
+        Parameters
+        ----------
+        path : str
+            Location to save the pyramid to.
+
+        Notes
+        -----
+        Keyword arguments are passed onto `~sunpy.map.write_pyramid`.
+        """
+        # Imported here as sunpy.map.pyramid needs the Map factory
+        from sunpy.map.pyramid import write_pyramid
+        write_pyramid(self, path, **kwargs)
+
 # #### Image processing routines #### #
 
     @u.quantity_input(dimensions=u.pixel)
-    def resample(self, dimensions, method='linear'):
+    def resample(self, dimensions, method='linear', out=None):
         """Returns a new Map that has been resampled up or down
 
         Arbitrary resampling of the Map to new dimension sizes.
@@ -927,30 +949,36 @@ class GenericMap(NDData):
         method : {'neighbor' | 'nearest' | 'linear' | 'spline'}
             Method to use for resampling interpolation.
                 * neighbor - Closest value from original data
-                * nearest and linear - Uses n x 1-D interpolations using
-                  scipy.interpolate.interp1d
-                * spline - Uses ndimage.map_coordinates
+                * nearest and linear - 1-D interpolations along each axis,
+                  like those of scipy.interpolate.interp1d
+                * spline - Cubic spline interpolation, like that of
+                  ndimage.map_coordinates
+        out : `numpy.ndarray`, optional
+            The array to write the resampled data to, which becomes the data
+            of the new map. It must have the shape ``(dimensions[1],
+            dimensions[0])``.
 
         Returns
         -------
         out : `~sunpy.map.GenericMap` or subclass
             A new Map which has been resampled to the desired dimensions.
 
+        See Also
+        --------
+        sunpy.image.rescale.resample : The routine this method calls, which
+        caches the interpolation weights for maps of the same shape.
+
         References
         ----------
         * `Rebinning <https://scipy-cookbook.readthedocs.io/items/Rebinning.html>`_
         """
 
-        # Note: because the underlying ndarray is transposed in sense when
-        #   compared to the Map, the ndarray is transposed, resampled, then
-        #   transposed back
+        # Note: the dimensions are in (x, y) order, the reverse of the order
+        #   of the axes of the underlying ndarray
         # Note: "center" defaults to True in this function because data
         #   coordinates in a Map are at pixel centers
-
-        # Make a copy of the original data and perform resample
-        new_data = sunpy_image_resample(self.data.copy().T, dimensions,
-                                        method, center=True)
-        new_data = new_data.T
+        new_data = sunpy_image_resample(self.data, u.Quantity(dimensions).value[::-1],
+                                        method, center=True, out=out)
 
         scale_factor_x = float(self.dimensions[0] / dimensions[0])
         scale_factor_y = float(self.dimensions[1] / dimensions[1])
@@ -977,7 +1005,7 @@ class GenericMap(NDData):
         return new_map
 
     def rotate(self, angle=None, rmatrix=None, order=4, scale=1.0,
-               recenter=False, missing=0.0, use_scipy=False):
+               recenter=False, missing=0.0, use_scipy=False, out=None, dtype=None):
         """
         Returns a new rotated and rescaled map.
 
@@ -1019,6 +1047,15 @@ class GenericMap(NDData):
             :func:`scipy.ndimage.interpolation.affine_transform`, otherwise it
             uses the :func:`skimage.transform.warp`.
             Default: False, unless scikit-image can't be imported
+        out : `numpy.ndarray`, optional
+            The array to write the rotated data to, which becomes the data of
+            the new map. It must have the shape of the rotated data, e.g. the
+            shape of the data of an earlier rotation of a map of the same shape
+            by the same angle.
+        dtype : `numpy.dtype`, optional
+            The data type of the rotated data if ``out`` is not given.
+            Defaults to the data type of floating point data, in native byte
+            order, and to `numpy.float64` for integer data.
 
         Returns
         -------
@@ -1028,7 +1065,7 @@ class GenericMap(NDData):
 
         See Also
         --------
-        sunpy.image.transform.affine_transform : The routine this method calls
+        sunpy.image.transform.warp_affine : The routine this method calls
         for the rotation.
 
         Notes
@@ -1039,6 +1076,10 @@ class GenericMap(NDData):
         See :func:`sunpy.image.transform.affine_transform` for details on the
         transformations, situations when the underlying data is modified prior
         to rotation, and differences from IDL's rot().
+
+        The data is interpolated directly onto the grid of the rotated map,
+        without padding it first. With scipy the interpolation writes straight
+        into the output array.
         """
         if angle is not None and rmatrix is not None:
             raise ValueError("You cannot specify both an angle and a matrix")
@@ -1071,6 +1112,50 @@ class GenericMap(NDData):
         if order not in range(6):
             raise ValueError("Order must be between 0 and 5")
 
+        if angle is not None:
+            # Calculate the parameters for the affine_transform
+            c = np.cos(np.deg2rad(angle))
+            s = np.sin(np.deg2rad(angle))
+            rmatrix = np.array([[c, -s],
+                                [s, c]])
+
+        new_shape, matrix, offset, margin, new_meta = self._rotation(rmatrix, scale, recenter,
+                                                                     order)
+
+        if out is None:
+            if dtype is None:
+                dtype = self.data.dtype.type if self.data.dtype.kind == 'f' else np.float64
+            out = np.empty(new_shape, dtype=dtype)
+        elif out.shape != new_shape:
+            raise ValueError("The output array must have a shape of {0}, not {1}."
+                             .format(new_shape, out.shape))
+
+        # Apply the rotation to the image data
+        new_data = warp_affine(self.data, matrix, offset, order=order, missing=missing,
+                               use_scipy=use_scipy, out=out, margin=margin)
+
+        # Create new map with the modification
+        new_map = self._new_instance(new_data, new_meta, self.plot_settings)
+
+        return new_map
+
+    def _rotation(self, rmatrix, scale, recenter, order):
+        """
+        The geometry of a rotation of the map by `rotate`.
+
+        Returns
+        -------
+        new_shape : `tuple`
+            The shape of the rotated data.
+        matrix, offset : `numpy.ndarray`
+            The transform from the (row, column) pixels of the rotated data to
+            those of the data, as taken by
+            `~sunpy.image.transform.warp_affine`.
+        margin : `numpy.ndarray`
+            The margin of missing values to interpolate the data with.
+        new_meta : `~sunpy.util.MetaDict`
+            The metadata of the rotated map.
+        """
         # The FITS-WCS transform is by definition defined around the
         # reference coordinate in the header.
         lon, lat = self._get_lon_lat(self.reference_coordinate.frame)
@@ -1078,61 +1163,43 @@ class GenericMap(NDData):
 
         # Copy meta data
         new_meta = self.meta.copy()
-        if angle is not None:
-            # Calculate the parameters for the affine_transform
-            c = np.cos(np.deg2rad(angle))
-            s = np.sin(np.deg2rad(angle))
-            rmatrix = np.array([[c, -s],
-                                [s, c]])
 
         # Calculate the shape in pixels to contain all of the image data
         extent = np.max(np.abs(np.vstack((self.data.shape @ rmatrix,
                                           self.data.shape @ rmatrix.T))), axis=0)
 
-        # Calculate the needed padding or unpadding
+        # The array grows or shrinks by the same number of pixels on both
+        # sides, so the centre of the array stays the same
         diff = np.asarray(np.ceil((extent - self.data.shape) / 2), dtype=int).ravel()
-        # Pad the image array
-        pad_x = int(np.max((diff[1], 0)))
-        pad_y = int(np.max((diff[0], 0)))
+        new_shape = (self.data.shape[0] + 2 * diff[0], self.data.shape[1] + 2 * diff[1])
 
-        new_data = np.pad(self.data,
-                          ((pad_y, pad_y), (pad_x, pad_x)),
-                          mode='constant',
-                          constant_values=(missing, missing))
-        new_meta['crpix1'] += pad_x
-        new_meta['crpix2'] += pad_y
+        # All of the following pixel calculations use a pixel origin of 0 and
+        # (y, x) order, i.e. the order of the array indices
+        array_center = (np.array(self.data.shape) - 1) / 2.0
+        new_array_center = (np.array(new_shape) - 1) / 2.0
 
-        # All of the following pixel calculations use a pixel origin of 0
+        # The axis of rotation is the reference pixel
+        pixel_rotation_center = (u.Quantity(self.reference_pixel).value - 1)[::-1]
 
-        pixel_array_center = (np.flipud(new_data.shape) - 1) / 2.0
+        # The output pixel p is taken from the input pixel
+        # rmatrix / scale @ (p - new_array_center) + center, where the center
+        # is the rotation center if the map is recentered and the center of
+        # the array otherwise
+        matrix = np.asarray(rmatrix) / scale
+        center = pixel_rotation_center if recenter else array_center
+        offset = center - matrix @ new_array_center
 
-        # Create a temporary map so we can use it for the data to pixel calculation.
-        temp_map = self._new_instance(new_data, new_meta, self.plot_settings)
-
-        # Convert the axis of rotation from data coordinates to pixel coordinates
-        pixel_rotation_center = u.Quantity(temp_map.world_to_pixel(self.reference_coordinate,
-                                                                   origin=0)).value
-        del temp_map
+        # Where the array grows, surround the data with enough of the missing
+        # value for its edges to be interpolated into it, and for higher
+        # order splines to settle, as if the data had been padded.
+        margin = np.clip(diff, 0, 1 if order <= 1 else _ROTATE_SPLINE_MARGIN)
 
         if recenter:
-            pixel_center = pixel_rotation_center
-        else:
-            pixel_center = pixel_array_center
-
-        # Apply the rotation to the image data
-        new_data = affine_transform(new_data.T,
-                                    np.asarray(rmatrix),
-                                    order=order, scale=scale,
-                                    image_center=np.flipud(pixel_center),
-                                    recenter=recenter, missing=missing,
-                                    use_scipy=use_scipy).T
-
-        if recenter:
-            new_reference_pixel = pixel_array_center
+            new_reference_pixel = new_array_center[::-1]
         else:
             # Calculate new pixel coordinates for the rotation center
-            new_reference_pixel = pixel_center + np.dot(rmatrix,
-                                                        pixel_rotation_center - pixel_center)
+            new_reference_pixel = (new_array_center[::-1] +
+                                   np.dot(rmatrix, (pixel_rotation_center - array_center)[::-1]))
             new_reference_pixel = np.array(new_reference_pixel).ravel()
 
         # Define the new reference_pixel
@@ -1141,16 +1208,6 @@ class GenericMap(NDData):
         new_meta['crpix1'] = new_reference_pixel[0] + 1  # FITS pixel origin is 1
         new_meta['crpix2'] = new_reference_pixel[1] + 1  # FITS pixel origin is 1
 
-        # Unpad the array if necessary
-        unpad_x = -np.min((diff[1], 0))
-        if unpad_x > 0:
-            new_data = new_data[:, unpad_x:-unpad_x]
-            new_meta['crpix1'] -= unpad_x
-        unpad_y = -np.min((diff[0], 0))
-        if unpad_y > 0:
-            new_data = new_data[unpad_y:-unpad_y, :]
-            new_meta['crpix2'] -= unpad_y
-
         # Calculate the new rotation matrix to store in the header by
         # "subtracting" the rotation matrix used in the rotate from the old one
         # That being calculate the dot product of the old header data with the
@@ -1175,12 +1232,9 @@ class GenericMap(NDData):
         new_meta.pop('CD2_1', None)
         new_meta.pop('CD2_2', None)
 
-        # Create new map with the modification
-        new_map = self._new_instance(new_data, new_meta, self.plot_settings)
+        return new_shape, matrix, offset, margin, new_meta
 
-        return new_map
-
-    def submap(self, bottom_left, top_right=None):
+    def submap(self, bottom_left, top_right=None, copy=True):
         """
         Returns a submap of the map defined by the rectangle given by the
         ``[bottom_left, top_right]`` coordinates.
@@ -1195,6 +1249,11 @@ class GenericMap(NDData):
         top_right : `astropy.units.Quantity` or `~astropy.coordinates.SkyCoord`
             The top_right coordinate of the rectangle. Can only be omitted if
             ``bottom_left`` has shape ``(2,)``.
+        copy : `bool`, optional
+            If `False`, the data and mask of the submap are read-only views of
+            those of this map rather than copies. Changing them then needs a
+            copy, e.g. ``submap.data.copy()``, so this map is never changed
+            through the submap. Default: True
 
         Returns
         -------
@@ -1202,6 +1261,10 @@ class GenericMap(NDData):
             A new map instance is returned representing to specified
             sub-region.
 
+        See Also
+        --------
+        submaps : Cuts many submaps out of the map at once.
+
         Examples
         --------
         >>> import astropy.units as u
@@ -1259,83 +1322,168 @@ class GenericMap(NDData):
 
         """
 
-        if isinstance(bottom_left, (astropy.coordinates.SkyCoord,
-                                    astropy.coordinates.BaseCoordinateFrame)):
-            if not top_right:
-                if bottom_left.shape[0] != 2:
-                    raise ValueError("If top_right is not specified bottom_left must have length two.")
-                else:
-                    lon, lat = self._get_lon_lat(bottom_left)
-                    top_right = u.Quantity([lon[1], lat[1]])
-                    bottom_left = u.Quantity([lon[0], lat[0]])
-            else:
-                bottom_left = u.Quantity(self._get_lon_lat(bottom_left))
-                top_right = u.Quantity(self._get_lon_lat(top_right))
-
-            top_left = u.Quantity([bottom_left[0], top_right[1]])
-            bottom_right = u.Quantity([top_right[0], bottom_left[1]])
-
-            corners = u.Quantity([bottom_left, bottom_right, top_left, top_right])
-            coord = SkyCoord(corners, frame=self.coordinate_frame)
-            pixel_corners = self.world_to_pixel(coord)
-
-            # Round the pixel values, we use floor+1 so that we always have at
-            # least one pixel width of data.
-            x_pixels = u.Quantity([np.min(pixel_corners.x), np.max(pixel_corners.x)]).value
-            x_pixels[0] = np.ceil(x_pixels[0])
-            x_pixels[1] = np.floor(x_pixels[1] + 1)
-            y_pixels = u.Quantity([np.min(pixel_corners.y), np.max(pixel_corners.y)]).value
-            y_pixels[0] = np.ceil(y_pixels[0])
-            y_pixels[1] = np.floor(y_pixels[1] + 1)
-
-        elif (isinstance(bottom_left, u.Quantity) and bottom_left.unit.is_equivalent(u.pix) and
-              isinstance(top_right, u.Quantity) and bottom_left.unit.is_equivalent(u.pix)):
-
+        if isinstance(bottom_left, u.Quantity) and bottom_left.unit.is_equivalent(u.pix):
             warnings.warn("GenericMap.submap now takes pixel values as `bottom_left`"
                           " and `top_right` not `range_a` and `range_b`", Warning)
+        x_pixels, y_pixels = self._submap_pixels(bottom_left, top_right)
+        return self._submap_from_pixels(x_pixels, y_pixels, self.reference_pixel, copy)
 
-            x_pixels = u.Quantity([bottom_left[0], top_right[0]]).value
-            y_pixels = u.Quantity([top_right[1], bottom_left[1]]).value
-
-        else:
-            raise ValueError("Invalid input, bottom_left and top_right must either be SkyCoord or Quantity in pixels.")
+    def submaps(self, boxes, copy=True):
+        """
+        Returns the submaps of the map defined by many rectangles.
 
-        # Sort the pixel values so we always slice in the correct direction
-        x_pixels.sort()
-        y_pixels.sort()
+        The corners of all of the rectangles given by coordinates are converted
+        to pixels at once, which is much faster than calling
+        `~sunpy.map.GenericMap.submap` for each rectangle.
 
-        x_pixels = np.array(x_pixels)
-        y_pixels = np.array(y_pixels)
+        Parameters
+        ----------
+        boxes : iterable
+            The ``(bottom_left, top_right)`` pairs of the rectangles, as taken
+            by `~sunpy.map.GenericMap.submap`. ``top_right`` may be `None`
+            if ``bottom_left`` is a `~astropy.coordinates.SkyCoord` of shape
+            ``(2,)``.
+        copy : `bool`, optional
+            If `False`, the data and masks of the submaps are read-only views
+            of those of this map, see `~sunpy.map.GenericMap.submap`.
+            Default: True
 
-        # Clip pixel values to max of array, prevents negative
-        # indexing
-        x_pixels[np.less(x_pixels, 0)] = 0
-        x_pixels[np.greater(x_pixels, self.data.shape[1])] = self.data.shape[1]
+        Returns
+        -------
+        `list`
+            The submaps, in the order of the rectangles.
 
-        y_pixels[np.less(y_pixels, 0)] = 0
-        y_pixels[np.greater(y_pixels, self.data.shape[0])] = self.data.shape[0]
+        Examples
+        --------
+        >>> import astropy.units as u
+        >>> from astropy.coordinates import SkyCoord
+        >>> import sunpy.map
+        >>> import sunpy.data.sample  # doctest: +REMOTE_DATA
+        >>> aia = sunpy.map.Map(sunpy.data.sample.AIA_171_IMAGE)  # doctest: +REMOTE_DATA
+        >>> boxes = [(SkyCoord(x*u.arcsec, -100*u.arcsec, frame=aia.coordinate_frame),
+        ...           SkyCoord((x + 100)*u.arcsec, 0*u.arcsec, frame=aia.coordinate_frame))
+        ...          for x in range(-500, 500, 100)]  # doctest: +REMOTE_DATA
+        >>> cutouts = aia.submaps(boxes, copy=False)  # doctest: +REMOTE_DATA
+        >>> len(cutouts)  # doctest: +REMOTE_DATA
+        10
+        """
+        x_pixels, y_pixels = self._boxes_pixels(boxes)
+        reference_pixel = self.reference_pixel
+        return [self._submap_from_pixels(x, y, reference_pixel, copy)
+                for x, y in zip(x_pixels, y_pixels)]
 
+    def _submap_from_pixels(self, x_pixels, y_pixels, reference_pixel, copy=True):
+        """
+        The submap of the pixel ranges ``(x_pixels, y_pixels)``.
+        """
         # Get ndarray representation of submap
         xslice = slice(int(x_pixels[0]), int(x_pixels[1]))
         yslice = slice(int(y_pixels[0]), int(y_pixels[1]))
-        new_data = self.data[yslice, xslice].copy()
+        new_data = self.data[yslice, xslice]
+        new_mask = self.mask[yslice, xslice] if self.mask is not None else None
+        if copy:
+            new_data = new_data.copy()
+            if new_mask is not None:
+                new_mask = new_mask.copy()
+        else:
+            # The views must not be used to change the data of this map
+            new_data.flags.writeable = False
+            if new_mask is not None:
+                new_mask.flags.writeable = False
 
         # Make a copy of the header with updated centering information
         new_meta = self.meta.copy()
-        new_meta['crpix1'] = self.reference_pixel.x.value - x_pixels[0]
-        new_meta['crpix2'] = self.reference_pixel.y.value - y_pixels[0]
+        new_meta['crpix1'] = reference_pixel.x.value - x_pixels[0]
+        new_meta['crpix2'] = reference_pixel.y.value - y_pixels[0]
         new_meta['naxis1'] = new_data.shape[1]
         new_meta['naxis2'] = new_data.shape[0]
 
-        # Create new map instance
-        if self.mask is not None:
-            new_mask = self.mask[yslice, xslice].copy()
-            # Create new map with the modification
-            new_map = self._new_instance(new_data, new_meta, self.plot_settings, mask=new_mask)
-            return new_map
         # Create new map with the modification
-        new_map = self._new_instance(new_data, new_meta, self.plot_settings)
-        return new_map
+        if new_mask is not None:
+            return self._new_instance(new_data, new_meta, self.plot_settings, mask=new_mask)
+        return self._new_instance(new_data, new_meta, self.plot_settings)
+
+    def _submap_pixels(self, bottom_left, top_right=None):
+        """
+        The pixel ranges ``(x_pixels, y_pixels)`` of the region selected by
+        the arguments of `~sunpy.map.GenericMap.submap`, clipped to the map.
+        """
+        x_pixels, y_pixels = self._boxes_pixels([(bottom_left, top_right)])
+        return x_pixels[0], y_pixels[0]
+
+    def _boxes_pixels(self, boxes):
+        """
+        The pixel ranges, as arrays of shape ``(n, 2)``, of the ``n`` regions
+        selected by ``(bottom_left, top_right)`` pairs of arguments of
+        `~sunpy.map.GenericMap.submap`, clipped to the map.
+        """
+        boxes = list(boxes)
+        x_pixels = np.empty((len(boxes), 2))
+        y_pixels = np.empty((len(boxes), 2))
+
+        # The indices and corners of the regions given by coordinates, whose
+        # corners are converted to pixels together
+        world_boxes = []
+        for i, (bottom_left, top_right) in enumerate(boxes):
+            if isinstance(bottom_left, (astropy.coordinates.SkyCoord,
+                                        astropy.coordinates.BaseCoordinateFrame)):
+                if not top_right:
+                    if bottom_left.shape[0] != 2:
+                        raise ValueError("If top_right is not specified bottom_left must have length two.")
+                    else:
+                        lon, lat = self._get_lon_lat(bottom_left)
+                        top_right = u.Quantity([lon[1], lat[1]])
+                        bottom_left = u.Quantity([lon[0], lat[0]])
+                else:
+                    bottom_left = u.Quantity(self._get_lon_lat(bottom_left))
+                    top_right = u.Quantity(self._get_lon_lat(top_right))
+                world_boxes.append((i, bottom_left, top_right))
+
+            elif (isinstance(bottom_left, u.Quantity) and bottom_left.unit.is_equivalent(u.pix) and
+                  isinstance(top_right, u.Quantity) and bottom_left.unit.is_equivalent(u.pix)):
+
+                x_pixels[i] = u.Quantity([bottom_left[0], top_right[0]]).value
+                y_pixels[i] = u.Quantity([top_right[1], bottom_left[1]]).value
+
+            else:
+                raise ValueError("Invalid input, bottom_left and top_right must either be SkyCoord or Quantity in pixels.")
+
+        if world_boxes:
+            index, bottom_left, top_right = zip(*world_boxes)
+            index = list(index)
+            bottom_left = u.Quantity(bottom_left)
+            top_right = u.Quantity(top_right)
+
+            # The bottom left, bottom right, top left and top right corners
+            lon = u.Quantity([bottom_left[:, 0], top_right[:, 0],
+                              bottom_left[:, 0], top_right[:, 0]])
+            lat = u.Quantity([bottom_left[:, 1], bottom_left[:, 1],
+                              top_right[:, 1], top_right[:, 1]])
+            coord = SkyCoord(lon.T.ravel(), lat.T.ravel(), frame=self.coordinate_frame)
+            pixel_corners = self.world_to_pixel(coord)
+            corners_x = pixel_corners.x.value.reshape(-1, 4)
+            corners_y = pixel_corners.y.value.reshape(-1, 4)
+
+            # Round the pixel values, we use floor+1 so that we always have at
+            # least one pixel width of data.
+            x_pixels[index, 0] = np.ceil(corners_x.min(axis=1))
+            x_pixels[index, 1] = np.floor(corners_x.max(axis=1) + 1)
+            y_pixels[index, 0] = np.ceil(corners_y.min(axis=1))
+            y_pixels[index, 1] = np.floor(corners_y.max(axis=1) + 1)
+
+        # Sort the pixel values so we always slice in the correct direction
+        x_pixels.sort(axis=1)
+        y_pixels.sort(axis=1)
+
+        # Clip pixel values to max of array, prevents negative
+        # indexing
+        x_pixels[np.less(x_pixels, 0)] = 0
+        x_pixels[np.greater(x_pixels, self.data.shape[1])] = self.data.shape[1]
+
+        y_pixels[np.less(y_pixels, 0)] = 0
+        y_pixels[np.greater(y_pixels, self.data.shape[0])] = self.data.shape[0]
+
+        return x_pixels, y_pixels
 
     @u.quantity_input(dimensions=u.pixel, offset=u.pixel)
     def superpixel(self, dimensions, offset=(0, 0)*u.pixel, func=np.sum):
@@ -1358,46 +1506,50 @@ class GenericMap(NDData):
             keyword (see the description of `~numpy.sum` for an example.)
             The default value of 'func' is `~numpy.sum`; using this causes
             superpixel to sum over (dimension[0], dimension[1]) pixels of the
-            original map.
+            original map. `~numpy.sum`, `~numpy.mean`, `~numpy.min` and
+            `~numpy.max` are applied to all the pixels of a superpixel at once
+            and skip masked pixels without making a masked array.
 
         Returns
         -------
         out : `~sunpy.map.GenericMap` or subclass
             A new Map which has superpixels of the required size.
 
+        See Also
+        --------
+        sunpy.image.rescale.reduce_superpixels : The routine this method calls,
+        which works on a view of the data.
+
         References
         ----------
         | `Summarizing blocks of an array using a moving window <https://mail.scipy.org/pipermail/numpy-discussion/2010-July/051760.html>`_
         """
 
-        # Note: because the underlying ndarray is transposed in sense when
-        #   compared to the Map, the ndarray is transposed, resampled, then
-        #   transposed back.
-        # Note: "center" defaults to True in this function because data
-        #   coordinates in a Map are at pixel centers.
-
         if (offset.value[0] < 0) or (offset.value[1] < 0):
             raise ValueError("Offset is strictly non-negative.")
 
-        # Make a copy of the original data, perform reshaping, and apply the
-        # function.
-        if self.mask is not None:
-            reshaped = reshape_image_to_4d_superpixel(np.ma.array(self.data.copy(), mask=self.mask),
-                                                      [dimensions.value[1], dimensions.value[0]],
-                                                      [offset.value[1], offset.value[0]])
-        else:
-            reshaped = reshape_image_to_4d_superpixel(self.data.copy(),
-                                                      [dimensions.value[1], dimensions.value[0]],
-                                                      [offset.value[1], offset.value[0]])
-        new_array = func(func(reshaped, axis=3), axis=1)
+        # Apply the function to a view of the data, the dimensions and offset
+        # are in the (y, x) order of the underlying ndarray
+        new_data, new_mask = reduce_superpixels(self.data,
+                                                [dimensions.value[1], dimensions.value[0]],
+                                                [offset.value[1], offset.value[0]],
+                                                func, mask=self.mask)
+        new_meta = self._superpixel_meta(dimensions, offset, new_data.shape)
 
-        # Update image scale and number of pixels
+        # Create new map with the modified data
+        new_map = self._new_instance(new_data, new_meta, self.plot_settings, mask=new_mask)
+        return new_map
 
+    def _superpixel_meta(self, dimensions, offset, new_shape):
+        """
+        The metadata of a superpixel map of this map with data of shape
+        ``new_shape``.
+        """
         # create copy of new meta data
         new_meta = self.meta.copy()
 
-        new_nx = new_array.shape[1]
-        new_ny = new_array.shape[0]
+        new_nx = new_shape[1]
+        new_ny = new_shape[0]
 
         # Update metadata
         new_meta['cdelt1'] = (dimensions[0] * self.scale[0]).value
@@ -1412,18 +1564,7 @@ class GenericMap(NDData):
         lon, lat = self._get_lon_lat(self.center.frame)
         new_meta['crval1'] = lon.to(self.spatial_units[0]).value + 0.5*(offset[0]*self.scale[0]).to(self.spatial_units[0]).value
         new_meta['crval2'] = lat.to(self.spatial_units[1]).value + 0.5*(offset[1]*self.scale[1]).to(self.spatial_units[1]).value
-
-        # Create new map instance
-        if self.mask is not None:
-            new_data = np.ma.getdata(new_array)
-            new_mask = np.ma.getmask(new_array)
-        else:
-            new_data = new_array
-            new_mask = None
-
-        # Create new map with the modified data
-        new_map = self._new_instance(new_data, new_meta, self.plot_settings, mask=new_mask)
-        return new_map
+        return new_meta
 
 # #### Visualization #### #
 
@@ -1482,6 +1623,7 @@ class GenericMap(NDData):
         -----
         Keyword arguments are passed onto `matplotlib.patches.Circle`.
         """
+        from matplotlib import patches
 
         if not axes:
             axes = wcsaxes_compat.gca_wcs(self.wcs)
@@ -1539,6 +1681,7 @@ class GenericMap(NDData):
         `~matplotlib.patches.Rectangle` instance.
 
         """
+        import matplotlib.pyplot as plt
 
         if not axes:
             axes = plt.gca()
@@ -1627,6 +1770,7 @@ class GenericMap(NDData):
             Matplotlib Any additional imshow arguments that should be used
             when plotting.
         """
+        import matplotlib.pyplot as plt
 
         # Create a figure and add title and axes
         figure = plt.figure(frameon=not basic_plot)
@@ -1665,7 +1809,7 @@ class GenericMap(NDData):
         figure.show()
 
     @toggle_pylab
-    def plot(self, annotate=True, axes=None, title=True, **imshow_kwargs):
+    def plot(self, annotate=True, axes=None, title=True, use_lut=False, **imshow_kwargs):
         """
         Plots the map object using matplotlib, in a method equivalent
         to plt.imshow() using nearest neighbour interpolation.
@@ -1680,6 +1824,12 @@ class GenericMap(NDData):
             If provided the image will be plotted on the given axes. Else the
             current matplotlib axes will be used.
 
+        use_lut : bool
+            If True, the data is colormapped with a precomputed lookup table
+            (see `sunpy.cm.apply_colormap`) and drawn as an RGBA image, which
+            is faster for large images. The colormap and norm are kept on the
+            returned image so colorbars still work.
+
         **imshow_kwargs  : dict
             Any additional imshow arguments that should be used
             when plotting.
@@ -1696,6 +1846,8 @@ class GenericMap(NDData):
         >>> aia.draw_grid()   # doctest: +SKIP
 
         """
+        import matplotlib.pyplot as plt
+        import sunpy.cm
 
         # extract hiddden kwarg
         _basic_plot = imshow_kwargs.pop("_basic_plot", False)
@@ -1744,9 +1896,21 @@ class GenericMap(NDData):
         imshow_args.update(imshow_kwargs)
 
         if self.mask is None:
-            ret = axes.imshow(self.data, **imshow_args)
+            data = self.data
         else:
-            ret = axes.imshow(np.ma.array(np.asarray(self.data), mask=self.mask), **imshow_args)
+            data = np.ma.array(np.asarray(self.data), mask=self.mask)
+
+        if use_lut:
+            norm = imshow_args.get('norm')
+            norm = colors.Normalize() if norm is None else copy.deepcopy(norm)
+            for limit in ('vmin', 'vmax'):
+                if imshow_args.get(limit) is not None:
+                    setattr(norm, limit, imshow_args.pop(limit))
+            norm.autoscale_None(data)
+            imshow_args['norm'] = norm
+            data = sunpy.cm.apply_colormap(data, imshow_args.get('cmap'), norm)
+
+        ret = axes.imshow(data, **imshow_args)
 
         if wcsaxes_compat.is_wcsaxes(axes):
             wcsaxes_compat.default_wcs_grid(axes, units=self.spatial_units,
@@ -6,13 +6,11 @@ from copy import deepcopy
 import warnings
 
 import numpy as np
-import matplotlib.animation
 import numpy.ma as ma
 
 import astropy.units as u
 
 from sunpy.map import GenericMap
-from sunpy.visualization.animator import MapSequenceAnimator
 from sunpy.visualization import wcsaxes_compat
 from sunpy.visualization import axis_labels_from_ctype
 from sunpy.util import expand_list, deprecated
@@ -170,6 +168,8 @@ class MapCube(object):
         >>> plt.show()   # doctest: +SKIP
 
         """
+        import matplotlib.animation
+
         if not axes:
             axes = wcsaxes_compat.gca_wcs(self.maps[0].wcs)
         fig = axes.get_figure()
@@ -298,6 +298,7 @@ class MapCube(object):
         >>> ani = cube.peek(resample=[0.5, 0.5], colorbar=True)   # doctest: +SKIP
         >>> mplani = ani.get_animation()   # doctest: +SKIP
         """
+        from sunpy.visualization.animator import MapSequenceAnimator
 
         if resample:
             if self.all_maps_same_shape():
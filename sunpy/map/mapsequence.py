@@ -5,13 +5,12 @@ from __future__ import absolute_import, division, print_function
 from copy import deepcopy
 
 import numpy as np
-import matplotlib.animation
 import numpy.ma as ma
 
 import astropy.units as u
 
 from sunpy.map import GenericMap
-from sunpy.visualization.animator.mapsequenceanimator import MapSequenceAnimator
+from sunpy.image.rescale import reduce_superpixels
 from sunpy.visualization import wcsaxes_compat
 from sunpy.visualization import axis_labels_from_ctype
 from sunpy.util import expand_list
@@ -163,6 +162,8 @@ class MapSequence(object):
         >>> plt.show()   # doctest: +SKIP
 
         """
+        import matplotlib.animation
+
         if not axes:
             axes = wcsaxes_compat.gca_wcs(self.maps[0].wcs)
         fig = axes.get_figure()
@@ -251,6 +252,11 @@ class MapSequence(object):
             A function to call to overplot extra items on the map plot.
             For more information see `sunpy.visualization.MapSequenceAnimator`.
 
+        prerender : bool
+            Normalize and colormap the frames ahead of time in background
+            threads, which makes playback smoother and allows writing movies
+            with `~sunpy.visualization.animator.MapSequenceAnimator.save_movie`.
+
         Returns
         -------
         mapsequenceanim : `sunpy.visualization.MapSequenceAnimator`
@@ -289,7 +295,14 @@ class MapSequence(object):
         >>> sequence = Map(files, sequence=True)   # doctest: +SKIP
         >>> ani = sequence.peek(resample=[0.5, 0.5], colorbar=True)   # doctest: +SKIP
         >>> mplani = ani.get_animation()   # doctest: +SKIP
+
+        Write the frames straight to a movie file:
+
+        >>> sequence = Map(files, sequence=True)   # doctest: +SKIP
+        >>> ani = sequence.peek(prerender=True)   # doctest: +SKIP
+        >>> ani.save_movie('sequence.mp4', fps=20)   # doctest: +SKIP
         """
+        from sunpy.visualization.animator.mapsequenceanimator import MapSequenceAnimator
 
         if resample:
             if self.all_maps_same_shape():
@@ -304,6 +317,45 @@ class MapSequence(object):
 
         return MapSequenceAnimator(plot_sequence, **kwargs)
 
+    def export_frames(self, filename=None, stream=None, **kwargs):
+        """
+        Render every map in the MapSequence to image files or a raw video
+        stream, without creating matplotlib figures.
+
+        The frames are colormapped and normalized with the plot settings of
+        each map and rendered in parallel by a pool of worker processes.
+
+        Parameters
+        ----------
+        filename : `str`
+            A format string for the names of the image files to write, which
+            is formatted with the frame number as ``index``.
+
+        stream : file-like
+            A binary file-like object to write the frames to as raw, top-down
+            RGBA video.
+
+        Returns
+        -------
+        `list`
+            The names of the files written.
+
+        See Also
+        --------
+        sunpy.visualization.export.export_frames
+
+        Examples
+        --------
+        >>> from sunpy.map import Map
+        >>> sequence = Map(files, sequence=True)   # doctest: +SKIP
+        >>> sequence.export_frames('frames/sequence_{index:05d}.png')   # doctest: +SKIP
+
+        Extra keywords are passed to `sunpy.visualization.export.export_frames`.
+        """
+        from sunpy.visualization.export import export_frames
+
+        return export_frames(self.maps, filename=filename, stream=stream, **kwargs)
+
     def all_maps_same_shape(self):
         """
         Tests if all the maps have the same number pixels in the x and y
@@ -347,3 +399,87 @@ class MapSequence(object):
         Return all the meta objects as a list.
         """
         return [m.meta for m in self.maps]
+
+    @u.quantity_input(dimensions=u.pixel, offset=u.pixel)
+    def superpixel(self, dimensions, offset=(0, 0)*u.pixel, func=np.sum):
+        """
+        Returns a new MapSequence of the superpixel maps of the maps, see
+        `~sunpy.map.GenericMap.superpixel`.
+
+        The data of the new maps are views of a single (nt, ny, nx) array.
+        If the data of the maps are themselves the frames of a (nt, ny, nx)
+        array, e.g. a memory mapped data cube, the superpixels of all of the
+        maps are found at once.
+
+        Parameters
+        ----------
+        dimensions : tuple
+            One superpixel in the new maps is equal to (dimension[0],
+            dimension[1]) pixels of the original maps.
+        offset : tuple
+            Offset from (0,0) in original map pixels used to calculate where
+            the data used to make the resulting superpixel maps starts.
+        func : function applied to the original data
+            See `~sunpy.map.GenericMap.superpixel`.
+
+        Returns
+        -------
+        `~sunpy.map.MapSequence`
+            The superpixel maps, in the same order as the maps.
+        """
+        if (offset.value[0] < 0) or (offset.value[1] < 0):
+            raise ValueError("Offset is strictly non-negative.")
+        if not self.all_maps_same_shape():
+            raise ValueError('Not all maps have the same shape.')
+
+        superpixel_args = ([dimensions.value[1], dimensions.value[0]],
+                           [offset.value[1], offset.value[0]], func)
+        stack = self._data_stack()
+        if stack is not None:
+            new_stack, _ = reduce_superpixels(stack, *superpixel_args)
+            new_masks = [None] * len(self.maps)
+        else:
+            new_data, new_masks = zip(*[reduce_superpixels(m.data, *superpixel_args, mask=m.mask)
+                                        for m in self.maps])
+            # The stack takes the common type of the data, e.g. of integer
+            # and floating point maps
+            new_stack = np.stack(new_data)
+
+        new_maps = []
+        for m, new_data, new_mask in zip(self.maps, new_stack, new_masks):
+            new_meta = m._superpixel_meta(dimensions, offset, new_data.shape)
+            new_maps.append(m._new_instance(new_data, new_meta, m.plot_settings, mask=new_mask))
+        return MapSequence(new_maps, sortby=None)
+
+    def _data_stack(self):
+        """
+        The (nt, ny, nx) view of the data of the maps if they are evenly
+        spaced frames of one array and no map has a mask, otherwise `None`.
+        """
+        if self.at_least_one_map_has_mask():
+            return None
+
+        def root(array):
+            while isinstance(array.base, np.ndarray):
+                array = array.base
+            return array
+
+        base = root(self.maps[0].data)
+        if base.ndim != 3 or base.strides[0] == 0:
+            return None
+        start = base.__array_interface__['data'][0]
+        frames = []
+        for m in self.maps:
+            if (root(m.data) is not base or m.data.dtype != base.dtype or
+                    m.data.shape != base.shape[1:] or m.data.strides != base.strides[1:]):
+                return None
+            frame, remainder = divmod(m.data.__array_interface__['data'][0] - start,
+                                      base.strides[0])
+            if remainder or not 0 <= frame < base.shape[0]:
+                return None
+            frames.append(frame)
+
+        step = frames[1] - frames[0] if len(frames) > 1 else 1
+        if step <= 0 or frames != list(range(frames[0], frames[-1] + 1, step)):
+            return None
+        return base[frames[0]:frames[-1] + 1:step]
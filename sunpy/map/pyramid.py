@@ -0,0 +1,366 @@
+"""
+Multi-resolution pyramids of maps, for serving zoomable images.
+"""
+from __future__ import absolute_import, division, print_function
+
+import os
+import json
+
+import numpy as np
+import astropy.units as u
+from astropy.io import fits
+
+from sunpy.image.rescale import reduce_superpixels
+from sunpy.io.fits import get_header, header_to_fits
+from sunpy.io.header import _resample_header
+from sunpy.io.fits import write as write_fits
+from sunpy.map.map_factory import Map
+
+__all__ = ['map_pyramid', 'write_pyramid', 'MapPyramid']
+
+# The name of the file describing the levels of a directory of tiles
+_MANIFEST = 'pyramid.json'
+
+
+def map_pyramid(amap, n_levels=None, min_size=256, func=np.mean):
+    """
+    Build a multi-resolution pyramid of a map.
+
+    Each level is derived from the previous one by reducing blocks of 2x2
+    pixels with ``func``, so the full resolution data are only reduced once.
+    A trailing row or column of an odd sized level is dropped.
+
+    Parameters
+    ----------
+    amap : `~sunpy.map.GenericMap`
+        The full resolution map, which is the first level of the pyramid.
+
+    n_levels : `int`, optional
+        The number of levels. Defaults to adding levels until both
+        dimensions of the last level are no larger than ``min_size``.
+
+    min_size : `int`, optional
+        The size below which no more levels are added if ``n_levels`` is not
+        given. Defaults to 256.
+
+    func : function, optional
+        The function reducing the blocks, which must support the ``axis``
+        keyword like `~numpy.mean`, the default.
+
+    Returns
+    -------
+    `list`
+        The maps of the levels, from full to lowest resolution.
+
+    Examples
+    --------
+    >>> import sunpy.map
+    >>> import sunpy.data.sample  # doctest: +REMOTE_DATA
+    >>> aia = sunpy.map.Map(sunpy.data.sample.AIA_171_IMAGE)  # doctest: +REMOTE_DATA
+    >>> [level.data.shape for level in sunpy.map.map_pyramid(aia)]  # doctest: +REMOTE_DATA
+    [(1024, 1024), (512, 512), (256, 256)]
+    """
+    return list(_iter_levels(amap, n_levels, min_size, func))
+
+
+def write_pyramid(amap, path, n_levels=None, min_size=256, tile_size=None, func=np.mean,
+                  overwrite=False):
+    """
+    Write a multi-resolution pyramid of a map to a FITS file or a directory
+    of tiles.
+
+    The levels are computed as in `~sunpy.map.map_pyramid`, one at a time, and
+    each level is written with a header describing its own WCS. Read them back
+    with `~sunpy.map.MapPyramid`.
+
+    Parameters
+    ----------
+    amap : `~sunpy.map.GenericMap`
+        The full resolution map.
+
+    path : `str`
+        The FITS file to write, or the directory to write the tiles to if
+        ``tile_size`` is given.
+
+    n_levels : `int`, optional
+        The number of levels. Defaults to adding levels until both
+        dimensions of the last level are no larger than ``min_size``.
+
+    min_size : `int`, optional
+        The size below which no more levels are added if ``n_levels`` is not
+        given. Defaults to 256.
+
+    tile_size : `int`, optional
+        If given, each level is split into square tiles of this size, which
+        are written as separate FITS files ``<level>/<row>_<column>.fits``
+        under ``path``, with rows counted from the bottom of the image.
+        Otherwise all levels are written as image extensions of a single FITS
+        file.
+
+    func : function, optional
+        The function reducing blocks of 2x2 pixels. Defaults to `~numpy.mean`.
+
+    overwrite : `bool`, optional
+        Replace an existing file or existing tiles.
+
+    Examples
+    --------
+    >>> import sunpy.map
+    >>> aia = sunpy.map.Map('aia_171.fits')   # doctest: +SKIP
+    >>> sunpy.map.write_pyramid(aia, 'aia_171_tiles', tile_size=256)   # doctest: +SKIP
+    """
+    path = os.path.expanduser(path)
+    levels = _iter_levels(amap, n_levels, min_size, func)
+
+    if tile_size is None:
+        if os.path.exists(path) and not overwrite:
+            raise OSError("File {0} already exists.".format(path))
+        primary = fits.PrimaryHDU()
+        primary.header['PYRLEVS'] = (0, 'Number of pyramid levels')
+        primary.writeto(path, overwrite=overwrite)
+        n_written = 0
+        for level, level_map in enumerate(levels):
+            header = header_to_fits(level_map.meta)
+            header['EXTNAME'] = 'LEVEL{0}'.format(level)
+            fits.append(path, level_map.data, header=header)
+            n_written += 1
+        with fits.open(path, mode='update') as hdulist:
+            hdulist[0].header['PYRLEVS'] = n_written
+        return
+
+    if tile_size < 1:
+        raise ValueError("tile_size must be at least 1.")
+    shapes = []
+    for level, level_map in enumerate(levels):
+        level_dir = os.path.join(path, str(level))
+        os.makedirs(level_dir, exist_ok=True)
+        ny, nx = level_map.data.shape
+        for row, y_min in enumerate(range(0, ny, tile_size)):
+            for column, x_min in enumerate(range(0, nx, tile_size)):
+                data = level_map.data[y_min:y_min + tile_size, x_min:x_min + tile_size]
+                header = _region_meta(level_map.meta, data.shape, x_min, y_min)
+                write_fits(os.path.join(level_dir, '{0}_{1}.fits'.format(row, column)),
+                           data, header, overwrite=overwrite)
+        shapes.append([ny, nx])
+
+    with open(os.path.join(path, _MANIFEST), 'w') as manifest:
+        json.dump({'tile_size': tile_size, 'shapes': shapes}, manifest)
+
+
+class MapPyramid(object):
+    """
+    A reader for the pyramids written by `~sunpy.map.write_pyramid`, which
+    only reads the data needed for a given view.
+
+    Regions of a pyramid written to a single FITS file are read from the
+    memory mapped level with `~astropy.io.fits.ImageHDU.section`, so only the
+    rows of the region are read. Regions of a directory of tiles only open
+    the tiles overlapping the region.
+
+    Parameters
+    ----------
+    path : `str`
+        The FITS file or directory of tiles of the pyramid.
+
+    Examples
+    --------
+    >>> import astropy.units as u
+    >>> from astropy.coordinates import SkyCoord
+    >>> import sunpy.map
+    >>> pyramid = sunpy.map.MapPyramid('aia_171_tiles')   # doctest: +SKIP
+    >>> bottom_left = SkyCoord(-300*u.arcsec, -300*u.arcsec, frame=aia.coordinate_frame)   # doctest: +SKIP
+    >>> top_right = SkyCoord(300*u.arcsec, 300*u.arcsec, frame=aia.coordinate_frame)   # doctest: +SKIP
+    >>> view = pyramid.read(bottom_left, top_right, dimensions=[512, 512]*u.pix)   # doctest: +SKIP
+    """
+
+    def __init__(self, path):
+        self.path = os.path.expanduser(path)
+        self._headers = {}
+        self._placeholders = {}
+        if os.path.isdir(self.path):
+            with open(os.path.join(self.path, _MANIFEST)) as manifest:
+                description = json.load(manifest)
+            self.tile_size = description['tile_size']
+            self.shapes = [tuple(shape) for shape in description['shapes']]
+            self._hdulist = None
+        else:
+            self.tile_size = None
+            self._hdulist = fits.open(self.path, memmap=True)
+            n_levels = self._hdulist[0].header['PYRLEVS']
+            self.shapes = [(hdu.header['NAXIS2'], hdu.header['NAXIS1'])
+                           for hdu in self._hdulist[1:n_levels + 1]]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def __len__(self):
+        return len(self.shapes)
+
+    @property
+    def n_levels(self):
+        """
+        The number of levels of the pyramid.
+        """
+        return len(self.shapes)
+
+    def close(self):
+        """
+        Close the FITS file of the pyramid.
+        """
+        if self._hdulist is not None:
+            self._hdulist.close()
+
+    def header(self, level=0):
+        """
+        The header of a whole level of the pyramid.
+        """
+        if level not in self._headers:
+            if self._hdulist is None:
+                header = get_header(self._tile_path(level, 0, 0))[0]
+            else:
+                header = get_header(fits.HDUList([self._hdulist[level + 1]]))[0]
+            header['NAXIS1'] = self.shapes[level][1]
+            header['NAXIS2'] = self.shapes[level][0]
+            self._headers[level] = header
+        return self._headers[level]
+
+    def read(self, bottom_left=None, top_right=None, level=None, dimensions=None):
+        """
+        Read a region of a level of the pyramid into a map.
+
+        Parameters
+        ----------
+        bottom_left : `~astropy.coordinates.SkyCoord` or `~astropy.units.Quantity`, optional
+            The bottom left corner of the region, as for
+            `~sunpy.map.GenericMap.submap`. Pixel coordinates are pixels of
+            the full resolution level. Defaults to the whole level.
+
+        top_right : `~astropy.coordinates.SkyCoord` or `~astropy.units.Quantity`, optional
+            The top right corner of the region.
+
+        level : `int`, optional
+            The level to read. Defaults to the lowest resolution level which
+            has at least ``dimensions`` pixels in the region, or to the full
+            resolution level if ``dimensions`` is not given.
+
+        dimensions : `~astropy.units.Quantity`, optional
+            The number of pixels along the x and y axes needed for the view,
+            used to select the level.
+
+        Returns
+        -------
+        `~sunpy.map.GenericMap`
+            The region of the level.
+        """
+        if level is None:
+            level = 0 if dimensions is None else self._best_level(bottom_left, top_right,
+                                                                  dimensions)
+        if not 0 <= level < self.n_levels:
+            raise ValueError("The pyramid has no level {0}.".format(level))
+
+        x_pixels, y_pixels = self._region(level, bottom_left, top_right)
+        x_min, x_max = int(x_pixels[0]), int(x_pixels[1])
+        y_min, y_max = int(y_pixels[0]), int(y_pixels[1])
+        data = self._read_region(level, x_min, x_max, y_min, y_max)
+        header = _region_meta(self.header(level), data.shape, x_min, y_min)
+        return Map(data, header)
+
+    def _tile_path(self, level, row, column):
+        return os.path.join(self.path, str(level), '{0}_{1}.fits'.format(row, column))
+
+    def _placeholder(self, level):
+        """
+        A map of a whole level which holds no data, for converting
+        coordinates to pixels of the level.
+        """
+        if level not in self._placeholders:
+            data = np.broadcast_to(np.zeros(1, dtype=np.float32), self.shapes[level])
+            self._placeholders[level] = Map(data, self.header(level))
+        return self._placeholders[level]
+
+    def _region(self, level, bottom_left, top_right):
+        """The pixel ranges of a region in a level."""
+        ny, nx = self.shapes[level]
+        if bottom_left is None:
+            return np.array([0, nx]), np.array([0, ny])
+        if isinstance(bottom_left, u.Quantity):
+            x_pixels, y_pixels = self._placeholder(0)._submap_pixels(bottom_left, top_right)
+            factor = 2 ** level
+            x_pixels = np.clip([x_pixels[0] // factor, -(-x_pixels[1] // factor)], 0, nx)
+            y_pixels = np.clip([y_pixels[0] // factor, -(-y_pixels[1] // factor)], 0, ny)
+            return x_pixels, y_pixels
+        return self._placeholder(level)._submap_pixels(bottom_left, top_right)
+
+    def _best_level(self, bottom_left, top_right, dimensions):
+        """
+        The lowest resolution level with at least ``dimensions`` pixels in
+        the region.
+        """
+        nx, ny = u.Quantity(dimensions, u.pix).value
+        x_pixels, y_pixels = self._region(0, bottom_left, top_right)
+        width, height = np.diff(x_pixels)[0], np.diff(y_pixels)[0]
+        for level in reversed(range(self.n_levels)):
+            factor = 2 ** level
+            if width / factor >= nx and height / factor >= ny:
+                return level
+        return 0
+
+    def _read_region(self, level, x_min, x_max, y_min, y_max):
+        """Read the data of a region of a level."""
+        if self._hdulist is not None:
+            return self._hdulist[level + 1].section[y_min:y_max, x_min:x_max]
+
+        size = self.tile_size
+        data = None
+        for row in range(y_min // size, -(-y_max // size)):
+            for column in range(x_min // size, -(-x_max // size)):
+                with fits.open(self._tile_path(level, row, column), memmap=True) as hdulist:
+                    tile = hdulist[0]
+                    if data is None:
+                        data = np.empty((y_max - y_min, x_max - x_min), dtype=tile.data.dtype)
+                    # The overlap of the tile and the region, in level pixels
+                    y_start, y_stop = max(y_min, row * size), min(y_max, (row + 1) * size)
+                    x_start, x_stop = max(x_min, column * size), min(x_max, (column + 1) * size)
+                    data[y_start - y_min:y_stop - y_min, x_start - x_min:x_stop - x_min] = \
+                        tile.section[y_start - row * size:y_stop - row * size,
+                                     x_start - column * size:x_stop - column * size]
+        if data is None:
+            data = np.empty((y_max - y_min, x_max - x_min))
+        return data
+
+
+def _iter_levels(amap, n_levels, min_size, func):
+    """Yield the maps of the levels of a pyramid, one at a time."""
+    level_map = amap
+    level = 0
+    while True:
+        yield level_map
+        level += 1
+        ny, nx = level_map.data.shape
+        if n_levels is None:
+            if max(ny, nx) <= min_size:
+                return
+        elif level >= n_levels:
+            return
+        if min(ny, nx) < 2:
+            return
+        # Reduce blocks of 2x2 pixels, dropping a trailing row or column
+        data, _ = reduce_superpixels(level_map.data, (2, 2), func=func)
+        meta = level_map.meta.copy()
+        # The reduced rows start at the first row, so the image they are
+        # aligned to has an even number of rows
+        _resample_header(meta, data.shape, 2, ny // 2 * 2, 0, 0)
+        level_map = level_map._new_instance(data, meta, level_map.plot_settings)
+
+
+def _region_meta(meta, shape, x_min, y_min):
+    """A copy of a header updated for a region of the image."""
+    meta = meta.copy()
+    meta['NAXIS1'] = shape[1]
+    meta['NAXIS2'] = shape[0]
+    meta['CRPIX1'] = meta['CRPIX1'] - x_min
+    meta['CRPIX2'] = meta['CRPIX2'] - y_min
+    return meta
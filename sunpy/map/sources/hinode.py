@@ -5,7 +5,7 @@ from __future__ import absolute_import, print_function, division
 __author__ = ["Jack Ireland, Jose Ivan Campos-Rozo, David Perez-Suarez"]
 __email__ = "jack.ireland@nasa.gov"
 
-import matplotlib.pyplot as plt
+import matplotlib.cm as cm
 
 from sunpy.map import GenericMap
 
@@ -65,7 +65,7 @@ class XRTMap(GenericMap):
         self.meta['detector'] = "XRT"
 #        self.meta['instrume'] = "XRT"
         self.meta['telescop'] = "Hinode"
-        self.plot_settings['cmap'] = plt.get_cmap(name='hinodexrt')
+        self.plot_settings['cmap'] = cm.get_cmap(name='hinodexrt')
 
     @property
     def measurement(self):
@@ -131,7 +131,7 @@ class SOTMap(GenericMap):
                  'SOT/SP': 'intensity',  # For the 1st 2 dimensions
                  }
 
-        self.plot_settings['cmap'] = plt.get_cmap('hinodesot' + color[self.instrument])
+        self.plot_settings['cmap'] = cm.get_cmap('hinodesot' + color[self.instrument])
 
     @classmethod
     def is_datasource_for(cls, data, header, **kwargs):
@@ -5,7 +5,7 @@ from __future__ import absolute_import, print_function, division
 __author__ = "Keith Hughitt"
 __email__ = "keith.hughitt@nasa.gov"
 
-import matplotlib.pyplot as plt
+import matplotlib.cm as cm
 
 from sunpy.map import GenericMap
 
@@ -40,7 +40,7 @@ class SWAPMap(GenericMap):
         self.meta['obsrvtry'] = "PROBA2"
 
         self._nickname = self.detector
-        self.plot_settings['cmap'] = plt.get_cmap(name='sdoaia171')
+        self.plot_settings['cmap'] = cm.get_cmap(name='sdoaia171')
 
     @classmethod
     def is_datasource_for(cls, data, header, **kwargs):
@@ -5,7 +5,7 @@ from __future__ import absolute_import, print_function, division
 __author__ = "Keith Hughitt"
 __email__ = "keith.hughitt@nasa.gov"
 
-import matplotlib.pyplot as plt
+import matplotlib.cm as cm
 
 from astropy.visualization.mpl_normalize import ImageNormalize
 from astropy.visualization import AsinhStretch
@@ -46,7 +46,7 @@ class AIAMap(GenericMap):
         # Fill in some missing info
         self.meta['detector'] = "AIA"
         self._nickname = self.detector
-        self.plot_settings['cmap'] = plt.get_cmap(self._get_cmap_name())
+        self.plot_settings['cmap'] = cm.get_cmap(self._get_cmap_name())
         self.plot_settings['norm'] = ImageNormalize(stretch=source_stretch(self.meta, AsinhStretch(0.01)))
 
     @property
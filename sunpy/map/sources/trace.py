@@ -5,7 +5,7 @@ from __future__ import absolute_import, division, absolute_import
 __author__ = "Jack Ireland"
 __email__ = "jack.ireland@nasa.gov"
 
-import matplotlib.pyplot as plt
+import matplotlib.cm as cm
 
 from astropy.visualization import LogStretch
 from astropy.visualization.mpl_normalize import ImageNormalize
@@ -58,7 +58,7 @@ class TRACEMap(GenericMap):
         self.meta['obsrvtry'] = "TRACE"
         self._nickname = self.detector
         # Colour maps
-        self.plot_settings['cmap'] = plt.get_cmap('trace' + str(self.meta['WAVE_LEN']))
+        self.plot_settings['cmap'] = cm.get_cmap('trace' + str(self.meta['WAVE_LEN']))
         self.plot_settings['norm'] = ImageNormalize(stretch=source_stretch(self.meta, LogStretch()))
 
     @classmethod
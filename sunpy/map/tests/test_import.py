@@ -0,0 +1,54 @@
+# -*- coding: utf-8 -*-
+"""
+Test that importing sunpy.map stays cheap
+"""
+import sys
+import json
+import subprocess
+
+import pytest
+
+# Modules which are slow to import and are only needed once maps are created,
+# plotted or read from particular file types.
+DEFERRED_MODULES = ['matplotlib.pyplot',
+                    'astropy.visualization.wcsaxes',
+                    'skimage',
+                    'glymur',
+                    'sqlalchemy',
+                    'sunpy.database']
+
+IMPORT_SCRIPT = """
+import sys, json
+import sunpy.map
+print(json.dumps(sorted(sys.modules)))
+"""
+
+
+def import_sunpy_map():
+    """Import sunpy.map in a fresh interpreter, returning the modules loaded."""
+    output = subprocess.check_output([sys.executable, '-c', IMPORT_SCRIPT])
+    return set(json.loads(output.decode('utf-8').splitlines()[-1]))
+
+
+@pytest.mark.skipif(sys.version_info < (3, 7), reason="Lazy imports need Python 3.7")
+def test_import_defers_heavy_modules():
+    modules = import_sunpy_map()
+    loaded = [name for name in DEFERRED_MODULES if name in modules]
+    assert not loaded
+    assert 'sunpy.map.sources' not in modules
+
+
+@pytest.mark.skipif(sys.version_info < (3, 7), reason="Lazy imports need Python 3.7")
+def test_sources_loaded_on_access():
+    script = ("import sys, sunpy.map\n"
+              "sunpy.map.sources.AIAMap\n"
+              "print('sunpy.map.sources.sdo' in sys.modules)")
+    output = subprocess.check_output([sys.executable, '-c', script])
+    assert output.decode('utf-8').split()[-1] == 'True'
+
+
+def test_colormaps_registered():
+    script = ("import sunpy.map, matplotlib.cm\n"
+              "print(matplotlib.cm.get_cmap('sdoaia171').name)")
+    output = subprocess.check_output([sys.executable, '-c', script])
+    assert output.decode('utf-8').splitlines()[-1] == 'SDO AIA 171'
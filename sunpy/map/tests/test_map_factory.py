@@ -16,6 +16,7 @@ from astropy.wcs import WCS
 import sunpy
 import sunpy.map
 import sunpy.data.test
+from sunpy.util.datatype_factory_base import MultipleMatchError
 
 
 filepath = sunpy.data.test.rootdir
@@ -125,6 +126,93 @@ class TestMap(object):
         backin = sunpy.map.Map(afilename)
         assert isinstance(backin, sunpy.map.sources.EITMap)
 
+    def test_parallel(self, mocker):
+        pattern = os.path.join(filepath, "EIT", "*")
+        read_file = mocker.spy(sunpy.map.map_factory.MapFactory, '_read_file')
+        maps = sunpy.map.Map(pattern)
+        # Files read in the calling process go through the method
+        assert read_file.call_count == len(maps)
+        parallel_maps = sunpy.map.Map(pattern, parallel=2)
+        assert len(parallel_maps) == len(maps)
+        for amap, parallel_map in zip(maps, parallel_maps):
+            assert type(parallel_map) is type(amap)
+            assert parallel_map.date == amap.date
+            assert np.all(parallel_map.data == amap.data)
+
+        # Pairs and files are kept in the order of the arguments
+        aia = sunpy.map.Map(AIA_171_IMAGE)
+        sequence = sunpy.map.Map(RHESSI_IMAGE, (aia.data, aia.meta), AIA_171_IMAGE,
+                                 sequence=True, parallel=2)
+        assert [type(amap) for amap in sequence] == [sunpy.map.sources.RHESSIMap,
+                                                     sunpy.map.sources.AIAMap,
+                                                     sunpy.map.sources.AIAMap]
+
+    def test_dispatch_index(self, monkeypatch):
+        aia = sunpy.map.Map(AIA_171_IMAGE)
+        assert isinstance(aia, sunpy.map.sources.AIAMap)
+
+        calls = []
+
+        def eit_validation_function(data, header, **kwargs):
+            calls.append(header)
+            return False
+
+        monkeypatch.setitem(sunpy.map.Map.registry, sunpy.map.sources.EITMap,
+                            eit_validation_function)
+        # Changing the registry forgets the remembered types
+        aia = sunpy.map.Map(AIA_171_IMAGE)
+        assert isinstance(aia, sunpy.map.sources.AIAMap)
+        assert len(calls) == 1
+        calls.clear()
+
+        # The type of the first map is remembered for maps from the same source
+        aia = sunpy.map.Map(AIA_171_IMAGE)
+        assert isinstance(aia, sunpy.map.sources.AIAMap)
+        assert not calls
+
+        # A map from an unseen source is matched against all types
+        meta = aia.meta.copy()
+        meta['instrume'] = 'test_dispatch_index'
+        generic = sunpy.map.Map(aia.data, meta)
+        assert type(generic) is sunpy.map.GenericMap
+        assert len(calls) == 1
+
+    def test_dispatch_index_multiple_match(self, monkeypatch):
+        aia = sunpy.map.Map(AIA_171_IMAGE)
+        assert isinstance(aia, sunpy.map.sources.AIAMap)
+
+        class LevelMap(sunpy.map.GenericMap):
+            pass
+
+        # A map type from outside sunpy may read keys which are not indexed
+        def level_validation_function(data, header, **kwargs):
+            return header.get('lvl_num') == 1.5
+
+        monkeypatch.setitem(sunpy.map.Map.registry, LevelMap, level_validation_function)
+        assert isinstance(sunpy.map.Map(aia.data, aia.meta), sunpy.map.sources.AIAMap)
+        meta = aia.meta.copy()
+        meta['lvl_num'] = 1.5
+        with pytest.raises(MultipleMatchError):
+            sunpy.map.Map(aia.data, meta)
+
+    def test_dispatch_index_source_tests(self, monkeypatch):
+        class TestAIAMap(sunpy.map.GenericMap):
+            pass
+
+        # A map type defined outside the source modules of sunpy is validated
+        # for every map, even if it is defined next to them
+        TestAIAMap.__module__ = 'sunpy.map.sources.tests.test_sdo_source'
+        calls = []
+
+        def validation_function(data, header, **kwargs):
+            calls.append(header)
+            return False
+
+        monkeypatch.setitem(sunpy.map.Map.registry, TestAIAMap, validation_function)
+        for _ in range(2):
+            assert isinstance(sunpy.map.Map(AIA_171_IMAGE), sunpy.map.sources.AIAMap)
+        assert len(calls) == 2
+
 #==============================================================================
 # Sources Tests
 #==============================================================================
@@ -382,6 +382,43 @@ def test_submap(generic_map):
     assert (generic_map.data[height // 2:height, width // 2:width] == submap.data).all()
 
 
+def test_submap_view(aia171_test_map_with_mask):
+    bottom_left, top_right = [10, 20] * u.pix, [40, 30] * u.pix
+    submap = aia171_test_map_with_mask.submap(bottom_left, top_right)
+    view = aia171_test_map_with_mask.submap(bottom_left, top_right, copy=False)
+    assert np.shares_memory(view.data, aia171_test_map_with_mask.data)
+    assert not np.shares_memory(submap.data, aia171_test_map_with_mask.data)
+    np.testing.assert_array_equal(view.data, submap.data)
+    np.testing.assert_array_equal(view.mask, submap.mask)
+    assert view.meta == submap.meta
+
+    # The parent map can not be changed through the view
+    with pytest.raises(ValueError):
+        view.data[0, 0] = 0
+    with pytest.raises(ValueError):
+        view.mask[0, 0] = True
+    assert aia171_test_map_with_mask.data.flags.writeable
+
+
+def test_submaps(aia171_test_map):
+    boxes = [([10, 20] * u.pix, [40, 30] * u.pix),
+             (SkyCoord([-100, 100] * u.arcsec, [-200, 0] * u.arcsec,
+                       frame=aia171_test_map.coordinate_frame), None),
+             (SkyCoord(-500 * u.arcsec, 300 * u.arcsec, frame=aia171_test_map.coordinate_frame),
+              SkyCoord(2000 * u.arcsec, 2000 * u.arcsec, frame=aia171_test_map.coordinate_frame))]
+    for copy in [True, False]:
+        submaps = aia171_test_map.submaps(boxes, copy=copy)
+        assert len(submaps) == len(boxes)
+        for (bottom_left, top_right), submap in zip(boxes, submaps):
+            expected = aia171_test_map.submap(bottom_left, top_right)
+            np.testing.assert_array_equal(submap.data, expected.data)
+            assert submap.meta == expected.meta
+            assert submap.data.flags.writeable == copy
+
+    with pytest.raises(ValueError):
+        aia171_test_map.submaps([([10, 20], [40, 30])])
+
+
 resample_test_data = [('linear', (100, 200) * u.pixel), ('neighbor', (128, 256) * u.pixel),
                       ('nearest', (512, 128) * u.pixel), ('spline', (200, 200) * u.pixel)]
 
@@ -413,6 +450,13 @@ def test_resample_metadata(generic_map, sample_method, new_dimensions):
             assert resampled_map.meta[key] == generic_map.meta[key]
 
 
+def test_resample_out(generic_map):
+    out = np.empty((200, 100))
+    resampled_map = generic_map.resample((100, 200) * u.pixel, out=out)
+    assert resampled_map.data is out
+    np.testing.assert_allclose(out, generic_map.resample((100, 200) * u.pixel).data)
+
+
 def test_superpixel(aia171_test_map, aia171_test_map_with_mask):
     dimensions = (2, 2) * u.pix
     superpixel_map_sum = aia171_test_map.superpixel(dimensions)
@@ -557,6 +601,31 @@ def test_rotate_invalid_order(generic_map):
         generic_map.rotate(order=-1)
 
 
+def test_rotate_dtype(aia171_test_map):
+    float32_map = sunpy.map.Map(aia171_test_map.data.astype(np.float32), aia171_test_map.meta)
+    rotated_map = float32_map.rotate(20 * u.deg)
+    assert rotated_map.data.dtype == np.float32
+    expected = aia171_test_map.rotate(20 * u.deg)
+    np.testing.assert_allclose(rotated_map.data, expected.data, rtol=1e-5, atol=1e-3)
+
+    int_map = sunpy.map.Map(aia171_test_map.data.astype(np.int32), aia171_test_map.meta)
+    assert int_map.rotate(20 * u.deg).data.dtype == np.float64
+    assert int_map.rotate(20 * u.deg, dtype=np.float32).data.dtype == np.float32
+
+
+@pytest.mark.parametrize('use_scipy', [False, True])
+def test_rotate_out(aia171_test_map, use_scipy):
+    rotated_map = aia171_test_map.rotate(20 * u.deg, use_scipy=use_scipy)
+    out = np.empty(rotated_map.data.shape, dtype=np.float32)
+    out_map = aia171_test_map.rotate(20 * u.deg, use_scipy=use_scipy, out=out)
+    assert out_map.data is out
+    np.testing.assert_allclose(out_map.data, rotated_map.data, rtol=1e-5, atol=1e-3)
+    assert out_map.meta == rotated_map.meta
+
+    with pytest.raises(ValueError):
+        aia171_test_map.rotate(20 * u.deg, out=np.empty((2, 2)))
+
+
 def test_as_mpl_axes_aia171(aia171_test_map):
     ax = plt.subplot(projection=aia171_test_map)
     assert isinstance(ax, wcsaxes.WCSAxes)
@@ -147,3 +147,55 @@ def test_all_meta(mapsequence_all_the_same):
     assert len(meta) == 2
     assert np.all(np.asarray([isinstance(h, MetaDict) for h in meta]))
     assert np.all(np.asarray([meta[i] == mapsequence_all_the_same[i].meta for i in range(0, len(meta))]))
+
+
+def test_export_frames(mapsequence_all_the_same, tmpdir):
+    """Test that all maps of the sequence are rendered to files"""
+    pattern = str(tmpdir.join('frame_{index:03d}.png'))
+    files = mapsequence_all_the_same.export_frames(pattern, max_workers=1)
+    assert len(files) == 2
+    assert all(os.path.exists(f) for f in files)
+
+
+@pytest.mark.parametrize('func', [np.sum, np.mean, np.median])
+def test_superpixel(mapsequence_all_the_same, mapsequence_all_the_same_some_have_masks,
+                    mapsequence_different, func):
+    dimensions = (4, 2) * u.pix
+    for sequence in [mapsequence_all_the_same, mapsequence_all_the_same_some_have_masks]:
+        superpixels = sequence.superpixel(dimensions, func=func)
+        assert len(superpixels) == len(sequence)
+        for m, superpixel_map in zip(sequence, superpixels):
+            expected = m.superpixel(dimensions, func=func)
+            np.testing.assert_allclose(superpixel_map.data, expected.data)
+            assert superpixel_map.meta == expected.meta
+            if m.mask is None:
+                assert superpixel_map.mask is None
+            else:
+                np.testing.assert_array_equal(superpixel_map.mask, expected.mask)
+        assert superpixels[0].data.base is superpixels[-1].data.base
+
+    with pytest.raises(ValueError):
+        mapsequence_different.superpixel(dimensions)
+
+
+def test_superpixel_stack(aia_map):
+    # The maps are frames of one cube, so their superpixels are found at once
+    cube = np.stack([aia_map.data, 2 * aia_map.data, 3 * aia_map.data])
+    sequence = sunpy.map.MapSequence([sunpy.map.Map(frame, aia_map.meta) for frame in cube],
+                                     sortby=None)
+    assert sequence._data_stack().base is cube
+    assert sunpy.map.MapSequence(sequence.maps[::-1], sortby=None)._data_stack() is None
+
+    superpixels = sequence.superpixel((8, 8) * u.pix)
+    for m, superpixel_map in zip(sequence, superpixels):
+        np.testing.assert_allclose(superpixel_map.data, m.superpixel((8, 8) * u.pix).data)
+
+
+def test_superpixel_mixed_dtypes(aia_map):
+    data = np.ones((8, 8))
+    maps = [sunpy.map.Map(data.astype(np.int16), aia_map.meta),
+            sunpy.map.Map(1.2 * data, aia_map.meta)]
+    superpixels = sunpy.map.MapSequence(maps, sortby=None).superpixel((2, 2) * u.pix,
+                                                                      func=np.mean)
+    np.testing.assert_allclose(superpixels[0].data, 1)
+    np.testing.assert_allclose(superpixels[1].data, 1.2)
@@ -155,3 +155,14 @@ def test_heliographic_rectangle(heliographic_test_map):
     w = 13 * u.deg
     h = 13 * u.deg
     heliographic_test_map.draw_rectangle(bottom, w, h, color='cyan')
+
+
+def test_plot_use_lut(aia171_test_map_with_mask):
+    ax = plt.gca()
+    im = aia171_test_map_with_mask.plot(axes=ax, use_lut=True)
+    rgba = np.asarray(im.get_array())
+    assert rgba.shape == aia171_test_map_with_mask.data.shape + (4,)
+    assert rgba.dtype == np.uint8
+    data = np.ma.array(aia171_test_map_with_mask.data, mask=aia171_test_map_with_mask.mask)
+    expected = im.cmap(im.norm(data), bytes=True)
+    assert np.mean(np.any(rgba != expected, axis=-1)) < 1e-3
@@ -0,0 +1,123 @@
+# -*- coding: utf-8 -*-
+"""
+Test map pyramids
+"""
+import os
+
+import pytest
+import numpy as np
+
+import astropy.units as u
+from astropy.coordinates import SkyCoord
+
+import sunpy.map
+import sunpy.data.test
+
+testpath = sunpy.data.test.rootdir
+
+
+@pytest.fixture
+def aia171_test_map():
+    return sunpy.map.Map(os.path.join(testpath, 'aia_171_level1.fits'))
+
+
+@pytest.fixture(params=['fits', 'tiles'])
+def pyramid_path(request, tmpdir, aia171_test_map):
+    if request.param == 'fits':
+        path = str(tmpdir.join('pyramid.fits'))
+        aia171_test_map.save_pyramid(path, min_size=32)
+    else:
+        path = str(tmpdir.join('tiles'))
+        aia171_test_map.save_pyramid(path, min_size=32, tile_size=20)
+    return path
+
+
+def test_map_pyramid(aia171_test_map):
+    levels = sunpy.map.map_pyramid(aia171_test_map, min_size=32)
+    assert [level.data.shape for level in levels] == [(128, 128), (64, 64), (32, 32)]
+    assert levels[0] is aia171_test_map
+    np.testing.assert_allclose(levels[1].data[0, 0], aia171_test_map.data[:2, :2].mean())
+    np.testing.assert_allclose(levels[2].data, aia171_test_map.superpixel(
+        (4, 4) * u.pix, func=np.mean).data)
+
+    # Every level describes the same part of the Sun
+    corner = aia171_test_map.pixel_to_world(-0.5 * u.pix, -0.5 * u.pix)
+    for level in levels[1:]:
+        assert u.allclose(level.scale[0], aia171_test_map.scale[0] * 128 / level.data.shape[1])
+        level_corner = level.pixel_to_world(-0.5 * u.pix, -0.5 * u.pix)
+        assert u.allclose(level_corner.Tx, corner.Tx)
+        assert u.allclose(level_corner.Ty, corner.Ty)
+
+
+def test_map_pyramid_n_levels(aia171_test_map):
+    levels = sunpy.map.map_pyramid(aia171_test_map.submap((0, 0) * u.pix, (101, 99) * u.pix),
+                                   n_levels=3, func=np.sum)
+    assert [level.data.shape for level in levels] == [(99, 101), (49, 50), (24, 25)]
+
+
+def test_read_levels(pyramid_path, aia171_test_map):
+    levels = sunpy.map.map_pyramid(aia171_test_map, min_size=32)
+    with sunpy.map.MapPyramid(pyramid_path) as pyramid:
+        assert pyramid.n_levels == 3
+        for i, level in enumerate(levels):
+            read = pyramid.read(level=i)
+            np.testing.assert_allclose(read.data, level.data)
+            assert u.allclose(read.reference_pixel.x, level.reference_pixel.x)
+            assert u.allclose(read.scale[0], level.scale[0])
+
+
+def test_read_region(pyramid_path, aia171_test_map):
+    bottom_left = SkyCoord(-100 * u.arcsec, -50 * u.arcsec, frame=aia171_test_map.coordinate_frame)
+    top_right = SkyCoord(50 * u.arcsec, 100 * u.arcsec, frame=aia171_test_map.coordinate_frame)
+    level = sunpy.map.map_pyramid(aia171_test_map, min_size=32)[1]
+    expected = level.submap(bottom_left, top_right)
+    with sunpy.map.MapPyramid(pyramid_path) as pyramid:
+        read = pyramid.read(bottom_left, top_right, level=1)
+    np.testing.assert_allclose(read.data, expected.data)
+    assert u.allclose(read.reference_pixel.x, expected.reference_pixel.x)
+    assert u.allclose(read.reference_pixel.y, expected.reference_pixel.y)
+
+
+def test_read_region_pixels(pyramid_path, aia171_test_map):
+    with sunpy.map.MapPyramid(pyramid_path) as pyramid:
+        read = pyramid.read((10, 30) * u.pix, (50, 70) * u.pix, level=1)
+    np.testing.assert_allclose(read.data, sunpy.map.map_pyramid(
+        aia171_test_map, min_size=32)[1].data[15:35, 5:25])
+
+
+def test_read_best_level(pyramid_path):
+    with sunpy.map.MapPyramid(pyramid_path) as pyramid:
+        assert pyramid.read(dimensions=(40, 40) * u.pix).data.shape == (64, 64)
+        assert pyramid.read(dimensions=(20, 20) * u.pix).data.shape == (32, 32)
+        assert pyramid.read(dimensions=(200, 200) * u.pix).data.shape == (128, 128)
+        assert pyramid.read((0, 0) * u.pix, (64, 64) * u.pix,
+                            dimensions=(32, 32) * u.pix).data.shape == (32, 32)
+        with pytest.raises(ValueError):
+            pyramid.read(level=3)
+
+
+def test_read_only_needed_tiles(tmpdir, aia171_test_map, monkeypatch):
+    path = str(tmpdir.join('tiles'))
+    sunpy.map.write_pyramid(aia171_test_map, path, min_size=32, tile_size=20)
+    opened = []
+    original_open = sunpy.map.pyramid.fits.open
+
+    def record_open(name, *args, **kwargs):
+        opened.append(os.path.relpath(name, path))
+        return original_open(name, *args, **kwargs)
+
+    pyramid = sunpy.map.MapPyramid(path)
+    pyramid.header(0)
+    monkeypatch.setattr(sunpy.map.pyramid.fits, 'open', record_open)
+    pyramid.read((25, 25) * u.pix, (35, 45) * u.pix, level=0)
+    assert sorted(opened) == [os.path.join('0', '1_1.fits'), os.path.join('0', '2_1.fits')]
+
+
+def test_write_existing_file(tmpdir, aia171_test_map):
+    path = str(tmpdir.join('pyramid.fits'))
+    sunpy.map.write_pyramid(aia171_test_map, path, n_levels=2)
+    with pytest.raises(OSError):
+        sunpy.map.write_pyramid(aia171_test_map, path, n_levels=2)
+    sunpy.map.write_pyramid(aia171_test_map, path, n_levels=3, overwrite=True)
+    with sunpy.map.MapPyramid(path) as pyramid:
+        assert pyramid.n_levels == 3
@@ -0,0 +1,383 @@
+"""
+An opt-in, on-disk cache of the results of searches of remote services.
+
+When the cache is enabled with `~sunpy.net.cache.enable_query_cache`, the
+results of `~sunpy.net.vso.VSOClient.search`,
+`~sunpy.net.jsoc.JSOCClient.search` and
+`~sunpy.net.dataretriever.client.GenericClient.search`, and so of the
+searches `Fido.search <sunpy.net.fido_factory.UnifiedDownloaderFactory.search>`
+makes of them, are stored on disk, keyed by the client and the normalized
+query, and identical searches are answered from the cache until their
+results expire.
+"""
+from __future__ import absolute_import, division, print_function
+
+import os
+import time
+import pickle
+import hashlib
+import functools
+
+from suds import sudsobject
+
+import sunpy
+from sunpy.net import attr
+from sunpy.util.config import get_and_create_cache_dir
+
+__all__ = ['QueryCache', 'enable_query_cache', 'disable_query_cache', 'get_query_cache',
+           'cached_search']
+
+# The cache used by the searches, None if caching is disabled
+_query_cache = None
+
+# The client classes whose searches have gone through the cache. Instances
+# of these classes are stored in cached responses as a reference to the class.
+_client_types = set()
+
+
+class QueryCache(object):
+    """
+    A size bounded directory of pickled search results which expire after a
+    time to live set per client.
+
+    Parameters
+    ----------
+    directory : `str`, optional
+        The directory to store the results in. Defaults to ``queries`` in the
+        ``cache_dir`` of the ``downloads`` section of the sunpy configuration.
+
+    default_ttl : `float`, optional
+        The number of seconds after which the results of a search expire.
+        Defaults to one day.
+
+    ttls : `dict`, optional
+        Times to live in seconds for the searches of particular clients,
+        keyed by the name of the client class, e.g. ``{'VSOClient': 3600}``.
+        The time to live of a client is looked up by the names of the classes
+        it inherits from as well, so ``'GenericClient'`` sets the time to
+        live of all the `~sunpy.net.dataretriever` clients.
+
+    max_size : `int`, optional
+        The maximum total size of the cache in bytes, above which the least
+        recently used results are removed. Defaults to 128 MiB.
+    """
+
+    def __init__(self, directory=None, default_ttl=86400, ttls=None, max_size=2**27):
+        if directory is None:
+            directory = os.path.join(get_and_create_cache_dir(), 'queries')
+        self.directory = os.path.expanduser(directory)
+        os.makedirs(self.directory, exist_ok=True)
+        self.default_ttl = default_ttl
+        self.ttls = dict(ttls or {})
+        self.max_size = max_size
+
+    def __len__(self):
+        return len(self._entries())
+
+    def key(self, client, query, kwargs=None, state=None):
+        """
+        The cache key of a search of a client.
+
+        The key also depends on the version of sunpy, so that results are
+        not shared between versions.
+
+        Parameters
+        ----------
+        client : `type`
+            The class of the client.
+
+        query : iterable
+            The attrs of the query, which are combined with `~sunpy.net.attr.and_`.
+
+        kwargs : `dict`, optional
+            Extra keyword arguments of the search.
+
+        state : optional
+            The configuration of the client instance which changes the results
+            of its searches, e.g. the URL of the service. Its ``repr`` is part
+            of the key.
+        """
+        description = '\n'.join([sunpy.__version__,
+                                 client.__module__ + '.' + client.__name__,
+                                 repr(state),
+                                 _attr_key(attr.and_(*query)),
+                                 repr(sorted((kwargs or {}).items()))])
+        return hashlib.sha256(description.encode('utf-8')).hexdigest()
+
+    def ttl(self, client):
+        """
+        The number of seconds after which the results of a client expire.
+        """
+        for cls in client.__mro__:
+            if cls.__name__ in self.ttls:
+                return self.ttls[cls.__name__]
+        return self.default_ttl
+
+    def get(self, client, key, instance=None):
+        """
+        The cached result of a search.
+
+        Parameters
+        ----------
+        client : `type`
+            The class of the client.
+
+        key : `str`
+            The cache key of the search.
+
+        instance : optional
+            The client which is searching. It takes the place of clients of
+            the same class in the result. Other clients in the result are
+            only created when they are first used.
+
+        Raises
+        ------
+        KeyError
+            If there is no result for the key, or the result has expired.
+        """
+        path = self._path(key)
+        try:
+            f = open(path, 'rb')
+        except OSError:
+            raise KeyError(key)
+        try:
+            with f:
+                # The time the result was stored at precedes it, so that
+                # expired results are not unpickled
+                stored = pickle.load(f)
+                if not isinstance(stored, float):
+                    raise pickle.UnpicklingError("Not a query cache entry.")
+                if time.time() - stored > self.ttl(client):
+                    raise KeyError(key)
+                result = _Unpickler(f, instance).load()
+        except Exception:
+            # Expired results, and results which can not be restored, e.g.
+            # because they were stored by another version of sunpy
+            self._remove(path)
+            raise KeyError(key)
+        # The modification time of an entry records when it was last used
+        os.utime(path, None)
+        return result
+
+    def set(self, client, key, result):
+        """
+        Store the result of a search and evict the least recently used
+        results if the cache has become too large.
+
+        Results which can not be stored, e.g. because they can not be
+        pickled, are left out of the cache.
+
+        Returns
+        -------
+        `bool`
+            Whether the result was stored.
+        """
+        path = self._path(key)
+        temporary = '{0}.{1}.tmp'.format(path, os.getpid())
+        try:
+            with open(temporary, 'wb') as f:
+                pickle.dump(time.time(), f, pickle.HIGHEST_PROTOCOL)
+                _Pickler(f, pickle.HIGHEST_PROTOCOL).dump(result)
+            os.replace(temporary, path)
+        except Exception:
+            self._remove(temporary)
+            return False
+        self._evict()
+        return True
+
+    def clear(self):
+        """
+        Remove all results from the cache.
+        """
+        for path, _, _ in self._entries():
+            self._remove(path)
+
+    def _path(self, key):
+        return os.path.join(self.directory, key + '.pickle')
+
+    def _entries(self):
+        """``(path, size, last used)`` of each entry in the cache."""
+        entries = []
+        for name in os.listdir(self.directory):
+            if name.endswith('.pickle'):
+                path = os.path.join(self.directory, name)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                entries.append((path, stat.st_size, stat.st_mtime))
+        return entries
+
+    def _evict(self):
+        entries = self._entries()
+        total = sum(size for _, size, _ in entries)
+        for path, size, _ in sorted(entries, key=lambda entry: entry[2]):
+            if total <= self.max_size:
+                break
+            self._remove(path)
+            total -= size
+
+    @staticmethod
+    def _remove(path):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+
+def enable_query_cache(directory=None, **kwargs):
+    """
+    Cache the results of searches on disk.
+
+    Parameters are passed to `~sunpy.net.cache.QueryCache`.
+
+    Returns
+    -------
+    `~sunpy.net.cache.QueryCache`
+        The cache used by the searches.
+
+    Examples
+    --------
+    >>> from sunpy.net.cache import enable_query_cache
+    >>> cache = enable_query_cache(ttls={'VSOClient': 3600})  # doctest: +SKIP
+    """
+    global _query_cache
+    _query_cache = QueryCache(directory, **kwargs)
+    return _query_cache
+
+
+def disable_query_cache():
+    """
+    Stop caching the results of searches. The cached results are kept.
+    """
+    global _query_cache
+    _query_cache = None
+
+
+def get_query_cache():
+    """
+    The `~sunpy.net.cache.QueryCache` used by the searches, or `None` if
+    caching is disabled.
+    """
+    return _query_cache
+
+
+def cached_search(ignore=()):
+    """
+    Decorate the ``search`` method of a client to answer searches from the
+    query cache when it is enabled.
+
+    Results which carry errors, i.e. partial results, are not cached.
+
+    Clients whose instances are configured in ways which change the results
+    of their searches, e.g. with the URL of the service, define a
+    ``_query_cache_state`` method which returns that configuration, and it
+    becomes part of the cache key.
+
+    Parameters
+    ----------
+    ignore : iterable, optional
+        Keyword arguments of the search which do not change its results and
+        are left out of the cache key.
+    """
+    def decorator(search):
+        @functools.wraps(search)
+        def wrapper(self, *query, **kwargs):
+            cache = _query_cache
+            if cache is None:
+                return search(self, *query, **kwargs)
+
+            client = type(self)
+            _client_types.add(client)
+            state = self._query_cache_state() if hasattr(self, '_query_cache_state') else None
+            key = cache.key(client, query, {k: v for k, v in kwargs.items() if k not in ignore},
+                            state)
+            try:
+                return cache.get(client, key, self)
+            except KeyError:
+                pass
+            result = search(self, *query, **kwargs)
+            if not getattr(result, 'errors', None):
+                cache.set(client, key, result)
+            return result
+        return wrapper
+    return decorator
+
+
+def _attr_key(query):
+    """
+    A string describing an attr tree, which does not depend on the order of
+    the terms of the ANDs and ORs.
+    """
+    if isinstance(query, attr.AttrAnd):
+        return 'AND({})'.format(', '.join(sorted(_attr_key(a) for a in query.attrs)))
+    if isinstance(query, attr.AttrOr):
+        return 'OR({})'.format(', '.join(sorted(_attr_key(a) for a in query.attrs)))
+    return '{0}.{1}{2!r}'.format(type(query).__module__, type(query).__name__,
+                                 sorted(vars(query).items()))
+
+
+class _Pickler(pickle.Pickler):
+    """
+    Store clients as a reference to their class and SOAP objects, which can
+    not be pickled, as their class name and contents.
+    """
+
+    def persistent_id(self, obj):
+        if isinstance(obj, sudsobject.Object):
+            return ('suds', obj.__class__.__name__, dict(sudsobject.items(obj)))
+        if type(obj) in _client_types:
+            return ('client', type(obj))
+        if type(obj) is _LazyClient:
+            return ('client', obj.__class__)
+        return None
+
+
+class _Unpickler(pickle.Unpickler):
+    """
+    Restore clients as the searching client, if it is of the same class, or
+    as a `_LazyClient`, so that reading the cache does not connect to the
+    remote services.
+    """
+
+    def __init__(self, file, instance=None):
+        super(_Unpickler, self).__init__(file)
+        self.instance = instance
+
+    def persistent_load(self, pid):
+        if pid[0] == 'suds':
+            return sudsobject.Factory.object(pid[1], pid[2])
+        if pid[0] == 'client':
+            if type(self.instance) is pid[1]:
+                return self.instance
+            return _LazyClient(pid[1])
+        raise pickle.UnpicklingError("Unknown object in the query cache: {}".format(pid[0]))
+
+
+class _LazyClient(object):
+    """
+    A client of a cached result, which is created with its default arguments
+    when it is first used.
+    """
+
+    def __init__(self, cls):
+        object.__setattr__(self, '_cls', cls)
+        object.__setattr__(self, '_client', None)
+
+    @property
+    def __class__(self):
+        return self._cls
+
+    def _get_client(self):
+        if self._client is None:
+            object.__setattr__(self, '_client', self._cls())
+        return self._client
+
+    def __getattr__(self, name):
+        return getattr(self._get_client(), name)
+
+    def __setattr__(self, name, value):
+        setattr(self._get_client(), name, value)
+
+    def __repr__(self):
+        return repr(self._get_client())
@@ -25,10 +25,15 @@ from sunpy import config
 from sunpy.util import deprecated
 
 from sunpy.net.download import Downloader, Results
+from sunpy.net.cache import cached_search
 from sunpy.net.vso.attrs import Time, Wavelength, _Range
 
 TIME_FORMAT = config.get("general", "time_format")
 
+# Defined at module level so that query responses can be pickled
+minmax = namedtuple("minmax", "min max")
+waveminmax = namedtuple("waveminmax", "wavemin wavemax")
+
 __all__ = ['QueryResponse', 'GenericClient']
 
 
@@ -203,11 +208,9 @@ class GenericClient(object):
                     self.map_[elem.__class__.__name__.lower()] = a_min
                 else:
                     if isinstance(elem, Wavelength):
-                        prefix = 'wave'
+                        self.map_[elem.__class__.__name__.lower()] = waveminmax(a_min, a_max)
                     else:
-                        prefix = ''
-                    minmax = namedtuple("minmax", "{0}min {0}max".format(prefix))
-                    self.map_[elem.__class__.__name__.lower()] = minmax(a_min, a_max)
+                        self.map_[elem.__class__.__name__.lower()] = minmax(a_min, a_max)
             else:
                 if hasattr(elem, 'value'):
                     self.map_[elem.__class__.__name__.lower()] = elem.value
@@ -300,6 +303,7 @@ class GenericClient(object):
 
         return paths
 
+    @cached_search()
     def search(self, *args, **kwargs):
         """
         Query this client for a list of results.
@@ -11,11 +11,15 @@ This module provides the `Fido
 # This module was initially developed under funding provided by Google Summer
 # of Code 2014
 from __future__ import print_function, absolute_import
+import warnings
 from collections import Sequence
+from functools import partial
 
 from sunpy.util.datatype_factory_base import BasicRegistrationFactory
 from sunpy.util.datatype_factory_base import NoMatchError
 from sunpy.util.datatype_factory_base import MultipleMatchError
+from sunpy.util.concurrency import run_concurrently
+from sunpy.util.exceptions import SunpyUserWarning
 
 from sunpy.net.dataretriever.clients import CLIENTS
 from sunpy.net.dataretriever.client import QueryResponse
@@ -40,13 +44,16 @@ class UnifiedResponse(Sequence):
     index the second dimension with ``::2``.
     """
 
-    def __init__(self, lst):
+    def __init__(self, lst, errors=None):
         """
         Parameters
         ----------
         lst : `object`
             A single instance or an iterable of ``(QueryResponse, client)``
             pairs or ``QueryResponse`` objects with a ``.client`` attribute.
+
+        errors : `list`, optional
+            ``(client, exception)`` pairs for the searches which failed.
         """
 
         tmplst = []
@@ -73,6 +80,7 @@ class UnifiedResponse(Sequence):
                     raise ValueError(
                         "{} is not a valid input to UnifiedResponse.".format(type(lst)))
         self._list = tmplst
+        self.errors = list(errors or [])
 
     def __len__(self):
         return len(self._list)
@@ -256,8 +264,9 @@ def _create_and(walker, query, factory):
             error += str(at) + ', '
         raise ValueError(error)
 
-    # Return the response and the client
-    return [factory._make_query_to_client(*query.attrs)]
+    # Return the client and the attrs of the block, the searches are made
+    # concurrently by the factory.
+    return [(factory._check_registered_widgets(*query.attrs)[0], query.attrs)]
 
 
 @query_walker.add_creator(attr.AttrOr)
@@ -276,7 +285,9 @@ class UnifiedDownloaderFactory(BasicRegistrationFactory):
     Search and Download data from a variety of supported sources.
     """
 
-    def search(self, *query):
+    # Python 3: this line should be like this
+    # def search(self, *query, max_workers=None, timeout=None):
+    def search(self, *query, **kwargs):
         """
         Query for data in form of multiple parameters.
 
@@ -310,6 +321,14 @@ class UnifiedDownloaderFactory(BasicRegistrationFactory):
             VSO and the JSOC.  The query can mix attributes from the VSO and
             the JSOC.
 
+        max_workers : `int`, optional
+            The maximum number of clients searched at once. Defaults to
+            searching all the clients of the query at once.
+
+        timeout : `float`, optional
+            The number of seconds after which the search of a client is
+            abandoned. Defaults to waiting for every client.
+
         Returns
         -------
         `sunpy.net.fido_factory.UnifiedResponse`
@@ -321,9 +340,37 @@ class UnifiedDownloaderFactory(BasicRegistrationFactory):
         ie. query is now of form A & B or ((A & B) | (C & D))
         This helps in modularising query into parts and handling each of the
         parts individually.
+
+        The parts are searched concurrently. If the search of some parts
+        fails or times out, a warning is raised and the results of the other
+        parts are returned, with the errors in the ``errors`` attribute of
+        the response. If every part fails, the first error is raised.
         """
+        max_workers = kwargs.pop('max_workers', None)
+        timeout = kwargs.pop('timeout', None)
+        if kwargs:
+            raise TypeError("search() got unexpected keyword arguments {}".format(
+                ', '.join(kwargs)))
+
         query = attr.and_(*query)
-        return UnifiedResponse(query_walker.create(query, self))
+        blocks = query_walker.create(query, self)
+        outcomes = run_concurrently([partial(self._search_client, client_type, block)
+                                     for client_type, block in blocks],
+                                    max_workers=max_workers, timeout=timeout)
+
+        results = []
+        errors = []
+        for (client_type, _), (result, error) in zip(blocks, outcomes):
+            if error is None:
+                results.append(result)
+            else:
+                errors.append((client_type, error))
+        if errors and not results:
+            raise errors[0][1]
+        for client_type, error in errors:
+            warnings.warn("The search of the {} failed and its results are missing: "
+                          "{!r}".format(client_type.__name__, error), SunpyUserWarning)
+        return UnifiedResponse(results, errors=errors)
 
     # Python 3: this line should be like this
     # def fetch(self, *query_results, wait=True, progress=True, **kwargs):
@@ -414,7 +461,21 @@ class UnifiedDownloaderFactory(BasicRegistrationFactory):
             Instance of client class
         """
         candidate_widget_types = self._check_registered_widgets(*query)
-        tmpclient = candidate_widget_types[0]()
+        return self._search_client(candidate_widget_types[0], query)
+
+    @staticmethod
+    def _search_client(client_type, query):
+        """
+        Create a client and perform the query.
+
+        Returns
+        -------
+        response : `~sunpy.net.dataretriever.client.QueryResponse`
+
+        client : `object`
+            Instance of client class
+        """
+        tmpclient = client_type()
         return tmpclient.search(*query), tmpclient
 
 
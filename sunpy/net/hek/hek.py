@@ -11,23 +11,35 @@
 from __future__ import absolute_import
 
 import json
+import queue
 import codecs
+import threading
 
 from itertools import chain
-from datetime import datetime
+from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+import astropy.units as u
+from astropy.time import Time
+from astropy.table import Table, Column, MaskedColumn
+
 from sunpy.net import attr
 from sunpy.net.hek import attrs
 from sunpy.net.vso import attrs as v_attrs
-from sunpy.util import unique
 from sunpy.util.xml import xml_to_dict
 from sunpy.extern.six import iteritems
 from sunpy.extern.six.moves import urllib
 from sunpy.util import deprecated
 
-__all__ = ['HEKClient']
+__all__ = ['HEKClient', 'results_to_table']
 
 DEFAULT_URL = 'http://www.lmsal.com/hek/her'
 
+# The time format of the HEK API
+TIME_FORMAT = '%Y-%m-%dT%H:%M:%S'
+
 
 def _freeze(obj):
     """ Create hashable representation of result dict. """
@@ -38,6 +50,107 @@ def _freeze(obj):
     return obj
 
 
+def _event_id(result):
+    """
+    The identifier of an event, used to remove duplicates. Results without
+    an archive identifier fall back to their SOL identifier or contents.
+    """
+    event_id = result.get('kb_archivid') or result.get('SOL_standard')
+    if event_id:
+        return event_id
+    return _freeze(result)
+
+
+def _project(result, columns):
+    """ Keep only the given event parameters of a result. """
+    if columns is None:
+        return result
+    return {column: result[column] for column in columns if column in result}
+
+
+def _is_time_column(name):
+    return name.endswith(('time', 'date', 'daterun'))
+
+
+def _typed_column(name, values):
+    """
+    A column of the values of one event parameter, typed as times, numbers
+    or strings where all values allow it, with missing values masked.
+    """
+    present = [value for value in values if value is not None]
+    mask = [value is None for value in values]
+    if present and all(isinstance(value, str) for value in present):
+        if _is_time_column(name) and not any(mask):
+            try:
+                return Time(values, format='isot', scale='utc')
+            except ValueError:
+                pass
+        values = [value if value is not None else '' for value in values]
+    elif present and all(isinstance(value, (int, float)) and not isinstance(value, bool)
+                         for value in present):
+        dtype = int if all(isinstance(value, int) for value in present) else float
+        values = [value if value is not None else 0 for value in values]
+        return MaskedColumn(np.array(values, dtype=dtype), name=name, mask=mask)
+    elif not (present and all(isinstance(value, bool) for value in present)):
+        # Nested and mixed values are kept as Python objects.
+        array = np.empty(len(values), dtype=object)
+        array[:] = values
+        return Column(array, name=name)
+    if any(mask):
+        return MaskedColumn(values, name=name, mask=mask)
+    return Column(values, name=name)
+
+
+def results_to_table(results, columns=None):
+    """
+    Convert HEK results to a table with a typed column per event parameter.
+
+    Times are stored as `~astropy.time.Time` columns and numbers as integer
+    or float columns, with the values missing from some events masked.
+
+    Parameters
+    ----------
+    results : iterable of `dict`
+        The results, e.g. `~sunpy.net.hek.hek.Response` objects.
+
+    columns : `list` of `str`, optional
+        The event parameters to include, in order. Defaults to all event
+        parameters of the results, sorted by name.
+
+    Returns
+    -------
+    `~astropy.table.Table`
+    """
+    results = list(results)
+    if columns is None:
+        columns = sorted(set(chain.from_iterable(results)))
+    table = Table()
+    for name in columns:
+        table[name] = _typed_column(name, [result.get(name) for result in results])
+    return table
+
+
+def _split_time(data, window):
+    """
+    Split the time range of the parameters of a request into windows of at
+    most ``window``.
+    """
+    if window is None or 'event_starttime' not in data:
+        return [data]
+    start = datetime.strptime(data['event_starttime'], TIME_FORMAT)
+    end = datetime.strptime(data['event_endtime'], TIME_FORMAT)
+    windows = []
+    while True:
+        stop = min(start + window, end)
+        new = data.copy()
+        new['event_starttime'] = start.strftime(TIME_FORMAT)
+        new['event_endtime'] = stop.strftime(TIME_FORMAT)
+        windows.append(new)
+        if stop >= end:
+            return windows
+        start = stop
+
+
 class HEKClient(object):
     """ Client to interact with the Heliophysics Event Knowledgebase (HEK).
     The HEK stores solar feature and event data generated by algorithms and
@@ -57,44 +170,169 @@ class HEKClient(object):
     def __init__(self, url=DEFAULT_URL):
         self.url = url
 
-    def _download(self, data):
-        """ Download all data, even if paginated. """
-        page = 1
-        results = []
+    def _fetch_page(self, data):
+        """ Download a single page of results. """
         reader = codecs.getreader("utf-8")
+        fd = urllib.request.urlopen(
+            self.url, urllib.parse.urlencode(data).encode('utf-8'))
+        try:
+            return json.load(reader(fd))
+        finally:
+            fd.close()
 
-        while True:
+    def _pages(self, data, stop=None):
+        """ Yield the results of each page of a request, in order. """
+        data = data.copy()
+        page = 1
+        while stop is None or not stop.is_set():
             data['page'] = page
-            fd = urllib.request.urlopen(
-                self.url, urllib.parse.urlencode(data).encode('utf-8'))
-            try:
-                result = json.load(reader(fd))
-            finally:
-                fd.close()
-            results.extend(result['result'])
+            result = self._fetch_page(data)
+            yield result['result']
 
             if not result['overmax']:
-                return list(map(Response, results))
+                return
             page += 1
 
-    def search(self, *query):
+    def _download(self, data):
+        """ Download all data, even if paginated. """
+        return list(map(Response, chain.from_iterable(self._pages(data))))
+
+    def _requests(self, query, window, columns=None):
+        """ The parameters of the requests needed to answer a query. """
+        if isinstance(window, u.Quantity):
+            window = timedelta(seconds=window.to_value(u.s))
+
+        query = attr.and_(*query)
+        requests = []
+        for elem in attrs.walker.create(query, {}):
+            new = self.default.copy()
+            new.update(elem)
+            if columns is not None:
+                # The identifiers are needed to remove duplicates.
+                returned = list(columns) + ['kb_archivid', 'SOL_standard']
+                new['return'] = ','.join(sorted(set(returned), key=returned.index))
+            requests.extend(_split_time(new, window))
+        return requests
+
+    def _stream(self, requests, max_workers=None):
+        """
+        Yield ``(request index, page number, results)`` for the pages of all
+        requests as they arrive, fetching the requests concurrently.
+        """
+        if len(requests) == 1:
+            for number, results in enumerate(self._pages(requests[0])):
+                yield 0, number, results
+            return
+
+        pages = queue.Queue()
+        stop = threading.Event()
+
+        def fetch(index, data):
+            try:
+                for number, results in enumerate(self._pages(data, stop)):
+                    pages.put((index, number, results))
+                pages.put((index, None, None))
+            except Exception as e:
+                pages.put((index, None, e))
+
+        executor = ThreadPoolExecutor(max_workers=max_workers or len(requests))
+        futures = [executor.submit(fetch, index, data) for index, data in enumerate(requests)]
+        remaining = len(requests)
+        try:
+            while remaining:
+                index, number, results = pages.get()
+                if number is None:
+                    remaining -= 1
+                    if results is not None:
+                        raise results
+                else:
+                    yield index, number, results
+        finally:
+            # Stop the remaining requests when the consumer stops early or
+            # a request failed.
+            stop.set()
+            for future in futures:
+                future.cancel()
+            executor.shutdown(wait=False)
+
+    def search(self, *query, window=None, max_workers=None, columns=None,
+               table=False):
         """ Retrieves information about HEK records matching the criteria
         given in the query expression. If multiple arguments are passed,
         they are connected with AND. The result of a query is a list of
-        unique HEK Response objects that fulfill the criteria."""
-        query = attr.and_(*query)
+        unique HEK Response objects that fulfill the criteria.
 
-        data = attrs.walker.create(query, {})
-        ndata = []
-        for elem in data:
-            new = self.default.copy()
-            new.update(elem)
-            ndata.append(new)
+        Parameters
+        ----------
+        query : `sunpy.net.hek.attrs`
+            The query attributes.
 
-        if len(ndata) == 1:
-            return self._download(ndata[0])
-        else:
-            return self._merge(self._download(data) for data in ndata)
+        window : `datetime.timedelta` or `~astropy.units.Quantity`, optional
+            Split the time range of the query into windows of this length,
+            which are fetched concurrently. Defaults to `None`, which does not
+            split the time range.
+
+        max_workers : `int`, optional
+            The maximum number of requests made at once. Defaults to making
+            all requests at once.
+
+        columns : `list` of `str`, optional
+            The event parameters to return, e.g.
+            ``['event_starttime', 'fl_goescls']``. Defaults to all parameters.
+
+        table : `bool`, optional
+            Return the results as an `~astropy.table.Table` with a typed
+            column per event parameter, see
+            `~sunpy.net.hek.hek.results_to_table`, instead of a list.
+
+        Returns
+        -------
+        `list` or `~astropy.table.Table`
+            The unique `~sunpy.net.hek.hek.Response` objects, in the order of
+            the time windows and the pages of the HEK.
+
+        Examples
+        --------
+        >>> from sunpy.net import hek
+        >>> client = hek.HEKClient()
+        >>> flares = client.search(hek.attrs.Time('2011/08/09', '2011/08/10'),
+        ...                        hek.attrs.EventType('FL'),
+        ...                        columns=['event_starttime', 'fl_goescls', 'fl_peakflux'],
+        ...                        table=True)  # doctest: +REMOTE_DATA
+        >>> bright = flares[flares['fl_peakflux'] > 1e-5]  # doctest: +REMOTE_DATA
+        """
+        requests = self._requests(query, window, columns)
+        pages = sorted(self._stream(requests, max_workers), key=lambda page: page[:2])
+        results = self._merge((results for _, _, results in pages), columns)
+        if table:
+            return results_to_table(results, columns)
+        return results
+
+    def search_iter(self, *query, window=None, max_workers=None, columns=None):
+        """
+        Retrieve HEK records like `~sunpy.net.hek.HEKClient.search`, but
+        yield the unique `~sunpy.net.hek.hek.Response` objects as soon as
+        their page arrives, in the order the pages arrive.
+
+        Stopping the iteration stops further pages from being requested.
+
+        Examples
+        --------
+        >>> from sunpy.net import hek
+        >>> client = hek.HEKClient()
+        >>> flares = client.search_iter(hek.attrs.Time('2011/01/01', '2012/01/01'),
+        ...                             hek.attrs.EventType('FL'))
+        >>> for flare in flares:  # doctest: +SKIP
+        ...     print(flare['fl_goescls'])
+        """
+        requests = self._requests(query, window, columns)
+        seen = set()
+        for _, _, results in self._stream(requests, max_workers):
+            for result in results:
+                event_id = _event_id(result)
+                if event_id not in seen:
+                    seen.add(event_id)
+                    yield Response(_project(result, columns))
 
     @deprecated('0.8', alternative='HEKClient.search')
     def query(self, *query):
@@ -103,10 +341,16 @@ class HEKClient(object):
         """
         return self.search(*query)
 
-
-    def _merge(self, responses):
-        """ Merge responses, removing duplicates. """
-        return list(unique(chain.from_iterable(responses), _freeze))
+    def _merge(self, responses, columns=None):
+        """ Merge responses, removing duplicates by their event identifier. """
+        seen = set()
+        merged = []
+        for result in chain.from_iterable(responses):
+            event_id = _event_id(result)
+            if event_id not in seen:
+                seen.add(event_id)
+                merged.append(Response(_project(result, columns)))
+        return merged
 
 
 class Response(dict):
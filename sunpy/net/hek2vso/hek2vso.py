@@ -15,6 +15,7 @@ from __future__ import absolute_import
 
 import sys
 from astropy import units
+from astropy.table import Table
 
 from sunpy.net import hek
 from sunpy.net import vso
@@ -37,7 +38,8 @@ def translate_results_to_query(results):
     Parameters
     ----------
     results : `sunpy.net.hek.hek.Response` or list of `sunpy.net.hek.hek.Response`
-        The HEK results from a HEK query to be translated.
+        The HEK results from a HEK query to be translated, which can also be
+        the rows of an `~astropy.table.Table` of results.
 
     Examples
     --------
@@ -57,7 +59,7 @@ def translate_results_to_query(results):
     [[<Time(datetime.datetime(2011, 8, 8, 1, 30, 4), datetime.datetime(2011, 8, 10, 0, 0, 4), None)>, <Source(u'SDO')>, <Instrument(u'AIA')>, <Wave(210.99999999999997, 210.99999999999997, 'Angstrom')>], ..., [<Time(datetime.datetime(2011, 8, 9, 8, 1, 21), datetime.datetime(2011, 8, 9, 8, 16, 45), None)>, <Source(u'SDO')>, <Instrument(u'AIA')>, <Wave(303.99999999999994, 303.99999999999994, 'Angstrom')>]]
     """
     queries = []
-    if type(results) is list:
+    if type(results) is list or isinstance(results, Table):
         for result in results:
             query = vso_attribute_parse(result)
             queries.append(query)
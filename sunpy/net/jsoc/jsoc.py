@@ -2,10 +2,13 @@
 from __future__ import print_function, absolute_import
 
 import os
+import json
 import time
 import warnings
+import threading
 from functools import partial
 from collections import Sequence
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 import numpy as np
 import pandas as pd
@@ -18,7 +21,9 @@ import drms
 from sunpy import config
 from sunpy.net.download import Downloader, Results
 from sunpy.net.attr import and_
+from sunpy.net.cache import cached_search
 from sunpy.net.jsoc.attrs import walker
+from sunpy.net.jsoc.series import get_series_info, get_drms_client
 from sunpy.extern.six.moves import urllib
 from sunpy.extern import six
 from sunpy.util import deprecated
@@ -38,6 +43,34 @@ class NotExportedError(Exception):
     pass
 
 
+class _ExportState(object):
+    """
+    The IDs of submitted export requests, optionally stored in a JSON file
+    so that an interrupted fetch can be resumed.
+    """
+
+    def __init__(self, filename=None):
+        self.filename = os.path.expanduser(filename) if filename else None
+        self._ids = {}
+        self._lock = threading.Lock()
+        if self.filename and os.path.exists(self.filename):
+            with open(self.filename) as f:
+                self._ids = json.load(f)
+
+    def get(self, key):
+        with self._lock:
+            return self._ids.get(key)
+
+    def set(self, key, requestid):
+        with self._lock:
+            self._ids[key] = requestid
+            if self.filename:
+                temporary = self.filename + '.tmp'
+                with open(temporary, 'w') as f:
+                    json.dump(self._ids, f, indent=1)
+                os.replace(temporary, self.filename)
+
+
 class JSOCResponse(Sequence):
     def __init__(self, table=None):
         """
@@ -226,6 +259,7 @@ class JSOCClient(object):
 
     """
 
+    @cached_search()
     def search(self, *query, **kwargs):
         """
         Build a JSOC query and submit it to JSOC for processing.
@@ -428,25 +462,28 @@ class JSOCClient(object):
         requests = []
         self.query_args = jsoc_response.query_args
         for block in jsoc_response.query_args:
-
-            ds = self._make_recordset(**block)
-            cd = drms.Client(email=block.get('notify', ''))
-            protocol = block.get('protocol', 'fits')
-
-            if protocol != 'fits' and protocol != 'as-is':
-                error_message = "Protocols other than fits and as-is are "\
-                                "are not supported."
-                raise TypeError(error_message)
-
-            method = 'url' if protocol == 'fits' else 'url_quick'
-            r = cd.export(ds, method=method, protocol=protocol)
-
-            requests.append(r)
+            requests.append(self._export(block))
 
         if len(requests) == 1:
             return requests[0]
         return requests
 
+    def _export(self, block, dataset=None):
+        """
+        Submit the export request of one block of a query.
+        """
+        ds = dataset or self._make_recordset(**block)
+        cd = get_drms_client(email=block.get('notify', ''))
+        protocol = block.get('protocol', 'fits')
+
+        if protocol != 'fits' and protocol != 'as-is':
+            error_message = "Protocols other than fits and as-is are "\
+                            "are not supported."
+            raise TypeError(error_message)
+
+        method = 'url' if protocol == 'fits' else 'url_quick'
+        return cd.export(ds, method=method, protocol=protocol)
+
     @deprecated('0.9', alternative='drms.ExportRequest.status')
     def check_request(self, requests):
         """
@@ -494,11 +531,16 @@ class JSOCClient(object):
         return allstatus
 
     def fetch(self, jsoc_response, path=None, overwrite=False, progress=True,
-              max_conn=5, downloader=None, sleep=10):
+              max_conn=5, downloader=None, sleep=10, pipeline=False, state_file=None):
         """
         Make the request for the data in a JSOC response and wait for it to be
         staged and then download the data.
 
+        In pipelined mode, the export requests of all the blocks of the
+        response are submitted and polled at once, and the files of each
+        request are downloaded as soon as that request is staged, rather than
+        after the requests before it.
+
         Parameters
         ----------
         jsoc_response : `~sunpy.net.jsoc.jsoc.JSOCResponse` object
@@ -521,14 +563,37 @@ class JSOCClient(object):
 
         sleep : `int`
             The number of seconds to wait between calls to JSOC to check the status
-            of the request.
+            of the request. In pipelined mode, the status is first checked
+            after half of this and the wait doubles up to six times this.
+
+        pipeline : `bool`
+            Submit and poll all export requests concurrently and download the
+            files of each request as soon as it is staged.
+
+        state_file : `str`
+            A JSON file recording the IDs of the export requests submitted in
+            pipelined mode. When the fetch is repeated with the same file,
+            e.g. after a restart, requests which are still available on JSOC
+            are reused instead of submitted again, and files which were
+            already downloaded are skipped unless ``overwrite`` is set.
 
         Returns
         -------
         results : a `~sunpy.net.download.Results` instance
             A Results object
 
+        Examples
+        --------
+        >>> res = client.fetch(response, pipeline=True,
+        ...                    state_file='hmi_export.json')  # doctest: +SKIP
+        >>> files = res.wait()  # doctest: +SKIP
+
         """
+        if pipeline or state_file is not None:
+            return self._fetch_pipelined(jsoc_response, path=path, overwrite=overwrite,
+                                         progress=progress, max_conn=max_conn,
+                                         downloader=downloader, sleep=sleep,
+                                         state_file=state_file)
 
         # Make staging request to JSOC
         responses = self.request_data(jsoc_response)
@@ -548,6 +613,71 @@ class JSOCClient(object):
 
         return r
 
+    def _fetch_pipelined(self, jsoc_response, path=None, overwrite=False, progress=True,
+                         max_conn=5, downloader=None, sleep=10, state_file=None):
+        """
+        Stage the blocks of a response concurrently and download the files of
+        each block as soon as its export request is ready.
+        """
+        state = _ExportState(state_file)
+        blocks = jsoc_response.query_args
+
+        if downloader is None:
+            downloader = Downloader(max_conn=max_conn, max_total=max_conn)
+        results = Results(lambda _: None, done=lambda maps: [v['path'] for v in maps.values()])
+        # Keep the results unfinished until the last request has been queued.
+        queued = results.require([])
+
+        requests = [None] * len(blocks)
+        with ThreadPoolExecutor(max_workers=max(len(blocks), 1)) as executor:
+            futures = {executor.submit(self._stage_block, block, state, sleep): i
+                       for i, block in enumerate(blocks)}
+            for future in as_completed(futures):
+                try:
+                    request = future.result()
+                except Exception as e:
+                    results.require([])
+                    results.add_error(e)
+                    continue
+                requests[futures[future]] = request
+                self.get_request(request, path=path, overwrite=overwrite, progress=progress,
+                                 downloader=downloader, results=results)
+
+        jsoc_response.requests = [r for r in requests if r is not None]
+        queued(None)
+        return results
+
+    def _stage_block(self, block, state, sleep=10):
+        """
+        Submit or resume the export request of a block and poll it until it
+        has finished, backing off between status checks.
+        """
+        ds = self._make_recordset(**block)
+        key = '{0}|{1}|{2}'.format(ds, block.get('protocol', 'fits'), block.get('notify', ''))
+
+        request = None
+        requestid = state.get(key)
+        if requestid is not None:
+            try:
+                request = get_drms_client().export_from_id(requestid)
+            except Exception:
+                # The request has expired or is unknown to JSOC.
+                request = None
+            if request is not None and request.has_failed():
+                request = None
+        if request is None:
+            request = self._export(block, dataset=ds)
+            state.set(key, request.id)
+
+        delay = sleep / 2.
+        while not request.has_finished():
+            time.sleep(delay)
+            delay = min(2 * delay, 6 * sleep)
+        if request.has_failed(skip_update=True):
+            raise NotExportedError("The export request {0} of {1} failed with status "
+                                   "{2}.".format(request.id, ds, request.status))
+        return request
+
     @deprecated('0.8', alternative='JSOCClient.fetch')
     def get(self, jsoc_response, path=None, overwrite=False, progress=True,
             max_conn=5, downloader=None, sleep=10):
@@ -594,7 +724,7 @@ class JSOCClient(object):
             A `~sunpy.net.download.Results` instance or `None` if no URLs to download
 
         """
-        c = drms.Client()
+        c = get_drms_client()
 
         # Convert Responses to a list if not already
         if isinstance(requests, six.string_types) or not isiterable(requests):
@@ -809,8 +939,7 @@ class JSOCClient(object):
 
         # Extract and format primekeys
         pkstr = ''
-        c = drms.Client()
-        si = c.info(series)
+        si = get_series_info(series)
         pkeys_isTime = si.keywords.loc[si.primekeys].is_time
         for pkey in pkeys_isTime.index.values:
             # The loop is iterating over the list of prime-keys existing for the given series.
@@ -842,7 +971,7 @@ class JSOCClient(object):
 
         keywords_default = ['T_REC', 'TELESCOP', 'INSTRUME', 'WAVELNTH', 'CAR_ROT']
         isMeta = iargs.get('meta', False)
-        c = drms.Client()
+        c = get_drms_client()
 
         if isMeta:
             keywords = '**ALL**'
@@ -861,7 +990,8 @@ class JSOCClient(object):
         # Raise errors for PrimeKeys
         # Get a set of the PrimeKeys that exist for the given series, and check
         # whether the passed PrimeKeys is a subset of that.
-        pkeys = c.pkeys(iargs['series'])
+        si = get_series_info(iargs['series'])
+        pkeys = list(si.primekeys)
         pkeys_passed = iargs.get('primekey', None)  # pkeys_passes is a dict, with key-value pairs.
         if pkeys_passed is not None:
             if not set(list(pkeys_passed.keys())) <= set(pkeys):
@@ -880,7 +1010,6 @@ class JSOCClient(object):
         # Raise errors for segments
         # Get a set of the segments that exist for the given series, and check
         # whether the passed segments is a subset of that.
-        si = c.info(iargs['series'])
         segs = list(si.segments.index.values)          # Fetches all valid segment names
         segs_passed = iargs.get('segment', None)
         if segs_passed is not None:
@@ -0,0 +1,176 @@
+"""
+A process-wide cache of the metadata of JSOC data series and a pool of DRMS
+clients shared by the JSOC searches, exports and downloads.
+
+The metadata of a series, i.e. its prime keys, segments and keywords, rarely
+changes, so it is kept in memory and on disk and only requested from JSOC
+again once it has expired.
+"""
+from __future__ import absolute_import, division, print_function
+
+import os
+import time
+import pickle
+import threading
+
+import drms
+
+from sunpy.util.config import get_and_create_cache_dir
+
+__all__ = ['SeriesInfoCache', 'get_series_info', 'get_drms_client']
+
+# The clients shared by all JSOC requests, keyed by their email address
+_clients = {}
+_clients_lock = threading.Lock()
+
+# The cache of series metadata used by the JSOC client
+_series_cache = None
+_series_cache_lock = threading.Lock()
+
+
+def get_drms_client(email=None):
+    """
+    The shared `drms.Client` for an email address.
+
+    Parameters
+    ----------
+    email : `str`, optional
+        The email address registered with JSOC, needed for exports. It is
+        only validated with JSOC when its client is created.
+
+    Returns
+    -------
+    `drms.Client`
+    """
+    with _clients_lock:
+        if email not in _clients:
+            _clients[email] = drms.Client(email=email)
+        return _clients[email]
+
+
+class SeriesInfoCache(object):
+    """
+    The metadata of JSOC series, kept in memory and in a directory of pickle
+    files until it expires.
+
+    Parameters
+    ----------
+    directory : `str`, optional
+        The directory to store the metadata in. Defaults to ``jsoc`` in the
+        ``cache_dir`` of the ``downloads`` section of the sunpy configuration.
+        If `False`, the metadata is only kept in memory.
+
+    ttl : `float`, optional
+        The number of seconds after which the metadata of a series is
+        requested again. Defaults to one day.
+    """
+
+    def __init__(self, directory=None, ttl=86400):
+        if directory is None:
+            directory = os.path.join(get_and_create_cache_dir(), 'jsoc')
+        if directory:
+            directory = os.path.expanduser(directory)
+            os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self.ttl = ttl
+        self._infos = {}
+        self._lock = threading.Lock()
+
+    def __getitem__(self, series):
+        return self.get(series)
+
+    def get(self, series):
+        """
+        The metadata of a series.
+
+        Parameters
+        ----------
+        series : `str`
+            The name of the series, or a record set of the series.
+
+        Returns
+        -------
+        `drms.SeriesInfo`
+        """
+        name = series.split('[')[0].split('{')[0].strip().lower()
+        with self._lock:
+            if name in self._infos:
+                stored, info = self._infos[name]
+                if time.time() - stored <= self.ttl:
+                    return info
+
+        stored, info = self._load(name)
+        if info is None:
+            # A drms client keeps the metadata it looked up forever, so it is
+            # looked up with a client of its own to be able to expire it.
+            stored, info = time.time(), drms.Client().info(name)
+            self._save(name, stored, info)
+
+        with self._lock:
+            self._infos[name] = (stored, info)
+        return info
+
+    def clear(self):
+        """
+        Remove the metadata of all series from the cache.
+        """
+        with self._lock:
+            self._infos.clear()
+        if self.directory:
+            for filename in os.listdir(self.directory):
+                if filename.endswith('.pickle'):
+                    os.remove(os.path.join(self.directory, filename))
+
+    def _path(self, name):
+        return os.path.join(self.directory, name + '.pickle')
+
+    def _load(self, name):
+        """``(time stored, series info)``, or ``(None, None)`` if not fresh."""
+        if not self.directory:
+            return None, None
+        try:
+            with open(self._path(name), 'rb') as f:
+                stored, info = pickle.load(f)
+        except Exception:
+            # Missing, or written by incompatible versions of drms or pandas
+            return None, None
+        if time.time() - stored > self.ttl:
+            return None, None
+        return stored, info
+
+    def _save(self, name, stored, info):
+        if not self.directory:
+            return
+        path = self._path(name)
+        temporary = '{0}.{1}.tmp'.format(path, os.getpid())
+        with open(temporary, 'wb') as f:
+            pickle.dump((stored, info), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temporary, path)
+
+
+def get_series_info(series):
+    """
+    The metadata of a JSOC series from the process-wide
+    `~sunpy.net.jsoc.series.SeriesInfoCache`.
+
+    Parameters
+    ----------
+    series : `str`
+        The name of the series, e.g. ``'hmi.m_45s'``.
+
+    Returns
+    -------
+    `drms.SeriesInfo`
+
+    Examples
+    --------
+    >>> from sunpy.net.jsoc.series import get_series_info
+    >>> get_series_info('hmi.m_45s').primekeys  # doctest: +REMOTE_DATA
+    ['T_REC', 'CAMERA']
+    """
+    global _series_cache
+    with _series_cache_lock:
+        if _series_cache is None:
+            _series_cache = SeriesInfoCache()
+        cache = _series_cache
+    return cache.get(series)
@@ -1,5 +1,6 @@
 # -*- coding: utf-8 -*-
 import os
+import json
 import tempfile
 import datetime
 import pandas as pd
@@ -10,6 +11,7 @@ import astropy.units as u
 import pytest
 
 from sunpy.net.jsoc import JSOCClient, JSOCResponse
+from sunpy.net.jsoc import jsoc
 from sunpy.net.download import Results
 import sunpy.net.jsoc.attrs as attrs
 import sunpy.net.vso.attrs as vso_attrs
@@ -311,3 +313,96 @@ def test_results_filenames():
     assert len(files) == len(responses)
     for hmiurl in aa.map_:
         assert os.path.isfile(hmiurl)
+
+
+class StandInExport(object):
+    """
+    An export request which is staged after a number of status checks.
+    """
+
+    def __init__(self, requestid, checks=0, status=0):
+        self.id = requestid
+        self.checks = checks
+        self.final_status = status
+        self.status = 1
+
+    def has_finished(self, skip_update=False):
+        if not skip_update:
+            self.checks -= 1
+            if self.checks < 0:
+                self.status = self.final_status
+        return self.status != 1
+
+    def has_failed(self, skip_update=False):
+        return self.has_finished(skip_update) and self.status != 0
+
+
+@pytest.fixture
+def stand_in_exports(monkeypatch):
+    """
+    Stage the blocks of a query with stand-in export requests, recording the
+    order in which the requests are downloaded.
+    """
+    checks = {'a': 5, 'b': 0, 'c': 1}
+    exports = {}
+    downloaded = []
+
+    def export(self, block, dataset=None):
+        request = StandInExport('JSOC_' + block['series'], checks[block['series']],
+                                block.get('status', 0))
+        exports[block['series']] = request
+        return request
+
+    def get_request(self, request, **kwargs):
+        downloaded.append(request.id)
+        kwargs['results'].require([request.id])({'path': request.id})
+        return kwargs['results']
+
+    monkeypatch.setattr(JSOCClient, '_make_recordset', lambda self, **block: block['series'])
+    monkeypatch.setattr(JSOCClient, '_export', export)
+    monkeypatch.setattr(JSOCClient, 'get_request', get_request)
+    return exports, downloaded
+
+
+def test_fetch_pipelined(stand_in_exports):
+    exports, downloaded = stand_in_exports
+    response = JSOCResponse()
+    response.query_args = [{'series': 'a'}, {'series': 'b'}, {'series': 'c'}]
+    res = client.fetch(response, pipeline=True, sleep=0.02)
+    # Each request is downloaded as soon as it is staged.
+    assert downloaded == ['JSOC_b', 'JSOC_c', 'JSOC_a']
+    assert sorted(res.wait(progress=False)) == ['JSOC_a', 'JSOC_b', 'JSOC_c']
+    assert [r.id for r in response.requests] == ['JSOC_a', 'JSOC_b', 'JSOC_c']
+
+
+def test_fetch_pipelined_failure(stand_in_exports):
+    exports, downloaded = stand_in_exports
+    response = JSOCResponse()
+    response.query_args = [{'series': 'a', 'status': 4}, {'series': 'b'}]
+    res = client.fetch(response, pipeline=True, sleep=0.02)
+    assert res.wait(progress=False) == ['JSOC_b']
+    assert len(res.errors) == 1
+    assert isinstance(res.errors[0], jsoc.NotExportedError)
+
+
+def test_fetch_pipelined_resume(stand_in_exports, monkeypatch, tmpdir):
+    exports, downloaded = stand_in_exports
+    state_file = str(tmpdir.join('state.json'))
+    response = JSOCResponse()
+    response.query_args = [{'series': 'a'}, {'series': 'b'}]
+    client.fetch(response, state_file=state_file, sleep=0.02).wait(progress=False)
+    with open(state_file) as f:
+        assert sorted(json.load(f).values()) == ['JSOC_a', 'JSOC_b']
+
+    class StandInClient(object):
+        def export_from_id(self, requestid):
+            if requestid == 'JSOC_a':
+                raise ValueError("Request expired")
+            return StandInExport(requestid)
+
+    monkeypatch.setattr(jsoc, 'get_drms_client', lambda email=None: StandInClient())
+    exports.clear()
+    res = client.fetch(response, state_file=state_file, sleep=0.02)
+    assert sorted(res.wait(progress=False)) == ['JSOC_a', 'JSOC_b']
+    # Only the expired request is submitted again.
+    assert list(exports) == ['a']
@@ -0,0 +1,103 @@
+# -*- coding: utf-8 -*-
+import os
+import time
+
+import pytest
+
+from sunpy.net.jsoc import series
+
+DESCRIPTION = {'primekeys': ['T_REC', 'WAVELNTH'],
+               'keywords': [{'name': 'T_REC', 'type': 'time'},
+                            {'name': 'WAVELNTH', 'type': 'int'}],
+               'links': [],
+               'segments': [{'name': 'image'}]}
+
+
+class StandInClient(object):
+    """
+    A drms client which counts the series lookups instead of asking JSOC.
+    """
+    created = []
+    lookups = []
+
+    def __init__(self, email=None):
+        self.email = email
+        StandInClient.created.append(self)
+
+    def info(self, name):
+        StandInClient.lookups.append(name)
+        return series.drms.SeriesInfo(DESCRIPTION, name=name)
+
+
+@pytest.fixture
+def stand_in_client(monkeypatch):
+    StandInClient.created = []
+    StandInClient.lookups = []
+    monkeypatch.setattr(series.drms, 'Client', StandInClient)
+    monkeypatch.setattr(series, '_clients', {})
+    return StandInClient
+
+
+def test_get_drms_client(stand_in_client):
+    client = series.get_drms_client()
+    assert series.get_drms_client() is client
+    notify = series.get_drms_client('sunpy@sunpy.org')
+    assert notify is not client
+    assert notify.email == 'sunpy@sunpy.org'
+    assert series.get_drms_client('sunpy@sunpy.org') is notify
+    assert len(stand_in_client.created) == 2
+
+
+def test_series_info_cache(stand_in_client, tmpdir):
+    cache = series.SeriesInfoCache(str(tmpdir))
+    info = cache.get('aia.lev1_euv_12s')
+    assert info.primekeys == ['T_REC', 'WAVELNTH']
+    assert list(info.segments.index.values) == ['image']
+    # Record sets and differently cased names share the metadata of the series.
+    assert cache['AIA.lev1_euv_12s[2014.01.01][171]{image}'] is info
+    assert stand_in_client.lookups == ['aia.lev1_euv_12s']
+    # The shared drms clients do not keep metadata which would never expire.
+    assert series._clients == {}
+    assert os.listdir(str(tmpdir)) == ['aia.lev1_euv_12s.pickle']
+
+
+def test_series_info_cache_disk(stand_in_client, tmpdir):
+    series.SeriesInfoCache(str(tmpdir)).get('aia.lev1_euv_12s')
+    info = series.SeriesInfoCache(str(tmpdir)).get('aia.lev1_euv_12s')
+    assert info.primekeys == ['T_REC', 'WAVELNTH']
+    assert info.keywords.loc['T_REC'].is_time
+    assert len(stand_in_client.lookups) == 1
+
+
+def test_series_info_cache_unreadable(stand_in_client, tmpdir):
+    tmpdir.join('aia.lev1_euv_12s.pickle').write('not a pickle')
+    info = series.SeriesInfoCache(str(tmpdir)).get('aia.lev1_euv_12s')
+    assert info.primekeys == ['T_REC', 'WAVELNTH']
+    assert len(stand_in_client.lookups) == 1
+    assert series.SeriesInfoCache(str(tmpdir)).get('aia.lev1_euv_12s').primekeys == info.primekeys
+    assert len(stand_in_client.lookups) == 1
+
+
+def test_series_info_cache_expires(stand_in_client, tmpdir):
+    cache = series.SeriesInfoCache(str(tmpdir), ttl=0.1)
+    cache.get('aia.lev1_euv_12s')
+    time.sleep(0.2)
+    cache.get('aia.lev1_euv_12s')
+    series.SeriesInfoCache(str(tmpdir), ttl=0.1).get('aia.lev1_euv_12s')
+    assert len(stand_in_client.lookups) == 2
+
+
+def test_series_info_cache_memory_only(stand_in_client, tmpdir):
+    cache = series.SeriesInfoCache(False)
+    cache.get('aia.lev1_euv_12s')
+    cache.get('aia.lev1_euv_12s')
+    assert len(stand_in_client.lookups) == 1
+
+
+def test_series_info_cache_clear(stand_in_client, tmpdir):
+    cache = series.SeriesInfoCache(str(tmpdir))
+    cache.get('aia.lev1_euv_12s')
+    cache.clear()
+    assert os.listdir(str(tmpdir)) == []
+    cache.get('aia.lev1_euv_12s')
+    assert len(stand_in_client.lookups) == 2
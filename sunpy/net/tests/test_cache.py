@@ -0,0 +1,210 @@
+import os
+import pickle
+from types import SimpleNamespace
+
+import pytest
+import astropy.table
+from suds import sudsobject
+
+from sunpy.net import Fido, attrs as a
+from sunpy.net import cache
+from sunpy.net.dataretriever.client import QueryResponse
+from sunpy.net.dataretriever.sources.lyra import LYRAClient
+from sunpy.net.jsoc import JSOCClient, JSOCResponse
+from sunpy.net.vso import VSOClient
+
+
+@pytest.fixture
+def query_cache(tmpdir):
+    yield cache.enable_query_cache(str(tmpdir.join('queries')))
+    cache.disable_query_cache()
+
+
+@pytest.fixture
+def count_lyra_urls(monkeypatch):
+    calls = []
+    original = LYRAClient._get_url_for_timerange
+
+    def counted(self, *args, **kwargs):
+        calls.append(args)
+        return original(self, *args, **kwargs)
+
+    monkeypatch.setattr(LYRAClient, '_get_url_for_timerange', counted)
+    return calls
+
+
+def test_key_is_normalized(tmpdir):
+    query_cache = cache.QueryCache(str(tmpdir))
+    time_attr = a.Time('2012/1/1', '2012/1/2')
+    key = query_cache.key(LYRAClient, [time_attr, a.Instrument('lyra')])
+    assert key == query_cache.key(LYRAClient, [a.Instrument('lyra') & time_attr])
+    assert key == query_cache.key(LYRAClient, [a.Instrument('lyra'), a.Time('2012/1/1', '2012/1/2')])
+    assert key != query_cache.key(VSOClient, [time_attr, a.Instrument('lyra')])
+    assert key != query_cache.key(LYRAClient, [a.Time('2012/1/1', '2012/1/3'), a.Instrument('lyra')])
+    assert key != query_cache.key(LYRAClient, [time_attr, a.Instrument('lyra')], {'level': 2})
+    either = a.Instrument('lyra') | a.Instrument('eve')
+    other_order = a.Instrument('eve') | a.Instrument('lyra')
+    assert query_cache.key(LYRAClient, [time_attr, either]) == \
+        query_cache.key(LYRAClient, [time_attr, other_order])
+
+
+def test_generic_client_cached(query_cache, count_lyra_urls):
+    query = [a.Time('2012/1/1', '2012/1/3'), a.Instrument('lyra')]
+    first = LYRAClient().search(*query)
+    second = LYRAClient().search(*query)
+    assert len(count_lyra_urls) == 1
+    assert isinstance(second, QueryResponse)
+    assert [block.url for block in second] == [block.url for block in first]
+    assert len(query_cache) == 1
+
+
+def test_disabled_cache(tmpdir, count_lyra_urls):
+    assert cache.get_query_cache() is None
+    query = [a.Time('2012/1/1', '2012/1/3'), a.Instrument('lyra')]
+    LYRAClient().search(*query)
+    LYRAClient().search(*query)
+    assert len(count_lyra_urls) == 2
+
+
+def test_ttl(query_cache, count_lyra_urls):
+    query_cache.ttls['GenericClient'] = -1
+    query = [a.Time('2012/1/1', '2012/1/3'), a.Instrument('lyra')]
+    LYRAClient().search(*query)
+    LYRAClient().search(*query)
+    assert len(count_lyra_urls) == 2
+    assert query_cache.ttl(LYRAClient) == -1
+    assert query_cache.ttl(VSOClient) == query_cache.default_ttl
+
+
+def test_eviction(tmpdir):
+    query_cache = cache.QueryCache(str(tmpdir), max_size=2500)
+    for i in range(3):
+        query_cache.set(LYRAClient, str(i), b'x' * 1000)
+        # Make sure the entries have distinct use times
+        os.utime(query_cache._path(str(i)), (i, i))
+    assert len(query_cache) == 2
+    with pytest.raises(KeyError):
+        query_cache.get(LYRAClient, '0')
+    assert query_cache.get(LYRAClient, '2') == b'x' * 1000
+    query_cache.clear()
+    assert len(query_cache) == 0
+
+
+def test_fido_cached(query_cache, count_lyra_urls):
+    query = [a.Time('2012/1/1', '2012/1/3'), a.Instrument('lyra')]
+    first = Fido.search(*query)
+    second = Fido.search(*query, max_workers=2)
+    assert len(count_lyra_urls) == 1
+    assert second.file_num == first.file_num
+    assert isinstance(second.get_response(0).client, LYRAClient)
+    # Only the search of the client is cached
+    assert len(query_cache) == 1
+
+
+def test_jsoc_cached(query_cache, monkeypatch):
+    calls = []
+
+    def lookup(self, iargs):
+        calls.append(iargs)
+        return astropy.table.Table({'T_REC': ['2014-01-01T00:00:01Z']})
+
+    monkeypatch.setattr(JSOCClient, '_lookup_records', lookup)
+    query = [a.jsoc.Time('2014/1/1T00:00:00', '2014/1/1T00:01:00'),
+             a.jsoc.Series('aia.lev1_euv_12s')]
+    JSOCClient().search(*query)
+    response = JSOCClient().search(*query)
+    assert len(calls) == 1
+    assert isinstance(response, JSOCResponse)
+    assert list(response.table['T_REC']) == ['2014-01-01T00:00:01Z']
+    JSOCClient().search(*query, meta=True)
+    assert len(calls) == 2
+
+
+def test_partial_results_not_cached(query_cache, monkeypatch):
+    def failing_search(self, *query):
+        response = QueryResponse([])
+        response.errors = [ConnectionError()]
+        return response
+
+    class PartialClient(LYRAClient):
+        search = cache.cached_search()(failing_search)
+
+    PartialClient().search(a.Time('2012/1/1', '2012/1/3'), a.Instrument('lyra'))
+    assert len(query_cache) == 0
+
+
+def test_soap_objects_round_trip(tmpdir):
+    query_cache = cache.QueryCache(str(tmpdir))
+    record = sudsobject.Factory.object('QueryResponseItem', {'fileid': 'a', 'size': 1})
+    record.time = sudsobject.Factory.object('Time', {'start': '20100101000000'})
+    with pytest.raises(pickle.PicklingError):
+        pickle.dumps(record)
+    query_cache.set(VSOClient, 'key', [record])
+    loaded = query_cache.get(VSOClient, 'key')[0]
+    assert loaded.fileid == 'a'
+    assert loaded.time.start == '20100101000000'
+
+
+class CountedClient(LYRAClient):
+    created = 0
+
+    def __init__(self):
+        CountedClient.created += 1
+        super(CountedClient, self).__init__()
+
+
+def test_cached_clients(tmpdir, monkeypatch):
+    monkeypatch.setattr(cache, '_client_types', {CountedClient})
+    monkeypatch.setattr(CountedClient, 'created', 0)
+    query_cache = cache.QueryCache(str(tmpdir))
+    client = CountedClient()
+    query_cache.set(CountedClient, 'key', [client])
+    assert query_cache.get(CountedClient, 'key', client)[0] is client
+    # Other clients are only created when they are used
+    loaded = query_cache.get(CountedClient, 'key')[0]
+    assert isinstance(loaded, CountedClient)
+    assert CountedClient.created == 1
+    assert loaded.fetch.__func__ is LYRAClient.fetch
+    assert CountedClient.created == 2
+
+
+def test_expired_results_not_unpickled(tmpdir, monkeypatch):
+    query_cache = cache.QueryCache(str(tmpdir), default_ttl=-1)
+    query_cache.set(LYRAClient, 'key', [1])
+
+    def load(self):
+        raise AssertionError("Expired results should not be unpickled")
+
+    monkeypatch.setattr(cache._Unpickler, 'load', load)
+    with pytest.raises(KeyError):
+        query_cache.get(LYRAClient, 'key')
+    assert len(query_cache) == 0
+
+
+def test_key_depends_on_client_state(tmpdir, monkeypatch):
+    query_cache = cache.QueryCache(str(tmpdir))
+    query = [a.Time('2012/1/1', '2012/1/2')]
+    key = query_cache.key(VSOClient, query, state=('url1', 80))
+    assert key != query_cache.key(VSOClient, query, state=('url2', 80))
+    monkeypatch.setattr(cache.sunpy, '__version__', 'other')
+    assert key != query_cache.key(VSOClient, query, state=('url1', 80))
+
+    api = SimpleNamespace(wsdl=SimpleNamespace(url='url1'), options=SimpleNamespace(port=80))
+    assert VSOClient(api=api)._query_cache_state() == ('url1', 80)
+
+
+def test_unrestorable_results(tmpdir):
+    query_cache = cache.QueryCache(str(tmpdir))
+    # An entry whose result refers to a module which no longer exists
+    with open(query_cache._path('key'), 'wb') as f:
+        f.write(pickle.dumps(float(2**40)) +
+                pickle.dumps(SimpleNamespace(), 0).replace(b'types', b'nomodule'))
+    with pytest.raises(KeyError):
+        query_cache.get(LYRAClient, 'key')
+    assert len(query_cache) == 0
+
+
+def test_unpicklable_results(tmpdir):
+    query_cache = cache.QueryCache(str(tmpdir))
+    assert not query_cache.set(LYRAClient, 'key', [lambda: None])
+    assert os.listdir(str(tmpdir)) == []
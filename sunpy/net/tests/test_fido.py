@@ -1,5 +1,6 @@
 import os
 import copy
+import time
 import tempfile
 
 import pytest
@@ -307,3 +308,89 @@ def test_repr(query):
         else:
             assert "Provider" not in rep_meth()
             assert "Providers" in rep_meth()
+
+
+class StandInClient(object):
+    """
+    A client standing in for a remote service, which answers searches for
+    one instrument after a delay.
+    """
+    instrument = None
+    delay = 0.3
+    error = None
+
+    @classmethod
+    def _can_handle_query(cls, *query):
+        return any(isinstance(x, a.Instrument) and x.value == cls.instrument for x in query)
+
+    def search(self, *query):
+        time.sleep(self.delay)
+        if self.error is not None:
+            raise self.error
+        return QueryResponse([])
+
+
+def stand_in_client(instrument, delay=0.3, error=None):
+    return type('{}Client'.format(instrument.upper()), (StandInClient,),
+                {'instrument': instrument, 'delay': delay, 'error': error})
+
+
+@pytest.fixture
+def stand_in_registry():
+    original = Fido.registry
+    Fido.registry = {}
+    for client in (stand_in_client('one'), stand_in_client('two'),
+                   stand_in_client('broken', error=ConnectionError("no route")),
+                   stand_in_client('hanging', delay=5)):
+        Fido.registry[client] = client._can_handle_query
+    yield Fido.registry
+    Fido.registry = original
+
+
+def test_search_is_concurrent(stand_in_registry):
+    start = time.time()
+    res = Fido.search(a.Time("2016/10/1", "2016/10/2"),
+                      a.Instrument('one') | a.Instrument('two') | a.Instrument('one'))
+    assert time.time() - start < 0.8
+    assert [type(block.client).__name__ for block in res] == ['ONEClient', 'TWOClient',
+                                                               'ONEClient']
+    assert res.errors == []
+
+
+def test_search_max_workers(stand_in_registry):
+    start = time.time()
+    Fido.search(a.Time("2016/10/1", "2016/10/2"),
+                a.Instrument('one') | a.Instrument('two'), max_workers=1)
+    assert time.time() - start >= 0.6
+
+
+def test_search_partial_results(stand_in_registry):
+    with pytest.warns(UserWarning) as record:
+        res = Fido.search(a.Time("2016/10/1", "2016/10/2"),
+                          a.Instrument('one') | a.Instrument('broken'))
+    assert 'BROKENClient' in str(record[0].message)
+    assert len(res) == 1
+    assert type(res.get_response(0).client).__name__ == 'ONEClient'
+    assert len(res.errors) == 1
+    assert res.errors[0][0].__name__ == 'BROKENClient'
+    assert isinstance(res.errors[0][1], ConnectionError)
+
+
+def test_search_timeout(stand_in_registry):
+    start = time.time()
+    with pytest.warns(UserWarning):
+        res = Fido.search(a.Time("2016/10/1", "2016/10/2"),
+                          a.Instrument('one') | a.Instrument('hanging'), timeout=1)
+    assert time.time() - start < 3
+    assert len(res) == 1
+    assert isinstance(res.errors[0][1], TimeoutError)
+
+
+def test_search_all_failed(stand_in_registry):
+    with pytest.raises(ConnectionError):
+        Fido.search(a.Time("2016/10/1", "2016/10/2"), a.Instrument('broken'))
+
+
+def test_search_unexpected_keyword(stand_in_registry):
+    with pytest.raises(TypeError):
+        Fido.search(a.Time("2016/10/1", "2016/10/2"), a.Instrument('one'), wait=True)
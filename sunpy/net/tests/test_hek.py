@@ -5,10 +5,18 @@
 
 from __future__ import absolute_import
 
+import time
+import threading
+from datetime import datetime, timedelta
+
 import pytest
 
+import astropy.units as u
+from astropy.time import Time
+
 from sunpy.net import hek
 from sunpy.net import attr
+from sunpy.net.hek.hek import TIME_FORMAT
 
 
 @pytest.fixture
@@ -87,3 +95,175 @@ def test_err_dummyattr_create():
 def test_err_dummyattr_apply():
     with pytest.raises(TypeError):
         hek.attrs.walker.apply(attr.DummyAttr(), {})
+
+
+class StandInHEK(object):
+    """
+    Pages of events, one event per day, without connecting to the HEK.
+    Events on the last day of a time range are returned twice to check
+    that duplicates are removed.
+    """
+
+    def __init__(self, per_page=2, delay=0):
+        self.per_page = per_page
+        self.delay = delay
+        self.requests = []
+        self.lock = threading.Lock()
+
+    def fetch_page(self, data):
+        with self.lock:
+            self.requests.append(dict(data))
+        time.sleep(self.delay)
+        start = datetime.strptime(data['event_starttime'], TIME_FORMAT)
+        end = datetime.strptime(data['event_endtime'], TIME_FORMAT)
+        days = (end - start).days + 1
+        events = [{'kb_archivid': 'ivo://{}'.format((start + timedelta(days=i)).date()),
+                   'event_starttime': (start + timedelta(days=i)).strftime(TIME_FORMAT)}
+                  for i in range(days)]
+        first = (data['page'] - 1) * self.per_page
+        return {'result': events[first:first + self.per_page],
+                'overmax': first + self.per_page < len(events)}
+
+
+@pytest.fixture
+def stand_in_hek(monkeypatch):
+    stand_in = StandInHEK()
+    monkeypatch.setattr(hek.HEKClient, '_fetch_page',
+                        lambda client, data: stand_in.fetch_page(data))
+    return stand_in
+
+
+def test_search_windows(stand_in_hek):
+    client = hek.HEKClient()
+    res = client.search(hek.attrs.Time('2011/01/01', '2011/01/10'), hek.attrs.EventType('FL'),
+                        window=timedelta(days=3))
+    starts = sorted({r['event_starttime'] for r in stand_in_hek.requests})
+    assert starts == ['2011-01-01T00:00:00', '2011-01-04T00:00:00',
+                      '2011-01-07T00:00:00', '2011-01-10T00:00:00'][:len(starts)]
+    assert len(starts) >= 3
+    # Events at the edges of windows are only returned once, in time order.
+    assert [r['kb_archivid'] for r in res] == ['ivo://2011-01-{:02d}'.format(i)
+                                               for i in range(1, 11)]
+    assert all(isinstance(r, hek.hek.Response) for r in res)
+
+
+def test_search_window_quantity(stand_in_hek):
+    client = hek.HEKClient()
+    res = client.search(hek.attrs.Time('2011/01/01', '2011/01/10'), hek.attrs.EventType('FL'),
+                        window=5 * u.day)
+    assert len({r['event_starttime'] for r in stand_in_hek.requests}) == 2
+    assert len(res) == 10
+
+
+def test_search_no_window(stand_in_hek):
+    client = hek.HEKClient()
+    res = client.search(hek.attrs.Time('2011/01/01', '2011/01/10'), hek.attrs.EventType('FL'),
+                        window=None)
+    assert {r['page'] for r in stand_in_hek.requests} == {1, 2, 3, 4, 5}
+    assert len(res) == 10
+
+
+def test_search_default_no_window(stand_in_hek):
+    client = hek.HEKClient()
+    res = client.search(hek.attrs.Time('2011/01/01', '2011/03/01'), hek.attrs.EventType('FL'))
+    assert {r['event_starttime'] for r in stand_in_hek.requests} == {'2011-01-01T00:00:00'}
+    assert len(res) == 60
+
+
+def test_search_concurrent(monkeypatch):
+    stand_in = StandInHEK(per_page=100, delay=0.5)
+    monkeypatch.setattr(hek.HEKClient, '_fetch_page',
+                        lambda client, data: stand_in.fetch_page(data))
+    client = hek.HEKClient()
+    start = time.time()
+    res = client.search(hek.attrs.Time('2011/01/01', '2011/02/28'), hek.attrs.EventType('FL'),
+                        window=timedelta(days=10))
+    assert len(stand_in.requests) == 6
+    assert time.time() - start < 2
+    assert len(res) == 59
+
+
+def test_search_iter(stand_in_hek):
+    client = hek.HEKClient()
+    results = client.search_iter(hek.attrs.Time('2011/01/01', '2011/01/10'),
+                                 hek.attrs.EventType('FL'), window=None)
+    first = next(results)
+    assert isinstance(first, hek.hek.Response)
+    # Only the first page has been requested so far.
+    assert len(stand_in_hek.requests) == 1
+    results.close()
+    assert len(stand_in_hek.requests) == 1
+
+
+def test_search_iter_unique(stand_in_hek):
+    client = hek.HEKClient()
+    results = list(client.search_iter(hek.attrs.Time('2011/01/01', '2011/01/10'),
+                                      hek.attrs.EventType('FL'), window=timedelta(days=3)))
+    assert sorted(r['kb_archivid'] for r in results) == ['ivo://2011-01-{:02d}'.format(i)
+                                                         for i in range(1, 11)]
+
+
+def test_search_error(monkeypatch):
+    def fail(client, data):
+        raise IOError("HEK unreachable")
+    monkeypatch.setattr(hek.HEKClient, '_fetch_page', fail)
+    client = hek.HEKClient()
+    with pytest.raises(IOError):
+        client.search(hek.attrs.Time('2011/01/01', '2011/03/01'), hek.attrs.EventType('FL'))
+
+
+def test_merge_by_event_id():
+    client = hek.HEKClient()
+    merged = client._merge([[{'kb_archivid': 'a', 'frm_name': 'one'}],
+                            [{'kb_archivid': 'a', 'frm_name': 'two'},
+                             {'SOL_standard': 'SOL2011', 'frm_name': 'three'}],
+                            [{'SOL_standard': 'SOL2011'}, {'frm_name': 'four'}]])
+    assert [r['frm_name'] for r in merged] == ['one', 'three', 'four']
+
+
+def test_results_to_table():
+    results = [{'event_starttime': '2011-08-09T07:23:56', 'fl_peakflux': 1e-5,
+                'fl_goescls': 'M1.0', 'area_atdiskcenter': 3, 'ar_noaanum': 11263},
+               {'event_starttime': '2011-08-09T08:01:21', 'fl_peakflux': None,
+                'fl_goescls': 'X6.9', 'area_atdiskcenter': 2.5}]
+    table = hek.hek.results_to_table(results)
+    assert table.colnames == sorted(results[0])
+    assert isinstance(table['event_starttime'], Time)
+    assert table['event_starttime'][1] == Time('2011-08-09T08:01:21')
+    assert table['fl_peakflux'].dtype == float
+    assert table['fl_peakflux'].mask.tolist() == [False, True]
+    assert table['area_atdiskcenter'].dtype == float
+    assert table['ar_noaanum'].dtype.kind == 'i'
+    assert table['ar_noaanum'].mask.tolist() == [False, True]
+    assert table['fl_goescls'].tolist() == ['M1.0', 'X6.9']
+
+
+def test_results_to_table_columns():
+    results = [{'event_starttime': '2011-08-09T07:23:56', 'fl_goescls': 'M1.0',
+                'event_testflag': False, 'hrc_coord': {'x': 1}}]
+    table = hek.hek.results_to_table(results, ['fl_goescls', 'event_testflag', 'hrc_coord'])
+    assert table.colnames == ['fl_goescls', 'event_testflag', 'hrc_coord']
+    assert table['event_testflag'].dtype == bool
+    assert table['hrc_coord'][0] == {'x': 1}
+
+
+def test_search_table(stand_in_hek):
+    client = hek.HEKClient()
+    table = client.search(hek.attrs.Time('2011/01/01', '2011/01/10'), hek.attrs.EventType('FL'),
+                          window=timedelta(days=3), columns=['event_starttime'], table=True)
+    assert table.colnames == ['event_starttime']
+    assert len(table) == 10
+    assert isinstance(table['event_starttime'], Time)
+    assert all(r['return'] == 'event_starttime,kb_archivid,SOL_standard'
+               for r in stand_in_hek.requests)
+
+
+def test_search_columns(stand_in_hek):
+    client = hek.HEKClient()
+    res = client.search(hek.attrs.Time('2011/01/01', '2011/01/10'), hek.attrs.EventType('FL'),
+                        columns=['event_starttime'])
+    assert all(list(r) == ['event_starttime'] for r in res)
+    res = list(client.search_iter(hek.attrs.Time('2011/01/01', '2011/01/10'),
+                                  hek.attrs.EventType('FL'), columns=['event_starttime']))
+    assert len(res) == 10
+    assert all(list(r) == ['event_starttime'] for r in res)
@@ -77,3 +77,14 @@ def test_vso_attribute_parse():
 class TestH2VClient(object):
     """Tests the H2V class"""
     # TODO
+
+
+def test_translate_results_table():
+    table = hek.hek.results_to_table([{'event_starttime': '2011-08-09T07:22:38',
+                                       'event_endtime': '2011-08-09T08:32:02',
+                                       'obs_observatory': 'SDO', 'obs_instrument': 'AIA',
+                                       'obs_meanwavel': 211.0, 'obs_wavelunit': 'Angstrom'}])
+    queries = hek2vso.translate_results_to_query(table)
+    assert len(queries) == 1
+    assert queries[0][0] == vso.attrs.Time('2011/08/09 07:22:38', '2011/08/09 08:32:02')
+    assert queries[0][2] == vso.attrs.Instrument('AIA')
@@ -5,6 +5,7 @@
 
 from __future__ import absolute_import
 
+import time
 import tempfile
 import datetime
 
@@ -424,3 +425,75 @@ def test_vso_hmi(client, tmpdir):
         fileids = dri.fileiditem.fileid[0]
         series = list(map(lambda x: x.split(':')[0], fileids))
         assert all([s == series[0] for s in series])
+
+
+class StandInStruct(dict):
+    """
+    A stand-in for the SOAP objects of the VSO API, which creates missing
+    attributes on access.
+    """
+    def __getattr__(self, name):
+        return self[name]
+
+    def __setattr__(self, name, value):
+        self[name] = value
+
+    def __missing__(self, name):
+        value = self[name] = StandInStruct()
+        return value
+
+
+class StandInVSOAPI(object):
+    """
+    A stand-in for the VSO SOAP client which answers each block after a delay
+    with one record per instrument, and fails for the 'broken' instrument.
+    """
+    def __init__(self, delay=0.3):
+        self.delay = delay
+        self.factory = self
+        self.service = self
+        self.clones = 0
+
+    def create(self, atype):
+        return StandInStruct()
+
+    def clone(self):
+        self.clones += 1
+        return self
+
+    def Query(self, request):
+        time.sleep(self.delay)
+        instrument = request.block.instrument
+        if instrument == 'broken':
+            raise ConnectionError("no route to {}".format(instrument))
+        record = StandInStruct(fileid=instrument)
+        return StandInStruct(provideritem=[StandInStruct(
+            provider=instrument, record=StandInStruct(recorditem=[record]))])
+
+
+def test_search_blocks_concurrently():
+    api = StandInVSOAPI()
+    client = vso.VSOClient(api=api)
+    start = time.time()
+    res = client.search(va.Time('2010/1/1', '2010/1/2'),
+                        va.Instrument('eit') | va.Instrument('aia') | va.Instrument('lasco'))
+    assert time.time() - start < 0.8
+    assert sorted(record.fileid for record in res) == ['aia', 'eit', 'lasco']
+    assert api.clones == 3
+    assert res.errors == []
+
+
+def test_search_blocks_partial_results():
+    client = vso.VSOClient(api=StandInVSOAPI(delay=0), max_workers=1)
+    res = client.search(va.Time('2010/1/1', '2010/1/2'),
+                        va.Instrument('eit') | va.Instrument('broken'))
+    assert [record.fileid for record in res] == ['eit']
+    assert len(res.errors) == 1
+    assert isinstance(res.errors[0], ConnectionError)
+
+
+def test_search_blocks_timeout():
+    client = vso.VSOClient(api=StandInVSOAPI(delay=2), timeout=0.1)
+    res = client.search(va.Time('2010/1/1', '2010/1/2'), va.Instrument('eit'))
+    assert len(res) == 0
+    assert isinstance(res.errors[0], TimeoutError)
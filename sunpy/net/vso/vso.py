@@ -34,9 +34,11 @@ from sunpy.net import download
 from sunpy.net.proxyfix import WellBehavedHttpTransport
 from sunpy.util.net import get_filename, slugify
 from sunpy.net.attr import and_, Attr
+from sunpy.net.cache import cached_search
 from sunpy.net.vso import attrs
 from sunpy.net.vso.attrs import walker, TIMEFORMAT
 from sunpy.util import replacement_filename
+from sunpy.util.concurrency import run_concurrently
 from sunpy.time import parse_time
 
 from sunpy.util import deprecated
@@ -118,6 +120,10 @@ def get_online_vso_url(api, url, port):
                     mirror['url'], transport=mirror['transport']())
                 api.set_options(port=mirror['port'])
                 return api
+    elif api is None:
+        api = client.Client(url, transport=WellBehavedHttpTransport())
+        api.set_options(port=port)
+    return api
 
 
 # TODO: Python 3 this should subclass from UserList
@@ -276,15 +282,34 @@ class UnknownStatus(Exception):
 
 
 class VSOClient(object):
-
-    """ Main VSO Client. """
+    """
+    Main VSO Client.
+
+    Parameters
+    ----------
+    url : `str`, optional
+        The URL of the VSO WSDL.
+    port : `str`, optional
+        The port of the VSO service.
+    api : `suds.client.Client`, optional
+        An existing SOAP client for the VSO.
+    max_workers : `int`, optional
+        The maximum number of query blocks sent to the VSO at once by
+        `~sunpy.net.vso.VSOClient.search`. Defaults to sending all blocks of a
+        query at once.
+    timeout : `float`, optional
+        The number of seconds after which the query of a block is abandoned
+        and recorded as an error of the response.
+    """
     method_order = [
         'URL-TAR_GZ', 'URL-ZIP', 'URL-TAR', 'URL-FILE', 'URL-packaged'
     ]
 
-    def __init__(self, url=None, port=None, api=None):
+    def __init__(self, url=None, port=None, api=None, max_workers=None, timeout=None):
         api = get_online_vso_url(api, url, port)
         self.api = api
+        self.max_workers = max_workers
+        self.timeout = timeout
 
     def make(self, atype, **kwargs):
         """ Create new SOAP object with attributes specified in kwargs.
@@ -308,6 +333,13 @@ class VSOClient(object):
                 item[tip] = v
         return obj
 
+    def _query_cache_state(self):
+        """The VSO service searched, which is part of the query cache key."""
+        if self.api is None:
+            return None
+        return self.api.wsdl.url, self.api.options.port
+
+    @cached_search()
     def search(self, *query):
         """ Query data from the VSO with the new API. Takes a variable number
         of attributes as parameter, which are chained together using AND.
@@ -344,21 +376,32 @@ class VSOClient(object):
         """
         query = and_(*query)
 
-        responses = []
-        for block in walker.create(query, self.api):
-            try:
-                responses.append(
-                    self.api.service.Query(
-                        self.make('QueryRequest', block=block)
-                    )
-                )
-            except TypeNotFound:
-                pass
-            except Exception as ex:
-                response = QueryResponse.create(self.merge(responses))
-                response.add_error(ex)
+        requests = [self.make('QueryRequest', block=block)
+                    for block in walker.create(query, self.api)]
+        outcomes = run_concurrently([partial(self._query_block, request, len(requests) > 1)
+                                     for request in requests],
+                                    max_workers=self.max_workers, timeout=self.timeout)
 
-        return QueryResponse.create(self.merge(responses))
+        responses = []
+        errors = []
+        for result, error in outcomes:
+            if error is None:
+                responses.append(result)
+            elif not isinstance(error, TypeNotFound):
+                errors.append(error)
+
+        response = QueryResponse.create(self.merge(responses))
+        for error in errors:
+            response.add_error(error)
+        return response
+
+    def _query_block(self, request, clone=False):
+        """
+        Send the query request of one block to the VSO. Concurrent queries
+        each use their own clone of the SOAP client, which is not thread safe.
+        """
+        api = self.api.clone() if clone else self.api
+        return api.service.Query(request)
 
     @deprecated('0.8', alternative='VSOClient.search')
     def query(self, *query):
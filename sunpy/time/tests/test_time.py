@@ -186,6 +186,67 @@ def test_parse_time_ISO():
         assert parse_time(k) == v
 
 
+def test_parse_time_list_ISO():
+    lst = [
+        ('2007-05-04T21:08:12.999999', datetime(2007, 5, 4, 21, 8, 12, 999999)),
+        ('2007-05-04T21:08:12.999Z', datetime(2007, 5, 4, 21, 8, 12, 999000)),
+        ('2007-05-04T21:08:12.000', datetime(2007, 5, 4, 21, 8, 12)),
+        ('20070504T210812.999999', datetime(2007, 5, 4, 21, 8, 12, 999999)),
+        ('2007/05/04 21:08', datetime(2007, 5, 4, 21, 8)),
+        ('2007-May-04 21:08:12', datetime(2007, 5, 4, 21, 8, 12)),
+        ('04-May-2007', datetime(2007, 5, 4)),
+        ('2012:124:21:08:12', datetime(2012, 5, 3, 21, 8, 12)),
+        ('20140101000001', datetime(2014, 1, 1, 0, 0, 1)),
+        ('2007.05.04_21:08:12_TAI', datetime(2007, 5, 4, 21, 8, 12)),
+    ]
+    for k, v in lst:
+        dts = parse_time([k, k])
+        assert dts.dtype == np.dtype('M8[us]')
+        assert dts.tolist() == [v, v]
+
+
+def test_parse_time_list_mixed_formats():
+    dts = parse_time(['2007-05-04T21:08:12', '2007/05/04 21:08', '2010-10-10T24:00:00'])
+    assert dts.tolist() == [datetime(2007, 5, 4, 21, 8, 12), datetime(2007, 5, 4, 21, 8),
+                            datetime(2010, 10, 11)]
+
+
+def test_parse_time_string_array():
+    inputs = np.array([['2007-05-04T21:08:12', '2007-05-05T21:08:12'],
+                       ['2007-05-06T21:08:12', '2007-05-07T21:08:12']])
+    dts = parse_time(inputs)
+    assert dts.shape == (2, 2)
+    assert dts[1, 0] == np.datetime64('2007-05-06T21:08:12')
+    assert np.all(parse_time(inputs.astype(bytes)) == dts)
+    assert np.all(parse_time(inputs.astype(object)) == dts)
+
+
+def test_parse_time_empty_string_array():
+    dts = parse_time(np.array([], dtype=str))
+    assert dts.dtype == np.dtype('M8[us]')
+    assert dts.shape == (0,)
+
+
+def test_parse_time_pandas_series_strings():
+    dts = parse_time(pandas.Series(['2007-05-04', '2007-05-05']))
+    assert dts.tolist() == [datetime(2007, 5, 4), datetime(2007, 5, 5)]
+
+
+def test_parse_time_string_list_parse_format():
+    dts = parse_time(['01/06/2012', '02/06/2012'], _time_string_parse_format='%d/%m/%Y')
+    assert dts.tolist() == [datetime(2012, 6, 1), datetime(2012, 6, 2)]
+    with pytest.raises(ValueError):
+        parse_time(['01/06/2012', 'not a time'])
+
+
+def test_parse_time_last_format_first():
+    assert parse_time('2007.05.04_21:08:12_TAI') == datetime(2007, 5, 4, 21, 8, 12)
+    assert time.time._last_format == "%Y.%m.%d_%H:%M:%S_TAI"
+    # Other formats are still found after the last format.
+    assert parse_time('2007-05-04') == datetime(2007, 5, 4)
+    assert time.time._last_format == "%Y-%m-%d"
+
+
 def test_break_time():
     t = datetime(2007, 5, 4, 21, 8, 12)
     assert time.break_time(t) == '20070504_210812'
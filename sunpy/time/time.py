@@ -1,7 +1,7 @@
 from __future__ import absolute_import, division, print_function
 import re
 from datetime import datetime, date, time, timedelta
-from functools import singledispatch
+from functools import singledispatch, lru_cache
 
 import numpy as np
 import pandas
@@ -53,6 +53,10 @@ TIME_FORMAT_LIST = [
     "%Y.%m.%d_%H:%M:%S_TAI",   # Example 2016.05.04_21:08:12_TAI
 ]
 
+# The format of the last time string parsed with TIME_FORMAT_LIST, which is
+# tried first for the next one as time strings tend to come in runs.
+_last_format = None
+
 
 def _group_or_none(match, group, fun):
     try:
@@ -67,13 +71,19 @@ def _n_or_eq(a, b):
     return a is None or a == b
 
 
+@lru_cache(maxsize=None)
+def _format_regex(format):
+    """ The compiled regular expression matching a time format. """
+    for key, value in six.iteritems(REGEX):
+        format = format.replace(key, value)
+    return re.compile(format)
+
+
 def _regex_parse_time(inp, format):
     # Parser for finding out the minute value so we can adjust the string
     # from 24:00:00 to 00:00:00 the next day because strptime does not
     # understand the former.
-    for key, value in six.iteritems(REGEX):
-        format = format.replace(key, value)
-    match = re.match(format, inp)
+    match = _format_regex(format).match(inp)
     if match is None:
         return None, None
     try:
@@ -94,10 +104,7 @@ def _regex_parse_time(inp, format):
 def find_time(string, format):
     """ Return iterator of occurrences of date formatted with format
     in string. Currently supported format codes: """
-    re_format = format
-    for key, value in six.iteritems(REGEX):
-        re_format = re_format.replace(key, value)
-    matches = re.finditer(re_format, string)
+    matches = _format_regex(format).finditer(string)
     for match in matches:
         try:
             matchstr = string[slice(*match.span())]
@@ -148,9 +155,9 @@ def convert_time_pandasTimestamp(time_string, **kwargs):
 @convert_time.register(pandas.Series)
 def convert_time_pandasSeries(time_string, **kwargs):
     if 'datetime64' in str(time_string.dtype):
-        return np.array([dt.to_pydatetime() for dt in time_string])
+        return time_string.dt.to_pydatetime()
     else:
-        convert_time.dispatch(object)(time_string, **kwargs)
+        return convert_time_npndarray(time_string.values, **kwargs)
 
 
 @convert_time.register(pandas.DatetimeIndex)
@@ -187,11 +194,63 @@ def convert_time_npdatetime64(time_string, **kwargs):
 @convert_time.register(np.ndarray)
 def convert_time_npndarray(time_string, **kwargs):
     if 'datetime64' in str(time_string.dtype):
-        return np.array([_parse_dt64(dt) for dt in time_string])
+        # Microsecond precision converts to datetime objects
+        return time_string.astype('M8[us]').astype(object)
+    elif _is_string_array(time_string):
+        return _convert_time_strings(time_string, **kwargs)
     else:
         return convert_time.dispatch(object)(time_string, **kwargs)
 
 
+@convert_time.register(list)
+def convert_time_list(time_string, **kwargs):
+    if time_string and all(isinstance(t, str) for t in time_string):
+        return _convert_time_strings(np.array(time_string), **kwargs)
+    return convert_time.dispatch(object)(time_string, **kwargs)
+
+
+def _is_string_array(array):
+    if array.dtype.kind in 'US':
+        return True
+    return (array.dtype.kind == 'O' and array.size > 0 and
+            all(isinstance(t, str) for t in array.flat))
+
+
+def _convert_time_strings(time_strings, **kwargs):
+    """
+    Parse an array of time strings into a `numpy.datetime64` array.
+
+    The format is detected from the first string and the whole array is then
+    parsed at once with that format. Arrays which do not all follow the
+    format of their first string are parsed string by string.
+    """
+    time_strings = np.asarray(time_strings)
+    if time_strings.dtype.kind == 'S':
+        time_strings = np.char.decode(time_strings)
+    flat = time_strings.astype(str).ravel()
+    if not flat.size:
+        return np.empty(time_strings.shape, dtype='M8[us]')
+
+    first = flat[0]
+    time_format = _find_format(first)[0]
+    if time_format is None and '.' in first:
+        time_format = _find_format(first.rstrip("0").rstrip("."))[0]
+    if time_format is None:
+        time_format = kwargs.get('_time_string_parse_format')
+
+    if time_format is not None:
+        try:
+            parsed = pandas.to_datetime(flat, format=time_format, exact=True).values
+        except ValueError:
+            # e.g. 24:00:00 or times out of the range of pandas
+            pass
+        else:
+            return parsed.astype('M8[us]').reshape(time_strings.shape)
+
+    parsed = [convert_time_str(t, **dict(kwargs)) for t in flat]
+    return np.array(parsed, dtype='M8[us]').reshape(time_strings.shape)
+
+
 @convert_time.register(astropy.time.Time)
 def convert_time_astropy(time_string, **kwargs):
     return time_string.datetime
@@ -203,18 +262,9 @@ def convert_time_str(time_string, **kwargs):
     # number of zeros. This solves issue #289
     if '.' in time_string:
             time_string = time_string.rstrip("0").rstrip(".")
-    for time_format in TIME_FORMAT_LIST:
-        try:
-            try:
-                ts, time_delta = _regex_parse_time(time_string,
-                                                   time_format)
-            except TypeError:
-                break
-            if ts is None:
-                continue
-            return datetime.strptime(ts, time_format) + time_delta
-        except ValueError:
-            pass
+    time_format, dt = _find_format(time_string)
+    if time_format is not None:
+        return dt
     time_string_parse_format = kwargs.pop('_time_string_parse_format', None)
     if time_string_parse_format is not None:
         ts, time_delta = _regex_parse_time(time_string,
@@ -227,6 +277,34 @@ def convert_time_str(time_string, **kwargs):
     convert_time.dispatch(object)(time_string, **kwargs)
 
 
+def _find_format(time_string):
+    """
+    Find the format of `TIME_FORMAT_LIST` which parses a time string,
+    starting with the format of the last time string parsed.
+
+    Returns the format and the parsed time, or `None` twice if no format
+    matches.
+    """
+    global _last_format
+    last = _last_format
+    formats = TIME_FORMAT_LIST if last is None else [last] + TIME_FORMAT_LIST
+    for time_format in formats:
+        try:
+            try:
+                ts, time_delta = _regex_parse_time(time_string,
+                                                   time_format)
+            except TypeError:
+                break
+            if ts is None:
+                continue
+            dt = datetime.strptime(ts, time_format) + time_delta
+        except ValueError:
+            continue
+        _last_format = time_format
+        return time_format, dt
+    return None, None
+
+
 def parse_time(time_string, time_format='', **kwargs):
     """Given a time string will parse and return a datetime object.
     Similar to the anytim function in IDL.
@@ -235,14 +313,18 @@ def parse_time(time_string, time_format='', **kwargs):
     ----------
     time_string : [ int, float, time_string, datetime ]
         Date to parse which can be either time_string, int, datetime object.
+        Lists and arrays of time strings are parsed at once.
     time_format : [ basestring, utime, datetime ]
         Specifies the format user has provided the time_string in.
     Returns
     -------
     out : datetime
-        DateTime corresponding to input date string
+        DateTime corresponding to input date string, or a `numpy.datetime64`
+        array for a list or array of time strings.
     Note:
     If time_string is an instance of float, then it is assumed to be in utime format.
+    The format of a list or array of time strings is detected from its first
+    element, so parsing is fastest when all elements share that format.
     Examples
     --------
     >>> import sunpy.time
@@ -250,6 +332,9 @@ def parse_time(time_string, time_format='', **kwargs):
     datetime.datetime(2012, 8, 1, 0, 0)
     >>> sunpy.time.parse_time('2005-08-04T00:01:02.000Z')
     datetime.datetime(2005, 8, 4, 0, 1, 2)
+    >>> sunpy.time.parse_time(['2012/08/01 00:00', '2012/08/01 12:30'])
+    array(['2012-08-01T00:00:00.000000', '2012-08-01T12:30:00.000000'],
+          dtype='datetime64[us]')
     """
     if time_format == 'utime':
         return convert_time(float(time_string), **kwargs)
@@ -80,6 +80,21 @@ class TestTimeSeries(object):
         ts_from_glob = sunpy.timeseries.TimeSeries(os.path.join(filepath, "eve", "*"), source='EVE', concatenate=True)
         assert isinstance(ts_from_glob, sunpy.timeseries.sources.eve.EVESpWxTimeSeries)
 
+    def test_factory_parallel(self, mocker):
+        # Files parsed by their source
+        ts_list = sunpy.timeseries.TimeSeries(a_list_of_many, source='EVE')
+        parallel_list = sunpy.timeseries.TimeSeries(a_list_of_many, source='EVE', parallel=2)
+        assert ts_list == parallel_list
+
+        # Files read by sunpy.io
+        read_file = mocker.spy(sunpy.timeseries.timeseries_factory.TimeSeriesFactory, '_read_file')
+        sunpy.timeseries.TimeSeries(goes_filepath, lyra_filepath)
+        # Files read in the calling process go through the method
+        assert read_file.call_count == 2
+        ts_list = sunpy.timeseries.TimeSeries(goes_filepath, lyra_filepath, parallel=2)
+        assert isinstance(ts_list[0], sunpy.timeseries.sources.goes.XRSTimeSeries)
+        assert isinstance(ts_list[1], sunpy.timeseries.sources.lyra.LYRATimeSeries)
+
 #==============================================================================
 # Individual Implicit Source Tests
 #==============================================================================
@@ -3,7 +3,9 @@ from __future__ import absolute_import, division, print_function
 import warnings
 import os
 import glob
+import functools
 from collections import OrderedDict
+from concurrent.futures import Executor
 import copy
 
 import numpy as np
@@ -25,11 +27,13 @@ from sunpy.io.header import FileHeader
 from sunpy.util.net import download_file
 from sunpy.util import expand_list
 from sunpy.util.config import get_and_create_download_dir
+from sunpy.util.concurrency import parallel_map, _workers
 
 from sunpy.util.datatype_factory_base import BasicRegistrationFactory
 from sunpy.util.datatype_factory_base import NoMatchError
 from sunpy.util.datatype_factory_base import MultipleMatchError
 from sunpy.util.datatype_factory_base import ValidationFunctionError
+from sunpy.util.datatype_factory_base import header_signature
 from sunpy.extern import six
 
 from sunpy.extern.six.moves.urllib.request import urlopen
@@ -38,6 +42,11 @@ __authors__ = ["Alex Hamilton, Russell Hewett, Stuart Mumford"]
 
 __all__ = ['TimeSeries', 'TimeSeriesFactory']
 
+# The modules of the time series sources of sunpy, which only read the source
+# keyword and the dispatch keys
+_SOURCE_MODULES = frozenset('sunpy.timeseries.sources.' + name for name in (
+    'eve', 'fermi_gbm', 'goes', 'lyra', 'noaa', 'norh', 'rhessi'))
+
 
 class TimeSeriesFactory(BasicRegistrationFactory):
     """
@@ -111,6 +120,12 @@ class TimeSeriesFactory(BasicRegistrationFactory):
     ...                                             'file1.fits', url, 'eit_*.fits')  # doctest: +SKIP
     """
 
+    # The header keys which, together with the source keyword, identify the
+    # source of a time series. The time series type which matched a
+    # combination of their values is remembered, so that the matching for
+    # later time series from the same source is a single check.
+    dispatch_keys = ('INSTRUME', 'TELESCOP', 'DETECTOR', 'OBSRVTRY', 'ORIGIN')
+
     def _read_file(self, fname, **kwargs):
         """
         Test reading a file with sunpy.io for automatic source detection.
@@ -131,23 +146,13 @@ class TimeSeriesFactory(BasicRegistrationFactory):
         pairs : list or string
             List of (data, header) pairs if ``parsed`` is ``True`` or ``fname``
             if ``False``
+
+        Notes
+        -----
+        Files read in worker processes are read by the module function
+        `_read_file` instead.
         """
-        if 'source' not in kwargs.keys() or not kwargs['source']:
-            try:
-                pairs = read_file(fname, **kwargs)
-
-                new_pairs = []
-                for pair in pairs:
-                    filedata, filemeta = pair
-                    if isinstance(filemeta, FileHeader):
-                        data = filedata
-                        meta = MetaDict(filemeta)
-                        new_pairs.append(HDPair(data, meta))
-                return True, new_pairs
-            except UnrecognizedFileTypeError:
-                return False, fname
-        else:
-            return False, fname
+        return _read_file(fname, **kwargs)
 
     def _validate_meta(self, meta):
         """
@@ -233,7 +238,7 @@ class TimeSeriesFactory(BasicRegistrationFactory):
         df = pd.DataFrame(data=data, index=index)
         return df, MetaDict(table.meta), units
 
-    def _parse_args(self, *args, **kwargs):
+    def _parse_args(self, *args, parallel=None, **kwargs):
         """
         Parses an args list for data-header pairs.  args can contain any
         mixture of the following entries:
@@ -257,12 +262,16 @@ class TimeSeriesFactory(BasicRegistrationFactory):
                          'directory1',
                          '*.fits')
 
+        Files are read after all arguments have been parsed, in a pool of
+        workers if ``parallel`` is given, see `sunpy.util.concurrency.parallel_map`.
         """
 
         data_header_unit_tuples = list()
         data_header_pairs = list()
         already_timeseries = list()
         filepaths = list()
+        # The files to read with sunpy.io
+        files = list()
 
         # Take source kwarg if defined
         source = kwargs.get('source', None)
@@ -316,43 +325,19 @@ class TimeSeriesFactory(BasicRegistrationFactory):
                   os.path.isfile(os.path.expanduser(arg))):
 
                 path = os.path.expanduser(arg)
-
-                read, result = self._read_file(path, **kwargs)
-
-                if read:
-                    data_header_pairs.append(result)
-                else:
-                    filepaths.append(result)
+                files.append(path)
 
             # Directory
             elif (isinstance(arg, six.string_types) and
                   os.path.isdir(os.path.expanduser(arg))):
 
                 path = os.path.expanduser(arg)
-                files = [os.path.join(path, elem) for elem in os.listdir(path)]
-                for afile in files:
-                    # returns a boolean telling us if it were read and either a
-                    # tuple or the original filepath for reading by a source
-                    read, result = self._read_file(afile, **kwargs)
-                    if read:
-                        data_header_pairs.append(result)
-                    else:
-                        filepaths.append(result)
+                files += [os.path.join(path, elem) for elem in os.listdir(path)]
 
             # Glob
             elif (isinstance(arg, six.string_types) and '*' in arg):
 
-                files = glob.glob(os.path.expanduser(arg))
-
-                for afile in files:
-                    # data_header_unit_tuples += self._read_file(afile, **kwargs)
-                    # returns a boolean telling us if it were read and either a
-                    # tuple or the original filepath for reading by a source
-                    read, result = self._read_file(afile, **kwargs)
-                    if read:
-                        data_header_pairs.append(result)
-                    else:
-                        filepaths.append(result)
+                files += glob.glob(os.path.expanduser(arg))
 
             # Already a TimeSeries
             elif isinstance(arg, GenericTimeSeries):
@@ -372,6 +357,18 @@ class TimeSeriesFactory(BasicRegistrationFactory):
                 raise NoMatchError("File not found or invalid input")
             i += 1
 
+        # Each file read gives a boolean telling us if it were read and either
+        # a tuple or the original filepath for reading by a source
+        if parallel is None or (not isinstance(parallel, Executor) and _workers(parallel) == 1):
+            results = [self._read_file(fname, **kwargs) for fname in files]
+        else:
+            results = parallel_map(functools.partial(_read_file, **kwargs), files, parallel)
+        for read, result in results:
+            if read:
+                data_header_pairs.append(result)
+            else:
+                filepaths.append(result)
+
         # TODO:
         # In the end, if there are already TimeSeries it should be put in the
         # same order as the input, currently they are not.
@@ -392,6 +389,13 @@ class TimeSeriesFactory(BasicRegistrationFactory):
         silence_errors : `bool`, optional
             If set, ignore data-header pairs which cause an exception.
 
+        parallel : `int`, `bool` or `concurrent.futures.Executor`, optional
+            Read and parse files in this many worker processes, in as many
+            processes as there are CPUs if `True`, or in an executor. The time
+            series are returned in the same order as when the files are read
+            one after the other. Defaults to reading the files in the calling
+            process.
+
         Notes
         -----
         Extra keyword arguments are passed through to `sunpy.io.read_file` such
@@ -400,23 +404,29 @@ class TimeSeriesFactory(BasicRegistrationFactory):
 
         # Hack to get around Python 2.x not backporting PEP 3102.
         silence_errors = kwargs.pop('silence_errors', False)
+        parallel = kwargs.pop('parallel', None)
 
         (data_header_unit_tuples, data_header_pairs,
-         already_timeseries, filepaths) = self._parse_args(*args, **kwargs)
+         already_timeseries, filepaths) = self._parse_args(*args, parallel=parallel, **kwargs)
 
         new_timeseries = list()
 
-        # The filepaths for unreadable files
+        # The filepaths for unreadable files, which are parsed by the source
+        # class they match
+        matches = list()
         for filepath in filepaths:
             try:
-                new_ts = self._check_registered_widgets(filepath=filepath, **kwargs)
+                WidgetType = self._get_matching_widget(filepath=filepath, **kwargs)
             except (NoMatchError, MultipleMatchError, ValidationFunctionError):
                 if not silence_errors:
                     raise
-            except Exception:
-                raise
+                continue
 
-            new_timeseries.append(new_ts)
+            matches.append((WidgetType, filepath))
+
+        parsed = parallel_map(_parse_file, matches, parallel)
+        for (WidgetType, _), (data, meta, units) in zip(matches, parsed):
+            new_timeseries.append(WidgetType(data, meta, units, **kwargs))
 
         # data_header_pairs is a list of HDUs as read by sunpy.io
         # For each set of HDus find the matching class and read the
@@ -494,27 +504,20 @@ class TimeSeriesFactory(BasicRegistrationFactory):
         return new_timeseries
 
     def _get_matching_widget(self, **kwargs):
-        candidate_widget_types = list()
-
-        for key in self.registry:
-            # Call the registered validation function for each registered class
-            if self.registry[key](**kwargs):
-                candidate_widget_types.append(key)
+        return self._get_matching_widget_type(**kwargs)
 
-        n_matches = len(candidate_widget_types)
+    def _dispatch_signature(self, **kwargs):
+        # Files are matched on their name, which is not indexed
+        source = kwargs.get('source')
+        if kwargs.get('meta') is None or not isinstance(source, (str, type(None))):
+            return None
+        signature = header_signature(kwargs['meta'], self.dispatch_keys)
+        return None if signature is None else (source,) + signature
 
-        if n_matches == 0:
-            if self.default_widget_type is None:
-                raise NoMatchError("No types match specified arguments and no default is set.")
-            else:
-                candidate_widget_types = [self.default_widget_type]
-        elif n_matches > 1:
-            raise MultipleMatchError("Too many candidate types identified ({0})."
-                                     "Specify enough keywords to guarantee unique type "
-                                     "identification.".format(n_matches))
-
-        # Only one suitable source class is found
-        return candidate_widget_types[0]
+    def _validates_signature(self, WidgetType):
+        # Other time series types, including those defined in the tests of
+        # the sources, are validated for every time series.
+        return WidgetType.__module__ in _SOURCE_MODULES
 
     def _check_registered_widgets(self, **kwargs):
         """
@@ -539,6 +542,39 @@ class TimeSeriesFactory(BasicRegistrationFactory):
         return WidgetType(data, meta, units, **kwargs)
 
 
+def _read_file(fname, **kwargs):
+    """
+    Read a file with sunpy.io, see `TimeSeriesFactory._read_file`.
+
+    This is a function rather than a method so that files can be read in
+    worker processes.
+    """
+    if 'source' not in kwargs.keys() or not kwargs['source']:
+        try:
+            pairs = read_file(fname, **kwargs)
+
+            new_pairs = []
+            for pair in pairs:
+                filedata, filemeta = pair
+                if isinstance(filemeta, FileHeader):
+                    data = filedata
+                    meta = MetaDict(filemeta)
+                    new_pairs.append(HDPair(data, meta))
+            return True, new_pairs
+        except UnrecognizedFileTypeError:
+            return False, fname
+    else:
+        return False, fname
+
+
+def _parse_file(match):
+    """
+    The data, meta and units of a file parsed by its ``(source class, filepath)``.
+    """
+    WidgetType, filepath = match
+    return WidgetType._parse_file(filepath)
+
+
 def _is_url(arg):
     try:
         urlopen(arg)
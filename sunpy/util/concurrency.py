@@ -0,0 +1,230 @@
+"""
+Helpers for running blocking calls, such as requests to remote services,
+concurrently.
+"""
+from __future__ import absolute_import, division, print_function
+
+import os
+import time
+import threading
+from contextlib import contextmanager
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+
+__all__ = ['run_concurrently', 'call_with_timeout', 'parallel_map', 'worker_pool']
+
+
+def call_with_timeout(func, timeout=None):
+    """
+    Call a function, giving up on it after a timeout.
+
+    The function runs in a daemon thread, which is abandoned rather than
+    stopped if it does not finish in time.
+
+    Parameters
+    ----------
+    func : function
+        The function to call, without arguments.
+
+    timeout : `float`, optional
+        The number of seconds to wait for the function. If `None`, the
+        function is called in the calling thread.
+
+    Returns
+    -------
+    The return value of ``func``.
+
+    Raises
+    ------
+    TimeoutError
+        If the function does not return within ``timeout`` seconds.
+    """
+    if timeout is None:
+        return func()
+
+    outcome = {}
+
+    def target():
+        try:
+            outcome['result'] = func()
+        except BaseException as e:
+            outcome['error'] = e
+
+    thread = threading.Thread(target=target)
+    thread.daemon = True
+    thread.start()
+    thread.join(timeout)
+    if thread.is_alive():
+        raise TimeoutError("{0} did not finish within {1} seconds.".format(
+            getattr(func, '__name__', 'The call'), timeout))
+    if 'error' in outcome:
+        raise outcome['error']
+    return outcome['result']
+
+
+def run_concurrently(funcs, max_workers=None, timeout=None):
+    """
+    Call functions concurrently in a pool of threads and collect their
+    results and errors in order.
+
+    Parameters
+    ----------
+    funcs : iterable
+        The functions to call, without arguments.
+
+    max_workers : `int`, optional
+        The maximum number of functions running at once. Defaults to running
+        all of them at once.
+
+    timeout : `float`, optional
+        The number of seconds each function may run for, counted from when it
+        starts. Functions which take longer are abandoned and give a
+        `TimeoutError`.
+
+    Returns
+    -------
+    `list`
+        A ``(result, error)`` pair for each function, where ``error`` is the
+        exception raised by the function or `None`.
+
+    Notes
+    -----
+    Abandoned functions can not be stopped. They keep running in the
+    background and keep their thread until they return, so functions queued
+    behind them because of ``max_workers`` start late, and the interpreter
+    waits for them at exit.
+
+    Examples
+    --------
+    >>> from sunpy.util.concurrency import run_concurrently
+    >>> run_concurrently([lambda: 1, lambda: 1 / 0])
+    [(1, None), (None, ZeroDivisionError('division by zero'))]
+    """
+    funcs = list(funcs)
+    if not funcs:
+        return []
+
+    def call(func):
+        try:
+            return func(), None
+        except Exception as e:
+            return None, e
+
+    if timeout is None and (len(funcs) == 1 or max_workers == 1):
+        return [call(func) for func in funcs]
+
+    # When each function started, to time it out from then
+    started = [threading.Event() for _ in funcs]
+    start_times = [None] * len(funcs)
+
+    def task(index):
+        start_times[index] = time.monotonic()
+        started[index].set()
+        return call(funcs[index])
+
+    executor = ThreadPoolExecutor(max_workers=max_workers or len(funcs))
+    try:
+        futures = [executor.submit(task, index) for index in range(len(funcs))]
+        outcomes = []
+        for index, future in enumerate(futures):
+            if timeout is not None:
+                started[index].wait()
+                remaining = start_times[index] + timeout - time.monotonic()
+                try:
+                    future.result(timeout=max(remaining, 0))
+                except FutureTimeoutError:
+                    outcomes.append((None, TimeoutError(
+                        "{0} did not finish within {1} seconds.".format(
+                            getattr(funcs[index], '__name__', 'The call'), timeout))))
+                    continue
+            outcomes.append(future.result())
+    finally:
+        # Functions which timed out are not waited for
+        executor.shutdown(wait=False)
+    return outcomes
+
+
+def parallel_map(func, items, parallel=None):
+    """
+    Call a function on each of some items, optionally in a pool of worker
+    processes, and return the results in order.
+
+    Parameters
+    ----------
+    func : function
+        The function to call with each item. To be called in worker
+        processes, the function, the items and the results must be picklable,
+        e.g. the function must be defined at the top level of a module.
+
+    items : iterable
+        The items to call the function with.
+
+    parallel : `int`, `bool` or `concurrent.futures.Executor`, optional
+        The number of worker processes, `True` for as many worker processes
+        as there are CPUs, or an executor to call the function in, e.g. a
+        `~concurrent.futures.ThreadPoolExecutor` for functions which release
+        the GIL. By default the function is called in the calling thread.
+
+    Returns
+    -------
+    `list`
+        The result of the function for each item.
+
+    Examples
+    --------
+    >>> from sunpy.util.concurrency import parallel_map
+    >>> parallel_map(abs, [-1, 2, -3], parallel=2)
+    [1, 2, 3]
+    """
+    items = list(items)
+    if isinstance(parallel, Executor):
+        return list(parallel.map(func, items))
+
+    workers = _workers(parallel)
+    if workers == 1 or len(items) < 2:
+        return [func(item) for item in items]
+    with ProcessPoolExecutor(max_workers=min(workers, len(items))) as executor:
+        return list(executor.map(func, items))
+
+
+@contextmanager
+def worker_pool(parallel=None):
+    """
+    Start a pool of worker processes to call `parallel_map` with many times,
+    rather than starting a pool for each call.
+
+    Parameters
+    ----------
+    parallel : `int`, `bool` or `concurrent.futures.Executor`, optional
+        The number of worker processes, `True` for as many worker processes
+        as there are CPUs, or an executor, as taken by `parallel_map`.
+
+    Yields
+    ------
+    `concurrent.futures.Executor` or `None`
+        The pool of worker processes, which is shut down afterwards, the
+        executor if ``parallel`` is one, or `None` if functions are to be
+        called in the calling thread. Either can be passed to `parallel_map`.
+
+    Examples
+    --------
+    >>> from sunpy.util.concurrency import parallel_map, worker_pool
+    >>> with worker_pool(2) as pool:
+    ...     parallel_map(abs, [-1, 2], pool), parallel_map(abs, [-3], pool)
+    ([1, 2], [3])
+    """
+    if parallel is None or isinstance(parallel, Executor):
+        yield parallel
+    elif _workers(parallel) == 1:
+        yield None
+    else:
+        with ProcessPoolExecutor(max_workers=_workers(parallel)) as executor:
+            yield executor
+
+
+def _workers(parallel):
+    """The number of worker processes asked for by ``parallel``."""
+    workers = (os.cpu_count() or 1) if parallel is True else (parallel or 1)
+    if workers < 1:
+        raise ValueError("The number of workers must be at least one.")
+    return workers
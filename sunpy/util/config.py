@@ -37,7 +37,8 @@ def load_config():
     # Use absolute filepaths and adjust OS-dependent paths as needed
     filepaths = [
         ('downloads', 'download_dir'),
-        ('downloads', 'sample_dir')
+        ('downloads', 'sample_dir'),
+        ('downloads', 'cache_dir')
     ]
     _fix_filepaths(config, filepaths)
 
@@ -66,6 +67,17 @@ def get_and_create_sample_dir():
     return config.get('downloads', 'sample_dir')
 
 
+def get_and_create_cache_dir():
+    '''
+    Get the config of cache directory and create one if not present.
+    '''
+    config = load_config()
+    if not os.path.isdir(config.get('downloads', 'cache_dir')):
+        os.makedirs(config.get('downloads', 'cache_dir'))
+
+    return config.get('downloads', 'cache_dir')
+
+
 def print_config():
     """Print current configuration options"""
     print("FILES USED:")
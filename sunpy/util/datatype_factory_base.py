@@ -2,6 +2,8 @@ from __future__ import absolute_import, division, print_function
 
 import inspect
 
+from sunpy.util.metadata import MetaDict
+
 
 class BasicRegistrationFactory(object):
     """
@@ -39,6 +41,17 @@ class BasicRegistrationFactory(object):
     * A valid validation function must be a classmethod of the registered widget
       and it must return True or False.
 
+    * Factories which override `_dispatch_signature` remember which widget
+      type matched each signature. For later arguments with the same
+      signature they call the validation function of that type, and of the
+      types for which `_validates_signature` is False, as those may accept
+      arguments with any signature. `_validates_signature` must only be True
+      for types whose validation functions read nothing but the signature,
+      or remembered types could hide a `MultipleMatchError`. The full set of
+      validation functions is called for unseen signatures, for arguments
+      which are not accepted by the remembered type or are accepted by
+      another type, and whenever the registry changes.
+
     """
 
     def __init__(self, default_widget_type=None,
@@ -54,6 +67,13 @@ class BasicRegistrationFactory(object):
         self.validation_functions = (['_factory_validation_function'] +
                                      additional_validation_functions)
 
+        # The widget type which matched each dispatch signature, valid for as
+        # long as the registry equals the copy recorded alongside it, and the
+        # types which have to be validated for every signature.
+        self._dispatch_index = dict()
+        self._indexed_registry = None
+        self._unindexed_types = []
+
     def __call__(self, *args, **kwargs):
         """ Method for running the factory.
 
@@ -68,6 +88,59 @@ class BasicRegistrationFactory(object):
     def _check_registered_widget(self, *args, **kwargs):
         """ Implementation of a basic check to see if arguments match a widget."""
 
+        WidgetType = self._get_matching_widget_type(*args, **kwargs)
+
+        return WidgetType(*args, **kwargs)
+
+    def _dispatch_signature(self, *args, **kwargs):
+        """
+        A hashable summary of the arguments which determines the widget type
+        they match, or `None` if matches for the arguments are not indexed.
+
+        Subclasses override this to index the matching of their arguments,
+        see the notes of the class.
+        """
+        return None
+
+    def _validates_signature(self, WidgetType):
+        """
+        Whether the validation function of a widget type only reads the parts
+        of the arguments which make up their dispatch signature, so that it
+        accepts either all or none of the arguments with the same signature.
+
+        Types are assumed not to, subclasses override this for the types
+        they know.
+        """
+        return False
+
+    def _get_matching_widget_type(self, *args, **kwargs):
+        """
+        The registered widget type whose validation function accepts the
+        arguments, or the default widget type if there is none.
+
+        Raises
+        ------
+        NoMatchError
+            If no type matches and there is no default type.
+
+        MultipleMatchError
+            If more than one type matches.
+        """
+        signature = self._dispatch_signature(*args, **kwargs)
+        if signature is not None:
+            if self._indexed_registry != self.registry:
+                self._dispatch_index.clear()
+                self._indexed_registry = dict(self.registry)
+                self._unindexed_types = [key for key in self.registry
+                                         if not self._validates_signature(key)]
+            WidgetType = self._dispatch_index.get(signature)
+            if (WidgetType in self.registry and
+                    self.registry[WidgetType](*args, **kwargs) and
+                    not any(self.registry[key](*args, **kwargs)
+                            for key in self._unindexed_types
+                            if key is not WidgetType and key in self.registry)):
+                return WidgetType
+
         candidate_widget_types = list()
 
         for key in self.registry:
@@ -81,8 +154,9 @@ class BasicRegistrationFactory(object):
         if n_matches == 0:
             if self.default_widget_type is None:
                 raise NoMatchError("No types match specified arguments and no default is set.")
-            else:
-                candidate_widget_types = [self.default_widget_type]
+            # The default is not indexed, as the validation functions are the
+            # only way to tell whether the arguments still match no type.
+            return self.default_widget_type
         elif n_matches > 1:
             raise MultipleMatchError("Too many candidate types identified ({0})."
                                      "Specify enough keywords to guarantee unique type "
@@ -90,8 +164,10 @@ class BasicRegistrationFactory(object):
 
         # Only one is found
         WidgetType = candidate_widget_types[0]
+        if signature is not None:
+            self._dispatch_index[signature] = WidgetType
 
-        return WidgetType(*args, **kwargs)
+        return WidgetType
 
     def register(self, WidgetType, validation_function=None, is_default=False):
         """ Register a widget with the factory.
@@ -114,6 +190,8 @@ class BasicRegistrationFactory(object):
             Sets WidgetType to be the default widget.
 
         """
+        self._indexed_registry = None
+
         if is_default:
             self.default_widget_type = WidgetType
 
@@ -146,9 +224,42 @@ class BasicRegistrationFactory(object):
 
     def unregister(self, WidgetType):
         """ Remove a widget from the factory's registry."""
+        self._indexed_registry = None
         self.registry.pop(WidgetType)
 
 
+def header_signature(header, keys):
+    """
+    The values of some keys of a header, for use as a dispatch signature.
+
+    Unless the header is a case insensitive `~sunpy.util.metadata.MetaDict`,
+    each key is looked up both in upper and in lower case, so that the
+    signature tells apart headers which validation functions looking up
+    either spelling would tell apart.
+
+    Parameters
+    ----------
+    header : `dict`-like
+        The header.
+
+    keys : `tuple` of `str`
+        The upper case names of the keys.
+
+    Returns
+    -------
+    `tuple` or `None`
+        The values of the keys, or `None` if any of them is not hashable.
+    """
+    signature = tuple([header.get(key) for key in keys])
+    if not isinstance(header, MetaDict):
+        signature += tuple([header.get(key.lower()) for key in keys])
+    try:
+        hash(signature)
+    except TypeError:
+        return None
+    return signature
+
+
 class NoMatchError(Exception):
     """Exception for when no candidate class is found."""
 
@@ -0,0 +1,107 @@
+import math
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import pytest
+
+from sunpy.util.concurrency import call_with_timeout, parallel_map, run_concurrently, worker_pool
+
+
+def slow(value, delay=0.3):
+    def func():
+        time.sleep(delay)
+        return value
+    return func
+
+
+def fail():
+    raise ValueError("failed")
+
+
+def test_call_with_timeout():
+    assert call_with_timeout(slow(1, 0.01), timeout=1) == 1
+    assert call_with_timeout(slow(2, 0)) == 2
+    with pytest.raises(ValueError):
+        call_with_timeout(fail, timeout=1)
+    with pytest.raises(TimeoutError):
+        call_with_timeout(slow(3, 1), timeout=0.05)
+
+
+def test_run_concurrently_order_and_errors():
+    outcomes = run_concurrently([slow(1, 0.2), fail, slow(3, 0.01)])
+    assert outcomes[0] == (1, None)
+    assert outcomes[1][0] is None
+    assert isinstance(outcomes[1][1], ValueError)
+    assert outcomes[2] == (3, None)
+    assert run_concurrently([]) == []
+
+
+def test_run_concurrently_is_concurrent():
+    start = time.time()
+    outcomes = run_concurrently([slow(i) for i in range(4)])
+    assert time.time() - start < 0.9
+    assert [result for result, _ in outcomes] == [0, 1, 2, 3]
+
+
+def test_run_concurrently_max_workers():
+    start = time.time()
+    run_concurrently([slow(i, 0.2) for i in range(4)], max_workers=2)
+    assert time.time() - start >= 0.4
+
+
+def test_run_concurrently_timeout():
+    start = time.time()
+    outcomes = run_concurrently([slow(1, 2), slow(2, 0.01)], max_workers=2, timeout=0.1)
+    assert time.time() - start < 1.5
+    assert isinstance(outcomes[0][1], TimeoutError)
+    assert outcomes[1] == (2, None)
+
+
+def test_run_concurrently_timeout_max_workers():
+    running = []
+
+    def counted():
+        running.append(1)
+        time.sleep(0.2)
+        concurrent = len(running)
+        running.pop()
+        return concurrent
+
+    # Abandoned functions still count towards max_workers, and the timeout
+    # of the others counts from when they start
+    outcomes = run_concurrently([counted] * 3, max_workers=1, timeout=0.1)
+    assert all(isinstance(error, TimeoutError) for _, error in outcomes)
+    time.sleep(0.3)
+    outcomes = run_concurrently([counted] * 3, max_workers=2, timeout=1)
+    assert max(result for result, _ in outcomes) <= 2
+
+
+@pytest.mark.parametrize('parallel', [None, 1, 2, True])
+def test_parallel_map(parallel):
+    assert parallel_map(abs, range(-5, 0), parallel=parallel) == [5, 4, 3, 2, 1]
+
+
+def test_parallel_map_executor():
+    with ThreadPoolExecutor(2) as executor:
+        assert parallel_map(abs, [-1, -2], parallel=executor) == [1, 2]
+
+
+def test_parallel_map_errors():
+    # Errors in the workers are raised in the calling process
+    with pytest.raises(ValueError):
+        parallel_map(math.sqrt, [-1, -2], parallel=2)
+    with pytest.raises(ValueError):
+        parallel_map(abs, [-1, -2], parallel=-1)
+
+
+def test_worker_pool():
+    with worker_pool(2) as pool:
+        assert isinstance(pool, ProcessPoolExecutor)
+        assert parallel_map(abs, [-1, -2], pool) == [1, 2]
+        assert parallel_map(abs, [-3], pool) == [3]
+    for parallel in [None, False, 1]:
+        with worker_pool(parallel) as pool:
+            assert pool is None
+    with ThreadPoolExecutor(2) as executor:
+        with worker_pool(executor) as pool:
+            assert pool is executor
@@ -151,3 +151,77 @@ class TestBasicRegistrationFactory(object):
 
         with pytest.raises(ValidationFunctionError):
             ExtraValidationFactory.register(MissingClassMethodDifferentValidationWidget)
+
+    def test_indexed_dispatch(self):
+        calls = []
+
+        class CountingWidget(BaseWidget):
+            @classmethod
+            def _factory_validation_function(cls, *args, **kwargs):
+                calls.append(cls)
+                return kwargs.get('style') == 'counting'
+
+        class IndexedFactory(BasicRegistrationFactory):
+            def _dispatch_signature(self, *args, **kwargs):
+                return kwargs.get('style')
+
+            def _validates_signature(self, WidgetType):
+                return True
+
+        factory = IndexedFactory()
+        factory.register(DefaultWidget, is_default=True)
+        factory.register(StandardWidget)
+        factory.register(CountingWidget)
+
+        assert type(factory(style='counting')) is CountingWidget
+        assert type(factory(style='standard')) is StandardWidget
+        del calls[:]
+        # Only the remembered type is validated for a known signature
+        assert type(factory(style='counting')) is CountingWidget
+        assert calls == [CountingWidget]
+        assert type(factory(style='standard')) is StandardWidget
+        assert calls == [CountingWidget]
+
+        # A change to the registry forgets the remembered types
+        factory.unregister(StandardWidget)
+        assert type(factory(style='standard')) is DefaultWidget
+        factory.registry[StandardWidget] = StandardWidget._factory_validation_function
+        assert type(factory(style='standard')) is StandardWidget
+
+    def test_indexed_dispatch_revalidates(self):
+        class IndexedFactory(BasicRegistrationFactory):
+            def _dispatch_signature(self, *args, **kwargs):
+                return 'same for all'
+
+        factory = IndexedFactory()
+        factory.register(DefaultWidget, is_default=True)
+        factory.register(StandardWidget)
+        factory.register(FancyWidget)
+
+        assert type(factory(style='standard')) is StandardWidget
+        # The remembered type does not accept these, so all types are checked
+        assert type(factory(style='fancy', feature='present')) is FancyWidget
+        assert type(factory(style='plain')) is DefaultWidget
+
+    def test_indexed_dispatch_multiple_match(self):
+        class FeatureWidget(BaseWidget):
+            @classmethod
+            def _factory_validation_function(cls, *args, **kwargs):
+                return 'feature' in kwargs
+
+        class IndexedFactory(BasicRegistrationFactory):
+            def _dispatch_signature(self, *args, **kwargs):
+                return kwargs.get('style')
+
+            def _validates_signature(self, WidgetType):
+                return WidgetType is StandardWidget
+
+        factory = IndexedFactory()
+        factory.register(StandardWidget)
+        factory.register(FeatureWidget)
+
+        assert type(factory(style='standard')) is StandardWidget
+        # FeatureWidget reads more than the signature, so it is validated for
+        # the remembered signature too
+        with pytest.raises(MultipleMatchError):
+            factory(style='standard', feature='present')
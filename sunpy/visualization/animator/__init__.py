@@ -1,4 +1,5 @@
 from sunpy.visualization.animator.base import *
+from sunpy.visualization.animator.framebuffer import *
 from sunpy.visualization.animator.line import *
 from sunpy.visualization.animator.image import *
 from sunpy.visualization.animator.mapcube import *
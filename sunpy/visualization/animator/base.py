@@ -163,6 +163,27 @@ class BaseFuncAnimator:
 
         return ani
 
+    def save_movie(self, filename, **kwargs):
+        """
+        Write all frames of a prerendered animator straight to a movie file,
+        without redrawing them with matplotlib.
+
+        This requires the animator to have been created with
+        ``prerender=True``. Only the image is written, axes, annotations and
+        other artists on the figure are not included.
+
+        Parameters
+        ----------
+        filename: str
+            The movie file to write
+
+        Extra keywords are passed to `~sunpy.visualization.animator.write_movie`.
+        """
+        if getattr(self, 'frame_buffer', None) is None:
+            raise ValueError("Writing movies directly requires an animator "
+                             "created with prerender=True.")
+        self.frame_buffer.save(filename, **kwargs)
+
     def plot_start_image(self, ax):
         """
         This method creates the initial image on the mpl axes
@@ -186,6 +207,22 @@ class BaseFuncAnimator:
     def _connect_fig_events(self):
         self.fig.canvas.mpl_connect('button_press_event', self._mouse_click)
         self.fig.canvas.mpl_connect('key_press_event', self._key_press)
+        self.fig.canvas.mpl_connect('close_event', self._close_frame_buffer)
+
+    def _close_frame_buffer(self, event=None, wait=True):
+        """
+        Stop the worker threads and discard the frames of the buffer of
+        prerendered frames, if there is one. Frames are then drawn from the
+        data.
+        """
+        frame_buffer = getattr(self, 'frame_buffer', None)
+        if frame_buffer is not None:
+            self.frame_buffer = None
+            frame_buffer.close(wait=wait)
+
+    def __del__(self):
+        # Collection may happen in a worker thread, which can not wait for itself
+        self._close_frame_buffer(wait=False)
 
     def _add_colorbar(self, im):
         self.colorbar = plt.colorbar(im, self.cax)
@@ -0,0 +1,211 @@
+# -*- coding: utf-8 -*-
+"""
+Rendering of animation frames into RGBA arrays ahead of time.
+"""
+import itertools
+import subprocess
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from sunpy.cm import apply_colormap
+
+__all__ = ['FrameBuffer', 'render_frame', 'write_movie']
+
+
+def render_frame(data, cmap=None, norm=None):
+    """
+    Normalize and colormap a 2D image into an RGBA array, using the lookup
+    tables of `~sunpy.cm.apply_colormap`.
+
+    Parameters
+    ----------
+    data : `numpy.ndarray`
+        The image to render.
+
+    cmap : `matplotlib.colors.Colormap` or `str`, optional
+        The colormap to apply. Defaults to the matplotlib default colormap.
+
+    norm : `matplotlib.colors.Normalize`, optional
+        The normalization to apply. A copy of the norm is autoscaled to the
+        data if its limits are not set. Defaults to a linear normalization
+        between the minimum and maximum of the data.
+
+    Returns
+    -------
+    `numpy.ndarray`
+        A ``(ny, nx, 4)`` array of `numpy.uint8` RGBA values.
+    """
+    return apply_colormap(data, cmap, norm)
+
+
+class FrameBuffer:
+    """
+    A bounded ring buffer of RGBA frames which are rendered ahead of time by
+    a pool of background workers.
+
+    When a frame is requested, the following ``buffer_size`` frames are
+    queued for rendering, so that stepping through the frames in order only
+    ever waits for frames which are not yet finished. Frames which fall out of
+    this window are discarded.
+
+    Parameters
+    ----------
+    render : function
+        A function which takes a frame index and returns the RGBA array of
+        that frame, e.g. by calling `~sunpy.visualization.animator.render_frame`.
+
+    n_frames : `int`
+        The number of frames.
+
+    buffer_size : `int`, optional
+        The maximum number of rendered frames held in memory. Defaults to 16.
+
+    max_workers : `int`, optional
+        The number of worker threads used to render the frames. Defaults to
+        the default of `concurrent.futures.ThreadPoolExecutor`.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from sunpy.visualization.animator import FrameBuffer, render_frame
+    >>> data = np.random.random((10, 32, 32))
+    >>> frames = FrameBuffer(lambda i: render_frame(data[i], 'gray'), len(data))
+    >>> frames[0].shape
+    (32, 32, 4)
+    >>> frames.close()
+    """
+
+    def __init__(self, render, n_frames, buffer_size=16, max_workers=None):
+        if buffer_size < 1:
+            raise ValueError("buffer_size must be at least 1.")
+        self.render = render
+        self.n_frames = n_frames
+        self.buffer_size = buffer_size
+        self._executor = ThreadPoolExecutor(max_workers=max_workers)
+        self._frames = OrderedDict()
+
+    def __len__(self):
+        return self.n_frames
+
+    def __getitem__(self, index):
+        index = int(index)
+        if index < 0:
+            index += self.n_frames
+        if not 0 <= index < self.n_frames:
+            raise IndexError("Frame index {0} out of range.".format(index))
+        self._schedule(index, wrap=True)
+        return self._frames[index].result()
+
+    def __iter__(self):
+        for index in range(self.n_frames):
+            self._schedule(index, wrap=False)
+            yield self._frames[index].result()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def _schedule(self, index, wrap):
+        """
+        Queue the frames following ``index`` for rendering and drop all
+        other frames from the buffer.
+        """
+        wanted = range(index, index + min(self.buffer_size, self.n_frames))
+        if wrap:
+            wanted = [i % self.n_frames for i in wanted]
+        else:
+            wanted = [i for i in wanted if i < self.n_frames]
+
+        keep = set(wanted)
+        for key in [key for key in self._frames if key not in keep]:
+            self._frames.pop(key).cancel()
+        for key in wanted:
+            if key not in self._frames:
+                self._frames[key] = self._executor.submit(self.render, key)
+
+    def close(self, wait=True):
+        """
+        Discard all buffered frames and stop the worker threads.
+
+        Parameters
+        ----------
+        wait : `bool`, optional
+            Whether to wait for frames which are being rendered to finish.
+        """
+        for future in self._frames.values():
+            future.cancel()
+        self._frames.clear()
+        self._executor.shutdown(wait=wait)
+
+    def save(self, filename, **kwargs):
+        """
+        Write all frames to a movie file.
+
+        Extra keywords are passed to `~sunpy.visualization.animator.write_movie`.
+        """
+        write_movie(self, filename, **kwargs)
+
+
+def write_movie(frames, filename, fps=10, codec='libx264', pix_fmt='yuv420p',
+                ffmpeg_path='ffmpeg', extra_args=None):
+    """
+    Write RGBA frames straight to a movie file with ffmpeg, without drawing
+    them with matplotlib.
+
+    Parameters
+    ----------
+    frames : iterable
+        An iterable of ``(ny, nx, 4)`` `numpy.uint8` RGBA arrays, with the
+        first row of each array at the bottom of the image. All frames must
+        have the same shape.
+
+    filename : `str`
+        The movie file to write.
+
+    fps : `float`, optional
+        The frame rate of the movie. Defaults to 10.
+
+    codec : `str`, optional
+        The ffmpeg video codec. Defaults to ``'libx264'``.
+
+    pix_fmt : `str`, optional
+        The pixel format of the movie. Defaults to ``'yuv420p'``, which
+        requires the frame dimensions to be even.
+
+    ffmpeg_path : `str`, optional
+        The ffmpeg executable. Defaults to ``'ffmpeg'``.
+
+    extra_args : `list`, optional
+        Extra command line arguments passed to ffmpeg before the output file.
+    """
+    frames = iter(frames)
+    first = next(frames)
+    ny, nx = first.shape[:2]
+
+    command = [ffmpeg_path, '-y', '-loglevel', 'error',
+               '-f', 'rawvideo', '-pix_fmt', 'rgba', '-s', '{0}x{1}'.format(nx, ny),
+               '-r', str(fps), '-i', '-',
+               '-vcodec', codec, '-pix_fmt', pix_fmt]
+    command += list(extra_args or []) + [filename]
+
+    process = subprocess.Popen(command, stdin=subprocess.PIPE,
+                               stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+    try:
+        for frame in itertools.chain([first], frames):
+            if frame.shape[:2] != (ny, nx):
+                raise ValueError("All frames must have the same shape.")
+            # Frames have their origin at the bottom, video is stored top down.
+            process.stdin.write(np.ascontiguousarray(frame[::-1]).tobytes())
+    except BrokenPipeError:
+        # ffmpeg exited early, the error is reported from its return code below.
+        pass
+    finally:
+        _, stderr = process.communicate()
+
+    if process.returncode:
+        raise RuntimeError("ffmpeg failed with exit code {0}: {1}".format(
+            process.returncode, stderr.decode(errors='replace')))
@@ -3,6 +3,7 @@ import matplotlib as mpl
 import astropy.wcs
 
 from . base import ArrayAnimator
+from . framebuffer import FrameBuffer, render_frame
 
 __all__ = ['ImageAnimator', 'ImageAnimatorWCS']
 
@@ -55,11 +56,26 @@ class ImageAnimator(ArrayAnimator):
     button_func: list
         List of functions to map to the buttons
 
+    prerender: bool
+        Normalize and colormap the frames ahead of time in background worker
+        threads, using the colormap and normalization of the first frame, so
+        that each frame update only has to display a ready RGBA buffer. This
+        also allows writing movies with `save_movie`. Frames are rendered
+        ahead along the last slider axis. Not supported when the image axes
+        are given as arrays of values.
+
+    buffer_size: int
+        The number of prerendered frames to hold in memory.
+
+    max_workers: int
+        The number of worker threads used to prerender frames.
+
     Extra keywords are passed to imshow.
 
     """
 
-    def __init__(self, data, image_axes=[-2, -1], axis_ranges=None, **kwargs):
+    def __init__(self, data, image_axes=[-2, -1], axis_ranges=None, prerender=False,
+                 buffer_size=16, max_workers=None, **kwargs):
         # Check that number of axes is 2.
         if len(image_axes) != 2:
             raise ValueError("There can only be two spatial axes")
@@ -74,6 +90,31 @@ class ImageAnimator(ArrayAnimator):
         super(ImageAnimator, self).__init__(data, image_axes=image_axes,
                                             axis_ranges=axis_ranges, **kwargs)
 
+        self.frame_buffer = None
+        if prerender:
+            if self._non_regular_plot_axis:
+                raise ValueError("Prerendering is not supported for image axes "
+                                 "given as arrays of values.")
+            self._slider_shape = [data.shape[i] for i in self.slider_axes]
+            self.frame_buffer = FrameBuffer(self._render_frame,
+                                            int(np.prod(self._slider_shape)),
+                                            buffer_size=buffer_size, max_workers=max_workers)
+
+    def _render_frame(self, ind):
+        """Render a frame, given its flattened slider index, to RGBA."""
+        frame_slice = list(self.frame_slice)
+        for ax_ind, i in zip(self.slider_axes, np.unravel_index(ind, self._slider_shape)):
+            frame_slice[ax_ind] = i
+        return render_frame(self.data[tuple(frame_slice)], self.im.cmap, self.im.norm)
+
+    def _get_frame(self):
+        """The data, or the prerendered RGBA buffer, of the current frame."""
+        if getattr(self, 'frame_buffer', None) is not None:
+            ind = np.ravel_multi_index([self.frame_slice[i] for i in self.slider_axes],
+                                       self._slider_shape)
+            return self.frame_buffer[ind]
+        return self.data[self.frame_index]
+
     def plot_start_image(self, ax):
         """Sets up plot of initial image."""
         # Create extent arg
@@ -137,7 +178,7 @@ class ImageAnimator(ArrayAnimator):
                 im.set_data(self.axis_ranges[self.image_axes[0]],
                             self.axis_ranges[self.image_axes[1]], data)
             else:
-                im.set_array(self.data[self.frame_index])
+                im.set_array(self._get_frame())
             slider.cval = val
 
 
@@ -254,5 +295,5 @@ class ImageAnimatorWCS(ImageAnimator):
         if val != slider.cval:
             self.axes.reset_wcs(wcs=self.wcs, slices=self.slices_wcsaxes)
             self._set_unit_in_axis(self.axes)
-            im.set_array(self.data[self.frame_index])
+            im.set_array(self._get_frame())
             slider.cval = val
@@ -3,6 +3,7 @@
 from copy import deepcopy
 
 from sunpy.visualization import animator as imageanimator
+from sunpy.visualization.animator.framebuffer import FrameBuffer, render_frame
 from sunpy.visualization.wcsaxes_compat import _FORCE_NO_WCSAXES
 from sunpy.visualization import wcsaxes_compat, axis_labels_from_ctype
 
@@ -45,15 +46,31 @@ class MapSequenceAnimator(imageanimator.BaseFuncAnimator):
         Any objects returned from this function will have their `remove()` method
         called at the start of the next frame to clear them from the plot.
 
+    prerender : `bool`
+        Normalize and colormap the frames ahead of time in background worker
+        threads, so that each frame update only has to display a ready RGBA
+        buffer. This also allows writing movies with `save_movie`.
+
+    buffer_size : `int`
+        The number of prerendered frames to hold in memory.
+
+    max_workers : `int`
+        The number of worker threads used to prerender frames.
+
     Notes
     -----
     Extra keywords are passed to `mapsequence[0].plot()` i.e. the `plot()` routine of
     the maps in the sequence.
     """
 
-    def __init__(self, mapsequence, annotate=True, **kwargs):
+    def __init__(self, mapsequence, annotate=True, prerender=False, buffer_size=16,
+                 max_workers=None, **kwargs):
 
         self.mapsequence = mapsequence
+        self.frame_buffer = None
+        if prerender:
+            self.frame_buffer = FrameBuffer(self._render_frame, len(mapsequence.maps),
+                                            buffer_size=buffer_size, max_workers=max_workers)
         self.annotate = annotate
         self.user_plot_function = kwargs.pop('plot_function',
                                              lambda fig, ax, smap: [])
@@ -75,13 +92,16 @@ class MapSequenceAnimator(imageanimator.BaseFuncAnimator):
             self.remove_obj.pop(0).remove()
 
         i = int(val)
-        im.set_array(self.data[i].data)
-        im.set_cmap(self.mapsequence[i].plot_settings['cmap'])
+        if self.frame_buffer is not None:
+            im.set_data(self.frame_buffer[i])
+        else:
+            im.set_array(self.data[i].data)
+            im.set_cmap(self.mapsequence[i].plot_settings['cmap'])
 
-        norm = deepcopy(self.mapsequence[i].plot_settings['norm'])
-        # The following explicit call is for bugged versions of Astropy's ImageNormalize
-        norm.autoscale_None(self.data[i].data)
-        im.set_norm(norm)
+            norm = deepcopy(self.mapsequence[i].plot_settings['norm'])
+            # The following explicit call is for bugged versions of Astropy's ImageNormalize
+            norm.autoscale_None(self.data[i].data)
+            im.set_norm(norm)
 
         if wcsaxes_compat.is_wcsaxes(im.axes):
             im.axes.reset_wcs(self.mapsequence[i].wcs)
@@ -99,6 +119,13 @@ class MapSequenceAnimator(imageanimator.BaseFuncAnimator):
         self.remove_obj += list(
             self.user_plot_function(self.fig, self.axes, self.mapsequence[i]))
 
+    def _render_frame(self, ind):
+        """
+        Render a map of the sequence to RGBA with its plot settings.
+        """
+        amap = self.mapsequence[ind]
+        return render_frame(amap.data, amap.plot_settings['cmap'], amap.plot_settings['norm'])
+
     def _annotate_plot(self, ind):
         """
         Annotate the image.
@@ -0,0 +1,148 @@
+# -*- coding: utf-8 -*-
+import gc
+import os
+import shutil
+
+import pytest
+
+import numpy as np
+import matplotlib.pyplot as plt
+import matplotlib.colors as mcolors
+
+import sunpy.map
+import sunpy.data.test
+from sunpy.visualization.animator import (FrameBuffer, ImageAnimator, MapSequenceAnimator,
+                                          render_frame, write_movie)
+
+
+@pytest.fixture
+def data():
+    return np.random.RandomState(0).random_sample((5, 10, 12))
+
+
+@pytest.fixture
+def mapsequence():
+    aia_file = os.path.join(sunpy.data.test.rootdir, "aia_171_level1.fits")
+    aia_map = sunpy.map.Map(aia_file)
+    return sunpy.map.Map([aia_map, aia_map], sequence=True)
+
+
+def test_render_frame(data):
+    rgba = render_frame(data[0], 'viridis', mcolors.Normalize(vmin=0, vmax=1))
+    assert rgba.shape == (10, 12, 4)
+    assert rgba.dtype == np.uint8
+    expected = plt.get_cmap('viridis')(data[0], bytes=True)
+    np.testing.assert_array_equal(rgba, expected)
+
+
+def test_render_frame_autoscale(data):
+    norm = mcolors.Normalize()
+    rgba = render_frame(data[0], 'gray', norm)
+    # The norm passed in is not modified
+    assert norm.vmin is None
+    assert rgba[..., 0].min() == 0
+    assert rgba[..., 0].max() == 255
+
+
+def test_framebuffer(data):
+    rendered = []
+
+    def render(i):
+        rendered.append(i)
+        return render_frame(data[i])
+
+    with FrameBuffer(render, len(data), buffer_size=2) as frames:
+        assert len(frames) == 5
+        np.testing.assert_array_equal(frames[3], render_frame(data[3]))
+        assert set(frames._frames) == {3, 4}
+        # The window wraps around when playing in a loop
+        frames[4]
+        assert set(frames._frames) == {4, 0}
+        np.testing.assert_array_equal(frames[-1], render_frame(data[4]))
+        with pytest.raises(IndexError):
+            frames[5]
+        assert len(list(frames)) == 5
+    assert sorted(set(rendered)) == [0, 1, 2, 3, 4]
+
+
+def test_framebuffer_buffer_size():
+    with pytest.raises(ValueError):
+        FrameBuffer(render_frame, 1, buffer_size=0)
+
+
+def test_write_movie_bad_ffmpeg(data, tmpdir):
+    frames = [render_frame(frame) for frame in data]
+    with pytest.raises(OSError):
+        write_movie(frames, str(tmpdir.join('movie.mp4')),
+                    ffmpeg_path=str(tmpdir.join('not_ffmpeg')))
+
+
+@pytest.mark.skipif(os.name != 'posix', reason="Requires a POSIX shell")
+def test_write_movie_stream(data, tmpdir):
+    # A stand-in for ffmpeg which writes the raw video stream to the output file
+    fake_ffmpeg = tmpdir.join('ffmpeg')
+    fake_ffmpeg.write('#!/bin/sh\nfor last; do :; done\ncat > "$last"\n')
+    fake_ffmpeg.chmod(0o755)
+    frames = [render_frame(frame) for frame in data]
+    filename = str(tmpdir.join('movie.raw'))
+    write_movie(frames, filename, ffmpeg_path=str(fake_ffmpeg))
+    stream = np.fromfile(filename, dtype=np.uint8).reshape(5, 10, 12, 4)
+    # Frames are written top down
+    np.testing.assert_array_equal(stream[2], frames[2][::-1])
+
+
+@pytest.mark.skipif(shutil.which('ffmpeg') is None, reason="ffmpeg is not installed")
+def test_write_movie(tmpdir):
+    frames = [render_frame(frame) for frame in np.random.random((5, 10, 12))]
+    filename = str(tmpdir.join('movie.mp4'))
+    write_movie(frames, filename)
+    assert os.path.getsize(filename) > 0
+
+
+def test_image_animator_prerender(data):
+    animator = ImageAnimator(data, prerender=True, buffer_size=2)
+    animator.sliders[0]._slider.set_val(2)
+    np.testing.assert_array_equal(animator.im.get_array(),
+                                  render_frame(data[2], animator.im.cmap, animator.im.norm))
+    animator.frame_buffer.close()
+
+
+def test_image_animator_prerender_non_regular(data):
+    with pytest.raises(ValueError):
+        ImageAnimator(data, axis_ranges=[None, np.arange(10), np.arange(12)], prerender=True)
+
+
+def test_mapsequence_animator_prerender(mapsequence):
+    animator = MapSequenceAnimator(mapsequence, prerender=True)
+    animator.sliders[0]._slider.set_val(1)
+    amap = mapsequence[1]
+    np.testing.assert_array_equal(animator.im.get_array(),
+                                  render_frame(amap.data, amap.plot_settings['cmap'],
+                                               amap.plot_settings['norm']))
+    animator.frame_buffer.close()
+
+
+def test_animator_closes_frame_buffer(data, mapsequence):
+    for animator in [ImageAnimator(data, prerender=True), MapSequenceAnimator(mapsequence,
+                                                                              prerender=True)]:
+        frame_buffer = animator.frame_buffer
+        animator.fig.canvas.close_event()
+        assert animator.frame_buffer is None
+        assert frame_buffer._executor._shutdown
+        plt.close(animator.fig)
+
+
+def test_save_movie_requires_prerender(mapsequence):
+    animator = MapSequenceAnimator(mapsequence)
+    with pytest.raises(ValueError):
+        animator.save_movie('movie.mp4')
+
+
+def test_deleted_animator_closes_frame_buffer(data):
+    animator = ImageAnimator(data, prerender=True)
+    # The frame buffer refers to the animator, the executor does not
+    executor = animator.frame_buffer._executor
+    plt.close(animator.fig)
+    del animator
+    gc.collect()
+    assert executor._shutdown
@@ -0,0 +1,195 @@
+# -*- coding: utf-8 -*-
+"""
+Headless rendering of maps to image files or raw video streams.
+"""
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import matplotlib.image as mimage
+
+from sunpy.cm import apply_colormap
+
+__all__ = ['export_frames', 'render_map']
+
+
+def render_map(amap, cmap=None, norm=None, annotate=True):
+    """
+    Render a map to an RGBA array using its plot settings, without creating
+    a matplotlib figure.
+
+    Parameters
+    ----------
+    amap : `~sunpy.map.GenericMap` or `str`
+        The map, or the name of a file to read the map from.
+
+    cmap : `matplotlib.colors.Colormap` or `str`, optional
+        The colormap to use instead of the one in the plot settings of the map.
+
+    norm : `matplotlib.colors.Normalize`, optional
+        The normalization to use instead of the one in the plot settings of
+        the map. A copy of the norm is autoscaled to the data if its limits
+        are not set.
+
+    annotate : `bool`, optional
+        Draw the name of the map in the top left corner of the image.
+
+    Returns
+    -------
+    `numpy.ndarray`
+        A ``(ny, nx, 4)`` array of `numpy.uint8` RGBA values, with the first
+        row at the bottom of the image.
+    """
+    if isinstance(amap, str):
+        # Imported here as sunpy.map imports sunpy.visualization
+        from sunpy.map import Map
+        amap = Map(amap)
+
+    cmap = amap.plot_settings['cmap'] if cmap is None else cmap
+    norm = amap.plot_settings['norm'] if norm is None else norm
+    data = amap.data if amap.mask is None else np.ma.array(np.asarray(amap.data), mask=amap.mask)
+
+    rgba = apply_colormap(data, cmap, norm)
+    if annotate:
+        _overlay_text(rgba, amap.name)
+    return rgba
+
+
+def export_frames(maps, filename=None, stream=None, cmap=None, norm=None, annotate=True,
+                  max_workers=None):
+    """
+    Render a sequence of maps to image files or a raw video stream.
+
+    Each map is colormapped and normalized with its plot settings using the
+    lookup tables of `~sunpy.cm.apply_colormap` and annotated with a text
+    overlay, without going through the matplotlib figure machinery. The frames
+    are rendered in parallel by a pool of worker processes.
+
+    Parameters
+    ----------
+    maps : `~sunpy.map.MapSequence` or iterable
+        The maps to render. Items can also be file names, in which case the
+        maps are only read by the worker processes.
+
+    filename : `str`, optional
+        A format string for the names of the image files to write, which is
+        formatted with the frame number as ``index``, e.g.
+        ``'frames/aia_{index:05d}.png'``. The file type is inferred from the
+        extension.
+
+    stream : file-like, optional
+        A binary file-like object to write the frames to, in order, as raw
+        top-down RGBA video. This can be piped into ffmpeg with
+        ``-f rawvideo -pix_fmt rgba -s <nx>x<ny> -i -``.
+
+    cmap : `matplotlib.colors.Colormap` or `str`, optional
+        The colormap to use for all frames instead of the plot settings of
+        the maps.
+
+    norm : `matplotlib.colors.Normalize`, optional
+        The normalization to use for all frames instead of the plot settings
+        of the maps.
+
+    annotate : `bool`, optional
+        Draw the name of each map in the top left corner of the frame.
+
+    max_workers : `int`, optional
+        The number of worker processes. Defaults to the number of CPUs. If
+        ``1``, the frames are rendered in the calling process.
+
+    Returns
+    -------
+    `list`
+        The names of the files written, or an empty list when writing to a
+        stream.
+
+    Examples
+    --------
+    >>> import sunpy.map
+    >>> from sunpy.visualization.export import export_frames
+    >>> sequence = sunpy.map.Map('aia_*.fits', sequence=True)   # doctest: +SKIP
+    >>> export_frames(sequence, 'frames/aia_{index:05d}.png')   # doctest: +SKIP
+    """
+    if (filename is None) == (stream is None):
+        raise ValueError("Exactly one of filename or stream must be given.")
+
+    maps = getattr(maps, 'maps', maps)
+    if filename is not None:
+        jobs = [(amap, cmap, norm, annotate, filename.format(index=i))
+                for i, amap in enumerate(maps)]
+    else:
+        jobs = [(amap, cmap, norm, annotate, None) for amap in maps]
+
+    if max_workers == 1:
+        results = map(_export_frame, jobs)
+        return _write_results(results, stream)
+
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        # Keep at most a couple of frames per worker in flight, so that a slow
+        # stream does not make finished frames pile up in memory.
+        window = 2 * (max_workers or os.cpu_count() or 1)
+        results = _ordered_results(executor, _export_frame, jobs, window)
+        return _write_results(results, stream)
+
+
+def _export_frame(job):
+    """Render a single frame and either save it or return its raw bytes."""
+    amap, cmap, norm, annotate, filename = job
+    rgba = render_map(amap, cmap=cmap, norm=norm, annotate=annotate)
+    if filename is None:
+        return np.ascontiguousarray(rgba[::-1]).tobytes()
+    mimage.imsave(filename, rgba, origin='lower')
+    return filename
+
+
+def _write_results(results, stream):
+    """Consume the rendered frames in order."""
+    if stream is None:
+        return list(results)
+    for frame in results:
+        stream.write(frame)
+    return []
+
+
+def _ordered_results(executor, func, items, window):
+    """
+    Yield ``func(item)`` for each item in order, with at most ``window``
+    items submitted to the executor at once.
+    """
+    pending = deque()
+    for item in items:
+        pending.append(executor.submit(func, item))
+        if len(pending) >= window:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
+
+
+def _overlay_text(rgba, text):
+    """
+    Draw white text into the top left corner of an RGBA image in place.
+    """
+    # Imported here to keep the Agg machinery out of the import of this module
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+
+    ny, nx = rgba.shape[:2]
+    dpi = 100
+    fig = Figure(figsize=(nx / dpi, ny / dpi), dpi=dpi)
+    canvas = FigureCanvasAgg(fig)
+    fig.patch.set_alpha(0)
+    fontsize = max(ny / 40., 6.) * 72 / dpi
+    fig.text(0.01, 0.99, text, color='white', fontsize=fontsize, ha='left', va='top')
+    canvas.draw()
+    # The canvas is top down, the image has its origin at the bottom.
+    overlay = np.asarray(canvas.buffer_rgba())[::-1]
+
+    rows, cols = np.nonzero(overlay[..., 3])
+    if not rows.size:
+        return rgba
+    box = (slice(rows.min(), rows.max() + 1), slice(cols.min(), cols.max() + 1))
+    alpha = overlay[box + (slice(3, 4),)] / 255.
+    blended = overlay[box + (slice(0, 3),)] * alpha + rgba[box + (slice(0, 3),)] * (1 - alpha)
+    rgba[box + (slice(0, 3),)] = np.round(blended).astype(np.uint8)
+    return rgba
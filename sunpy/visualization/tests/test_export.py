@@ -0,0 +1,67 @@
+# -*- coding: utf-8 -*-
+import io
+import os
+
+import pytest
+
+import numpy as np
+import matplotlib.colors as mcolors
+import matplotlib.image as mimage
+
+import sunpy.map
+import sunpy.data.test
+from sunpy.visualization.export import export_frames, render_map
+
+AIA_FILE = os.path.join(sunpy.data.test.rootdir, "aia_171_level1.fits")
+
+
+@pytest.fixture
+def aia_map():
+    return sunpy.map.Map(AIA_FILE)
+
+
+def test_render_map(aia_map):
+    rgba = render_map(aia_map, annotate=False)
+    assert rgba.shape == aia_map.data.shape + (4,)
+    assert rgba.dtype == np.uint8
+
+    norm = mcolors.Normalize(vmin=aia_map.min(), vmax=aia_map.max())
+    rgba = render_map(aia_map, cmap='gray', norm=norm, annotate=False)
+    expected = (norm(aia_map.data) * 255).astype(np.uint8)
+    np.testing.assert_allclose(rgba[..., 0], expected, atol=1)
+
+
+def test_render_map_annotate(aia_map):
+    plain = render_map(aia_map, annotate=False)
+    annotated = render_map(aia_map)
+    # The text is drawn at the top of the image only
+    assert not np.array_equal(plain[-30:], annotated[-30:])
+    np.testing.assert_array_equal(plain[:50], annotated[:50])
+
+
+def test_render_map_from_file(aia_map):
+    np.testing.assert_array_equal(render_map(AIA_FILE), render_map(aia_map))
+
+
+def test_export_frames_png(aia_map, tmpdir):
+    pattern = str(tmpdir.join('frame_{index:03d}.png'))
+    files = export_frames([aia_map, AIA_FILE], filename=pattern, max_workers=1)
+    assert files == [pattern.format(index=0), pattern.format(index=1)]
+    image = mimage.imread(files[0])
+    assert image.shape[:2] == aia_map.data.shape
+
+
+def test_export_frames_stream(aia_map):
+    stream = io.BytesIO()
+    sequence = sunpy.map.Map([aia_map, aia_map], sequence=True)
+    export_frames(sequence, stream=stream, annotate=False, max_workers=2)
+    ny, nx = aia_map.data.shape
+    frames = np.frombuffer(stream.getvalue(), dtype=np.uint8).reshape(2, ny, nx, 4)
+    np.testing.assert_array_equal(frames[1], render_map(aia_map, annotate=False)[::-1])
+
+
+def test_export_frames_arguments(aia_map):
+    with pytest.raises(ValueError):
+        export_frames([aia_map])
+    with pytest.raises(ValueError):
+        export_frames([aia_map], filename='frame.png', stream=io.BytesIO())
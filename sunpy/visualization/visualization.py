@@ -1,5 +1,5 @@
 # -*- coding: utf-8 -*-
-from matplotlib import pyplot
+import functools
 
 
 def toggle_pylab(fn):
@@ -24,15 +24,18 @@ def toggle_pylab(fn):
         improve documentation
     """
 
-    if pyplot.isinteractive():
-        def fn_itoggle(*args, **kwargs):
-            pyplot.ioff()
-            ret = fn(*args, **kwargs)
-            pyplot.ion()
-            return ret
-        return fn_itoggle
-    else:
-        return fn
+    @functools.wraps(fn)
+    def fn_itoggle(*args, **kwargs):
+        # pyplot is imported on the first call, rather than when the
+        # decorated function is defined.
+        from matplotlib import pyplot
+        if not pyplot.isinteractive():
+            return fn(*args, **kwargs)
+        pyplot.ioff()
+        ret = fn(*args, **kwargs)
+        pyplot.ion()
+        return ret
+    return fn_itoggle
 
 
 def axis_labels_from_ctype(ctype, unit):
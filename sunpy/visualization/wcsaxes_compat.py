@@ -1,16 +1,14 @@
 # -*- coding: utf-8 -*-
 """
 Helpers and Functions to make WCSAxes work in SunPy
+
+Matplotlib and WCSAxes are imported when the helpers are first used, so that
+importing this module does not import them.
 """
-import matplotlib.pyplot as plt
+import sys
 
 import astropy.units as u
 
-try:
-    from astropy.visualization import wcsaxes
-except ImportError:
-    raise ImportError("Astropy >= 1.3 is required to use SunPy")
-
 #  Force is put here to enable disabling all checks in this module. It should
 #  only be used by tests and other such hacks.
 _FORCE_NO_WCSAXES = False
@@ -34,7 +32,9 @@ def is_wcsaxes(axes):
     """
 
     if not _FORCE_NO_WCSAXES:
-        return isinstance(axes, wcsaxes.WCSAxes)
+        # If WCSAxes has not been imported, there can not be WCSAxes axes.
+        wcsaxes = sys.modules.get('astropy.visualization.wcsaxes')
+        return wcsaxes is not None and isinstance(axes, wcsaxes.WCSAxes)
     else:
         return False
 
@@ -62,6 +62,7 @@ def gca_wcs(wcs, fig=None, slices=None):
         object. The current axes, or a new one if created.
 
     """
+    import matplotlib.pyplot as plt
 
     if not fig:
         fig = plt.gcf()
@@ -129,7 +130,7 @@ def default_wcs_ticks(axes, units, ctypes):
     Set the ticks and axes type on a solar WCSAxes plot.
     """
 
-    if not isinstance(axes, wcsaxes.WCSAxes):
+    if not is_wcsaxes(axes):
         raise TypeError("This axes is not a WCSAxes")
 
     x = axes.coords[0]